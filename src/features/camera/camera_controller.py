@@ -200,6 +200,7 @@ class CameraController(QObject):
                 self.worker.frame_ready.connect(self.view.update_frame)
 
             self.worker.error_occurred.connect(self._on_video_error)
+            self.worker.camera_mode.connect(self._on_camera_mode)
 
             # Notificar que se ha creado un nuevo worker
             self.worker_created.emit(self.worker)
@@ -286,6 +287,21 @@ class CameraController(QObject):
             f"Error de video: {message}", NotificationType.TOAST_ERROR)
         self.stop_video()
 
+    def _on_camera_mode(self, mode: dict):
+        """
+        Avisa si la cámara no aceptó la resolución configurada.
+
+        Args:
+            mode (dict): Modo negociado (`CameraConnection.get_mode`).
+        """
+        requested = mode.get("requested", {})
+        if (mode["width"], mode["height"]) == (requested.get("width"), requested.get("height")):
+            return
+        self.noti_manager.notify(
+            f"La cámara entrega {mode['width']}x{mode['height']} a {mode['fps']:.0f} FPS "
+            f"({mode['fourcc']}); se solicitó {requested.get('width')}x{requested.get('height')}",
+            NotificationType.TOAST_WARNING)
+
     def _set_camera_connection_status(self, text: str):
         """
         Actualiza el label de estado de la cámara en el widget padre.
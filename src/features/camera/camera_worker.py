@@ -12,13 +12,22 @@ Conexiones:
     - Emite resultados de detección mediante señales locales (`charuco_detected`)
       que el controlador puentea hacia el bus global.
     - Reporta frames procesados mediante `frame_ready` para la UI.
+    - Un `FrameGrabber` captura en su propio hilo sobre las ranuras de un
+      `FramePool`; el worker procesa siempre el frame más reciente y presta
+      la ranura en solo lectura a las tareas de visión. `frame_ready`
+      siempre entrega una copia propia del `DetectionDrawer`.
+    - Reporta el modo negociado con la cámara mediante `camera_mode`.
+    - Con `SphereTracker` (camera.json `tracker`) la detección de esferas
+      busca solo en ventanas alrededor de la posición predicha de cada
+      esfera, con búsqueda completa periódica o tras perder un track.
+    - Con `BoardPoseCache` (camera.json `board_lock`) la pose del tablero
+      se bloquea tras varias detecciones estables y solo se verifica.
 """
 
 from threading import Lock
 import numpy as np
-import cv2
 from PyQt6.QtCore import QThread, pyqtSignal, QThreadPool, pyqtSlot
-from src.services.vision import ChArUcoDetection, CircleDetection, CameraConnection, PoseEstimation, DetectionDrawer
+from src.services.vision import ChArUcoDetection, CircleDetection, CameraConnection, PoseEstimation, DetectionDrawer, FramePool, SphereTracker, BoardPoseCache, FrameGrabber
 from src.services.data.timers import FrameCounter
 
 
@@ -39,6 +48,8 @@ class CameraWorker(QThread):
     sphere_ready = pyqtSignal(dict)
     # (frame_id, data) -> bus via controller
     charuco_detected = pyqtSignal(int, object)
+    # Modo negociado con la cámara (CameraConnection.get_mode)
+    camera_mode = pyqtSignal(dict)
 
     def __init__(self, camera_index: int = 0, camera_config: dict = None, is_calibration: bool = False,
                  search_state: tuple = (False, False), view_state: tuple = (False, False)):
@@ -74,6 +85,11 @@ class CameraWorker(QThread):
             "resolution", {"width": 1280, "height": 720}).values())[:2]
 
         self.thread_pool = QThreadPool().globalInstance()
+        # Grabber (escritura + último frame), worker y una ranura por tarea
+        self.frame_pool = FramePool(
+            (self.frame_size[1], self.frame_size[0], 3),
+            slots=self.thread_pool.maxThreadCount() + 4)
+        self.grabber = None
         self.camera = CameraConnection(
             camera_index, self.camera_config, is_calibration)
 
@@ -87,6 +103,17 @@ class CameraWorker(QThread):
         self.pick_place_active = False
         self.latest_circles = {}
 
+        tracker_config = self.camera_config.get("tracker", {})
+        self.sphere_tracker = SphereTracker(
+            refresh_frames=tracker_config.get("refresh_frames", 10),
+            window_scale=tracker_config.get("window_scale", 2.5)
+        ) if tracker_config.get("enabled", True) else None
+
+        lock_config = self.camera_config.get("board_lock", {})
+        self.board_pose_cache = BoardPoseCache(
+            stable_frames=lock_config.get("stable_frames", 5)
+        ) if lock_config.get("enabled", True) else None
+
     def run(self):
         """
         Bucle de ejecución principal del hilo.
@@ -94,51 +121,102 @@ class CameraWorker(QThread):
         Captura frames continuamente y decide que tareas de visión despachar
         basándose en el estado del sistema y la cadencia de `FrameCounter`.
         """
+        grabber = None
         try:
             if not self.camera.camera_on():
                 raise IOError(
                     "No se pudo inicializar la cámara, verifique la conexión de la cámara.")
-            while self._running:
-                frame = self.camera.take_frame()
-                if frame is None:
-                    raise IOError(
-                        "No fue posible obtener el frame de video, verifique la conexión de la cámara.")
-
-                frame_umat = cv2.UMat(frame.copy())
-
-                if self.thread_pool.activeThreadCount() >= self.thread_pool.maxThreadCount():
-                    continue
+            self._apply_camera_mode(self.camera.get_mode())
 
-                if self.is_calibration:
-                    self._emit_frame_ready(frame)
+            # En calibración el frame se emite tal cual a la UI: sin pool
+            grabber = FrameGrabber(
+                self.camera, None if self.is_calibration else self.frame_pool)
+            self.grabber = grabber
+            grabber.start()
+            while self._running:
+                taken = grabber.take(timeout=0.5)
+                if taken is None:
                     continue
-                elif self._process_frame:
-                    with self.lock:
-                        charuco_state, circle_state = self._search_state
-                    self.frame_id += 1
-                    if charuco_state:
-                        self.thread_pool.start(ChArUcoDetection(
-                            frame_umat, self.frame_id, self.camera_matrix, self.dist_coeff,
-                            self.on_charuco_done, self._emit_error))
-                    if circle_state:
-                        self.thread_pool.start(CircleDetection(
-                            frame_umat, self.frame_id, self.last_roi, self.hsv_colors,
-                            self.on_circles_done, self._emit_error))
-
-                    self._process_frame = False
-
-                view = self.draw_view_state()
-                self.thread_pool.start(DetectionDrawer(
-                    frame, self.results.get(
-                        self.frame_id-1, {}), view, self.custom_origin,
-                    self.frame_size[0], self._emit_frame_ready, self._emit_error))
-                self.frame_counter.tick()
+                frame, slot, timestamp, _ = taken
+
+                try:
+                    view = frame if slot is None else slot.view()
+
+                    if self.thread_pool.activeThreadCount() >= self.thread_pool.maxThreadCount():
+                        continue
+
+                    if self.is_calibration:
+                        self._emit_frame_ready(frame)
+                        continue
+                    elif self._process_frame:
+                        with self.lock:
+                            charuco_state, circle_state = self._search_state
+                        self.frame_id += 1
+                        if charuco_state:
+                            self.thread_pool.start(ChArUcoDetection(
+                                view, self.frame_id, self.camera_matrix, self.dist_coeff,
+                                self.on_charuco_done, self._emit_error,
+                                frame_release=self._lend(slot), search_roi=self.last_roi,
+                                pose_cache=self.board_pose_cache))
+                        if circle_state:
+                            windows = None
+                            if self.sphere_tracker is not None:
+                                windows = self.sphere_tracker.plan(
+                                    self.frame_id, timestamp)
+                            self.thread_pool.start(CircleDetection(
+                                view, self.frame_id, self.last_roi, self.hsv_colors,
+                                self.on_circles_done, self._emit_error,
+                                frame_release=self._lend(slot), search_windows=windows))
+
+                        self._process_frame = False
+
+                    view_state = self.draw_view_state()
+                    self.thread_pool.start(DetectionDrawer(
+                        view, self.results.get(
+                            self.frame_id-1, {}), view_state, self.custom_origin,
+                        self.frame_size[0], self._emit_frame_ready, self._emit_error,
+                        frame_release=self._lend(slot)))
+                    self.frame_counter.tick()
+                finally:
+                    # Referencia recibida del grabber; las tareas tienen la suya
+                    if slot is not None:
+                        slot.release()
 
         except (OSError, RuntimeError) as e:
             self.error_occurred.emit(str(e))
         finally:
+            if grabber is not None:
+                grabber.stop()
             self.camera.camera_off()
 
+    def _apply_camera_mode(self, mode: dict):
+        """
+        Adopta el modo negociado con la cámara y lo reporta.
+
+        Args:
+            mode (dict): Resultado de `CameraConnection.get_mode`.
+        """
+        if not mode:
+            return
+        if mode["width"] > 0 and mode["height"] > 0:
+            self.frame_size = [mode["width"], mode["height"]]
+            self.frame_pool.configure((mode["height"], mode["width"], 3))
+        self.camera_mode.emit(mode)
+
+    @staticmethod
+    def _lend(slot):
+        """
+        Presta la ranura del frame a una tarea de visión.
+
+        Args:
+            slot (FrameSlot | None): Ranura del frame actual.
+
+        Returns:
+            callable | None: Función que suelta la referencia de la tarea, o
+            None si el frame no proviene del pool.
+        """
+        return slot.retain().release if slot is not None else None
+
     def _emit_frame_ready(self, frame: np.ndarray):
         """
         Emite la señal de frame listo para la UI de forma segura.
@@ -213,6 +291,10 @@ class CameraWorker(QThread):
         """
         with self.lock:
             self._search_state = (charuco, circle)
+        if not circle and self.sphere_tracker is not None:
+            self.sphere_tracker.reset()
+        if not charuco and self.board_pose_cache is not None:
+            self.board_pose_cache.reset()
 
     @pyqtSlot(bool, bool)
     def set_view_state(self, charuco: bool, circle: bool):
@@ -267,6 +349,8 @@ class CameraWorker(QThread):
             fid (int): ID del frame procesado.
             data (dict): Resultados de las esferas por color.
         """
+        if self.sphere_tracker is not None:
+            data = self.sphere_tracker.update(fid, data)
         with self.lock:
             entry = self.results.setdefault(
                 fid, {"charuco": None, "circles": None, "poses": None})
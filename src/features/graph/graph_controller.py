@@ -7,11 +7,13 @@ de datos y procesamiento asíncrono para mostrar el comportamiento angular
 
 Conexiones:
     - Escucha `update_graph_signal` para datos de simulación.
-    - Escucha `data_received` para telemetría física.
+    - Lee la telemetría física del buffer circular publicado en
+      `PhysicalSignalManager.telemetry_buffer` (sin copia por trama).
     - Distribuye actualizaciones a una colección de `PlotController`.
     - Gestiona el cambio entre vista Angular y Cartesiana en la UI.
 """
 
+import numpy as np
 from PyQt6.QtCore import QObject, pyqtSlot, QTimer
 from src.features.graph.graph_widget import GraphWidget
 from src.features.graph.graph_worker import GraphWorker
@@ -19,6 +21,10 @@ from src.features.graph.plots.plot_controller import PlotController
 from src.features.graph.cartesian_pid_plot import CartesianPIDPlot
 from src.services.data.signals import SimulationSignalManager, PhysicalSignalManager, ConfigSignalManager, ThemeSignalManager
 
+# Conversión servo (0-300) -> ángulo relativo: signo * pos + offset
+_PHY_SIGN = np.array([1.0, -1.0, -1.0, 1.0, 1.0, 1.0])
+_PHY_OFFSET = np.array([-150.0, 150.0, 150.0, -150.0, -150.0, -150.0])
+
 
 class GraphController(QObject):
     """
@@ -69,6 +75,14 @@ class GraphController(QObject):
         self._pid_flush_timer.timeout.connect(self._flush_pid_plot)
         self._pid_flush_timer.start()
 
+        # 7. Muestreo de la telemetría física a ~30 Hz desde el buffer
+        # circular del RobotWorker, en lugar de una señal por trama.
+        self._phy_seq = 0
+        self._phy_timer = QTimer(self)
+        self._phy_timer.setInterval(33)
+        self._phy_timer.timeout.connect(self._poll_phy_telemetry)
+        self._phy_timer.start()
+
     def _setup_plots(self):
         """
         Inicializa los controladores para cada gráfica individual.
@@ -128,10 +142,7 @@ class GraphController(QObject):
         """
         # Señales Globales -> Workers
         sim_mgr = SimulationSignalManager.get_instance()
-        phy_mgr = PhysicalSignalManager.get_instance()
-
         sim_mgr.update_graph_signal.connect(self._on_sim_data_received)
-        phy_mgr.data_received.connect(self._on_phy_data_received)
 
         # Kinematics Worker -> Cartesian PID Plot
         self._kinematics_service.pid_iteration.connect(self._on_pid_iteration)
@@ -160,23 +171,24 @@ class GraphController(QObject):
         ang_data[2] *= -1
         self._angular_worker.add_sim_data(ang_data)
 
-    @pyqtSlot(list, list)
-    def _on_phy_data_received(self, pos_data, temp_data):
+    def _poll_phy_telemetry(self):
         """
-        Maneja la recepción de datos reales del robot físico.
+        Toma el registro más reciente del buffer de telemetría física.
 
-        Args:
-            pos_data (list): Posiciones actuales de los servos.
-            temp_data (list): Temperaturas de los motores.
+        Solo actualiza las gráficas cuando la secuencia avanzó desde el
+        último muestreo; convierte las posiciones de servo a ángulos
+        relativos en una sola operación vectorizada.
         """
-        pos_ang = list(pos_data)
-        pos_ang[0] -= 150
-        pos_ang[1] = -pos_ang[1] + 150
-        pos_ang[2] = -pos_ang[2] + 150
-        pos_ang[3] -= 150
-        pos_ang[4] -= 150
-        pos_ang[5] -= 150
-        self._angular_worker.add_phy_data(pos_ang, temp_data)
+        buffer = PhysicalSignalManager.get_instance().telemetry_buffer
+        if buffer is None or buffer.sequence() == self._phy_seq:
+            return
+        record = buffer.latest()
+        if record is None:
+            return
+        self._phy_seq = int(record["seq"])
+        pos_ang = record["pos"] * _PHY_SIGN + _PHY_OFFSET
+        temps = [None if np.isnan(t) else int(t) for t in record["temp"]]
+        self._angular_worker.add_phy_data(pos_ang.tolist(), temps)
 
     def _update_angular_plot(self, idx, y_sim, y_phy, temp, w_idx, full, x):
         """
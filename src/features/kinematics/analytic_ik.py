@@ -0,0 +1,417 @@
+"""
+Módulo de cinemática inversa analítica del brazo de 4 GDL.
+
+Con la orientación de la herramienta fija (pitch = t2 + t3 + t4, medido desde
+la vertical) el problema se reduce a un brazo planar de dos eslabones:
+
+    - Base: t1 = atan2(py, px) (o su opuesto con alcance negativo).
+    - Muñeca: se resta el eslabón L5 en la dirección del pitch.
+    - L3 y el desfase L4 forman un único eslabón equivalente
+      R = hypot(L3, L4) desplazado un ángulo delta = atan2(L4, L3).
+    - Ley de cosenos para el codo (dos ramas: codo arriba / codo abajo).
+
+Con el pitch preferido la solución es cerrada y cuesta unos microsegundos.
+Solo si no cae dentro de los límites articulares se buscan otros pitches,
+de grueso a fino; esa búsqueda está vectorizada sobre un arreglo de pitches
+(y de objetivos en `ik_batch`), de modo que barrer cientos de orientaciones
+candidatas cuesta lo mismo que una sola llamada a NumPy.
+
+Conexiones:
+    - Lo utiliza `KinematicsWorker.ci`, que conserva Newton-Raphson solo
+      como refinamiento / respaldo.
+    - `kinematics_batch` reexporta `ik_batch` junto a la CD y el jacobiano
+      por lotes.
+"""
+
+import math
+from functools import lru_cache
+from typing import NamedTuple
+import numpy as np
+from src.services.robot.robot_compensator import CartesianPidCompensator
+
+LINKS = (155.0, 92.0, 111.0, 8.0, 150.0)
+
+# Pitch de la herramienta en el home angular (0, -45, 120, 0, 30, 0)
+HOME_PITCH = math.radians(105.0)
+
+# Búsqueda cuando el pitch preferido falla: rejilla gruesa (5°) y
+# refinamiento a 1° desde el mejor pitch grueso hacia el preferido (del
+# otro lado solo hay pitches más lejanos); si ninguna base
+# tiene solución gruesa se barre la rejilla fina completa (intervalos
+# válidos más estrechos que el paso grueso).
+_COARSE_STEP = 5
+_COARSE_GRID = np.radians(np.arange(-180.0, 180.0, _COARSE_STEP))
+_REFINE_OFFSETS = np.radians(np.arange(0.0, _COARSE_STEP))
+_PITCH_GRID = np.radians(np.arange(-180.0, 180.0, 1.0))
+
+# Costo extra de la base girada: solo se elige si la frontal no tiene solución
+_FLIP_PENALTY = 2.0 * np.pi
+
+
+class IkBranch(NamedTuple):
+    """
+    Una solución analítica de la cinemática inversa.
+
+    Attributes:
+        q (np.ndarray): Ángulos [t1, t2, t3, t4] en radianes.
+        pitch (float): Orientación de la herramienta en radianes.
+        elbow_up (bool): True para la rama de codo arriba.
+        base_flipped (bool): True si la base apunta en sentido opuesto al
+            objetivo (alcance negativo).
+        within_limits (bool): True si respeta los límites articulares.
+    """
+    q: np.ndarray
+    pitch: float
+    elbow_up: bool
+    base_flipped: bool
+    within_limits: bool
+
+
+def _wrap(angle):
+    """Normaliza ángulos al intervalo [-pi, pi)."""
+    return (angle + np.pi) % (2.0 * np.pi) - np.pi
+
+
+def _solve(px, py, pz, pitches, links, flipped):
+    """
+    Resuelve de forma vectorizada ambas ramas del codo para cada pitch.
+
+    Los objetivos pueden ser escalares o arreglos (N, 1) que se difunden
+    contra los pitches.
+
+    Args:
+        px, py, pz (float | np.ndarray): Objetivo cartesiano en mm.
+        pitches (np.ndarray): Orientaciones candidatas en radianes, (P,)
+            comunes o (N, P) por objetivo.
+        links (tuple): Longitudes (L1, L2, L3, L4, L5) en mm.
+        flipped (bool): Usar la base girada 180° (alcance negativo).
+
+    Returns:
+        tuple: (q (..., 2P, 4), pitch (..., 2P), alcanzable (..., 2P),
+        codo_arriba (2P,)), con las P ramas de codo arriba seguidas de las
+        P de codo abajo.
+    """
+    L1, L2, L3, L4, L5 = links
+    t1 = np.arctan2(py, px)
+    r = np.hypot(px, py)
+    if flipped:
+        t1 = _wrap(t1 + np.pi)
+        r = -r
+
+    phi = np.concatenate([pitches, pitches], axis=-1)
+    rw = r - L5 * np.sin(phi)
+    zw = pz - L1 - L5 * np.cos(phi)
+
+    R = math.hypot(L3, L4)
+    delta = math.atan2(L4, L3)
+    c = (rw * rw + zw * zw - L2 * L2 - R * R) / (2.0 * L2 * R)
+    reachable = np.abs(c) <= 1.0
+
+    n = pitches.shape[-1]
+    gamma = np.arccos(np.clip(c, -1.0, 1.0))
+    gamma[..., n:] *= -1.0
+    t2 = np.arctan2(rw, zw) - np.arctan2(R * np.sin(gamma), L2 + R * np.cos(gamma))
+    t3 = gamma - delta
+    t4 = phi - t2 - t3
+
+    q = np.empty(gamma.shape + (4,))
+    q[..., 0] = t1
+    q[..., 1] = t2
+    q[..., 2] = t3
+    q[..., 3] = t4
+    q[..., 1:] = _wrap(q[..., 1:])
+    elbow_up = np.arange(2 * n) < n
+    return q, phi, reachable, elbow_up
+
+
+@lru_cache(maxsize=8)
+def _limits_rad(limits_deg):
+    """Límites (4, 2) en radianes con tolerancia, a partir de tuplas en grados."""
+    limits = np.radians(np.asarray(limits_deg, dtype=float))
+    return limits[:, 0] - 1e-9, limits[:, 1] + 1e-9
+
+
+def _within_limits(q, limits_deg):
+    """Máscara de filas de `q` (radianes) dentro de los límites en grados."""
+    low, high = _limits_rad(tuple(map(tuple, limits_deg)))
+    return np.all((q >= low) & (q <= high), axis=-1)
+
+
+def _closed_form(px, py, pz, pitch, links, flipped, limits_deg):
+    """
+    Solución cerrada escalar para un pitch (sin NumPy en el camino común).
+
+    Args:
+        px, py, pz (float): Objetivo cartesiano en mm.
+        pitch (float): Orientación de la herramienta en radianes.
+        links (tuple): Longitudes (L1, L2, L3, L4, L5) en mm.
+        flipped (bool): Usar la base girada 180° (alcance negativo).
+        limits_deg (list): Límites articulares [(min, max)] x 4.
+
+    Returns:
+        list[IkBranch]: Codo arriba y codo abajo, o vacía si el objetivo
+        está fuera de alcance con este pitch.
+    """
+    L1, L2, L3, L4, L5 = links
+    t1 = math.atan2(py, px)
+    r = math.hypot(px, py)
+    if flipped:
+        t1 = (t1 + 2.0 * math.pi) % (2.0 * math.pi) - math.pi
+        r = -r
+    rw = r - L5 * math.sin(pitch)
+    zw = pz - L1 - L5 * math.cos(pitch)
+
+    R = math.hypot(L3, L4)
+    delta = math.atan2(L4, L3)
+    c = (rw * rw + zw * zw - L2 * L2 - R * R) / (2.0 * L2 * R)
+    if abs(c) > 1.0:
+        return []
+
+    limits = [(math.radians(lo) - 1e-9, math.radians(hi) + 1e-9) for lo, hi in limits_deg]
+    branches = []
+    for elbow_up, gamma in ((True, math.acos(c)), (False, -math.acos(c))):
+        t2 = math.atan2(rw, zw) - math.atan2(R * math.sin(gamma), L2 + R * math.cos(gamma))
+        t3 = gamma - delta
+        q = (t1, _wrap(t2), _wrap(t3), _wrap(pitch - t2 - t3))
+        ok = all(lo <= v <= hi for v, (lo, hi) in zip(q, limits))
+        branches.append(IkBranch(np.array(q), pitch, elbow_up, flipped, ok))
+    return branches
+
+
+def ik_branches(px, py, pz, pitch=HOME_PITCH, links=LINKS, limits_deg=None):
+    """
+    Calcula todas las ramas analíticas para una orientación fija.
+
+    Args:
+        px, py, pz (float): Objetivo cartesiano en mm.
+        pitch (float): Orientación de la herramienta en radianes.
+        links (tuple): Longitudes de los eslabones en mm.
+        limits_deg (list, optional): Límites articulares [(min, max)] x 4.
+
+    Returns:
+        list[IkBranch]: Ramas alcanzables (codo arriba primero, base
+        frontal antes que girada); vacía si el objetivo está fuera de alcance.
+    """
+    if limits_deg is None:
+        limits_deg = CartesianPidCompensator.LIMITS_DEG
+    return (_closed_form(px, py, pz, pitch, links, False, limits_deg)
+            + _closed_form(px, py, pz, pitch, links, True, limits_deg))
+
+
+def ik_best(px, py, pz, preferred_pitch=HOME_PITCH, links=LINKS,
+            limits_deg=None, pitches=None):
+    """
+    Busca la solución dentro de límites con el pitch más cercano al preferido.
+
+    Resuelve primero en forma cerrada el pitch preferido con la base
+    frontal; si ninguna rama del codo cae dentro de límites, busca de
+    grueso (5°) a fino (1°) en [-180°, 180°). La base girada solo se usa si
+    la frontal no tiene solución con ningún pitch; ante empate prefiere el
+    codo arriba. La búsqueda gruesa puede pasar por alto un intervalo
+    válido más estrecho que su paso y devolver un pitch algo más lejano
+    (o, si solo la frontal tiene ese intervalo, la base girada).
+
+    Args:
+        px, py, pz (float): Objetivo cartesiano en mm.
+        preferred_pitch (float): Orientación deseada en radianes.
+        links (tuple): Longitudes de los eslabones en mm.
+        limits_deg (list, optional): Límites articulares [(min, max)] x 4.
+        pitches (np.ndarray, optional): Rejilla de pitches a barrer si el
+            preferido falla (en lugar de la búsqueda gruesa a fina).
+
+    Returns:
+        IkBranch | None: Mejor solución o None si ninguna es alcanzable
+        dentro de los límites.
+    """
+    if limits_deg is None:
+        limits_deg = CartesianPidCompensator.LIMITS_DEG
+    for branch in _closed_form(px, py, pz, preferred_pitch, links, False, limits_deg):
+        if branch.within_limits:
+            return branch
+
+    q, pitch, elbow_up, flipped, ok = _best(
+        np.array([[px, py, pz]], dtype=float), preferred_pitch, links,
+        limits_deg, pitches)
+    if not ok[0]:
+        return None
+    return IkBranch(q[0], float(pitch[0]), bool(elbow_up[0]), bool(flipped[0]), True)
+
+
+def ik_batch(points, preferred_pitch=HOME_PITCH, links=LINKS,
+             limits_deg=None, pitches=None, chunk=256):
+    """
+    Versión por lotes de `ik_best` para N objetivos.
+
+    Args:
+        points (np.ndarray): Objetivos cartesianos (N, 3) en mm.
+        preferred_pitch (float): Orientación deseada en radianes.
+        links (tuple): Longitudes de los eslabones en mm.
+        limits_deg (list, optional): Límites articulares [(min, max)] x 4.
+        pitches (np.ndarray, optional): Rejilla de pitches a barrer si el
+            preferido falla (en lugar de la búsqueda gruesa a fina).
+        chunk (int): Objetivos por bloque en los barridos de pitch (acota
+            la memoria temporal); el pitch preferido se resuelve de una vez.
+
+    Returns:
+        tuple: (q (N, 4) en radianes, NaN donde no hay solución;
+        ok (N,) bool).
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    q, _, _, _, ok = _best(points, preferred_pitch, links, limits_deg, pitches, chunk)
+    return q, ok
+
+
+def _best(points, preferred_pitch, links, limits_deg, pitches, chunk=256):
+    """
+    Elige por fila la rama dentro de límites con el pitch más cercano.
+
+    Cada etapa se aplica solo a las filas aún sin solución: pitch
+    preferido, búsqueda gruesa refinada (o la rejilla dada) con la base
+    frontal, lo mismo con la girada y, por último, la rejilla fina
+    completa con cada base. Los objetivos cuya muñeca no puede quedar al
+    alcance de L2 y L3 con ningún pitch se descartan antes de barrer.
+
+    El pitch preferido se evalúa para todas las filas en una sola llamada;
+    los barridos, que solo reciben las filas que fallaron, se hacen por
+    bloques de `chunk` objetivos.
+
+    Args:
+        points (np.ndarray): Objetivos (N, 3) en mm.
+        chunk (int): Objetivos por bloque en los barridos.
+
+    Returns:
+        tuple: (q (N, 4), pitch (N,), codo_arriba (N,), base_girada (N,),
+        ok (N,)); las filas sin solución tienen q = NaN.
+    """
+    if limits_deg is None:
+        limits_deg = CartesianPidCompensator.LIMITS_DEG
+    L1, L2, L3, L4, L5 = links
+    R = math.hypot(L3, L4)
+    rho = np.hypot(np.hypot(points[:, 0], points[:, 1]), points[:, 2] - L1)
+    feasible = (np.abs(rho - L5) <= L2 + R + 1e-9) & (rho + L5 >= abs(L2 - R) - 1e-9)
+
+    n = len(points)
+    result = (np.full((n, 4), np.nan), np.full(n, np.nan), np.zeros(n, dtype=bool),
+              np.zeros(n, dtype=bool), np.zeros(n, dtype=bool))
+
+    def stage(flipped, grid=None):
+        rows = np.flatnonzero(feasible & ~result[4])
+        if not len(rows):
+            return
+        if grid is None:
+            found = _preferred(points[rows], preferred_pitch, links, limits_deg, flipped)
+            _assign(result, rows, found, flipped)
+            return
+        for start in range(0, len(rows), chunk):
+            block = rows[start:start + chunk]
+            found = _sweep(points[block], grid, preferred_pitch, links, limits_deg, flipped)
+            if grid is _COARSE_GRID and found[3].any():
+                found = _refine(points[block], found, preferred_pitch, links, limits_deg, flipped)
+            _assign(result, block, found, flipped)
+
+    for flipped in (False, True):
+        stage(flipped)
+        stage(flipped, _COARSE_GRID if pitches is None else np.asarray(pitches, dtype=float))
+    if pitches is None:
+        for flipped in (False, True):
+            stage(flipped, _PITCH_GRID)
+    return result
+
+
+def _preferred(points, preferred_pitch, links, limits_deg, flipped):
+    """
+    Evalúa solo el pitch preferido; con un objetivo usa la forma cerrada.
+
+    Returns:
+        tuple: Igual que `_sweep`.
+    """
+    if len(points) > 1:
+        return _sweep(points, np.array([preferred_pitch]), preferred_pitch,
+                      links, limits_deg, flipped)
+    for branch in _closed_form(*points[0], preferred_pitch, links, flipped, limits_deg):
+        if branch.within_limits:
+            return (branch.q[None], np.array([_wrap(branch.pitch)]),
+                    np.array([branch.elbow_up]), np.array([True]))
+    return (np.full((1, 4), np.nan), np.full(1, np.nan),
+            np.zeros(1, dtype=bool), np.zeros(1, dtype=bool))
+
+
+def _refine(points, coarse, preferred_pitch, links, limits_deg, flipped):
+    """
+    Refina a 1° los pitches gruesos en dirección al preferido.
+
+    La ventana incluye el propio pitch grueso, así que el resultado nunca
+    empeora. Con un objetivo se usa la forma cerrada escalar, más barata
+    que un barrido de NumPy para tan pocos pitches.
+
+    Args:
+        points (np.ndarray): Objetivos (N, 3) en mm.
+        coarse (tuple): Resultado de `_sweep` con la rejilla gruesa.
+        flipped (bool): Usar la base girada 180°.
+
+    Returns:
+        tuple: Igual que `_sweep`.
+    """
+    q, phi, elbow_up, ok = (f.copy() for f in coarse)
+    step = np.where(_wrap(preferred_pitch - phi) < 0.0, -1.0, 1.0)
+    if len(points) == 1:
+        start = float(phi[0])
+        best_cost = _cost(phi[0], elbow_up[0], preferred_pitch)
+        for offset in _REFINE_OFFSETS[1:]:
+            pitch = start + step[0] * offset
+            for branch in _closed_form(*points[0], pitch, links, flipped, limits_deg):
+                cost = _cost(pitch, np.bool_(branch.elbow_up), preferred_pitch)
+                if branch.within_limits and cost < best_cost:
+                    q[0], phi[0], elbow_up[0] = branch.q, _wrap(pitch), branch.elbow_up
+                    best_cost = cost
+        return q, phi, elbow_up, ok
+
+    rows = np.flatnonzero(ok)
+    window = phi[rows, None] + step[rows, None] * _REFINE_OFFSETS
+    q[rows], phi[rows], elbow_up[rows], _ = _sweep(
+        points[rows], window, preferred_pitch, links, limits_deg, flipped)
+    return q, phi, elbow_up, ok
+
+
+def _sweep(points, pitches, preferred_pitch, links, limits_deg, flipped):
+    """
+    Evalúa una rejilla de pitches y elige la rama de menor costo por fila.
+
+    Args:
+        points (np.ndarray): Objetivos (N, 3) en mm.
+        pitches (np.ndarray): Pitches candidatos en radianes, (P,) comunes
+            o (N, P) por objetivo.
+        flipped (bool): Usar la base girada 180°.
+
+    Returns:
+        tuple: (q (N, 4), pitch (N,), codo_arriba (N,), ok (N,)); las filas
+        sin solución tienen q = NaN.
+    """
+    q, phi, reachable, elbow_up = _solve(
+        points[:, 0:1], points[:, 1:2], points[:, 2:3], pitches, links, flipped)
+    valid = reachable & _within_limits(q, limits_deg)
+    phi = np.broadcast_to(phi, valid.shape)
+    cost = np.where(valid, _cost(phi, elbow_up, preferred_pitch), np.inf)
+    idx = np.argmin(cost, axis=1)
+    rows = np.arange(len(points))
+    ok = valid[rows, idx]
+    best_q = q[rows, idx]
+    best_q[~ok] = np.nan
+    return best_q, _wrap(phi[rows, idx]), elbow_up[idx], ok
+
+
+def _cost(phi, elbow_up, preferred_pitch):
+    """Distancia angular al pitch preferido; el codo arriba desempata."""
+    return np.abs(_wrap(phi - preferred_pitch)) + 1e-6 * ~elbow_up
+
+
+def _assign(result, rows, candidate, flipped):
+    """Copia a `result` las filas `rows` que tienen solución en `candidate`."""
+    c_q, c_phi, c_elbow, c_ok = candidate
+    if not c_ok.any():
+        return
+    q, phi, elbow_up, base_flipped, ok = result
+    rows = rows[c_ok]
+    q[rows], phi[rows], elbow_up[rows] = c_q[c_ok], c_phi[c_ok], c_elbow[c_ok]
+    base_flipped[rows] = flipped
+    ok[rows] = True
@@ -0,0 +1,220 @@
+"""
+Banco de pruebas de rendimiento de la cinemática y el control.
+
+Mide la latencia por llamada y el throughput de las rutas críticas del lazo
+cartesiano sobre conjuntos de objetivos realistas (los mismos que usa
+`pid_tuner`), sin event loop de Qt ni hardware: el `KinematicsWorker` se
+instancia sin arrancar su hilo.
+
+Casos medidos:
+    - `cinematica_directa`, `calcular_pseudoinversa`, `calcular_dls`.
+    - `ci` sin caché (`ci_cold`) y con acierto de caché (`ci_cached`).
+    - `pid_step` contra una telemetría fija.
+    - `apply_physical_limits` y `corregir_xy`.
+    - Versiones por lotes (`fk_batch`, `ik_batch`, `corregir_xy_batch`),
+      reportadas por punto.
+
+Los resultados se guardan en JSON junto con el commit y las versiones de
+Python y NumPy, y pueden compararse con una ejecución anterior.
+
+Uso:
+    python -m src.features.kinematics.benchmark --output bench.json
+    python -m src.features.kinematics.benchmark --compare bench.json
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import contextlib
+import subprocess
+from datetime import datetime
+
+import numpy as np
+
+from src.services.robot.robot_compensator import CartesianPidCompensator
+from .coordinate_correction import corregir_xy, corregir_xy_batch
+from .kinematics_batch import fk_batch, ik_batch
+from .kinematics_worker import KinematicsWorker
+from .pid_tuner import sample_targets
+
+_TARGET_LIMITS = [(-100, 100), (-90, 90), (-130, 130), (-90, 120)]
+
+
+def measure(func, args_list, repeat: int = 5, batch_size: int = 1) -> dict:
+    """
+    Mide una función sobre una lista de argumentos.
+
+    Cada ronda recorre toda la lista; la latencia por llamada se obtiene de
+    la ronda completa dividida entre el número de llamadas (o de puntos si
+    `batch_size` > 1), lo que evita que el costo del reloj domine en
+    funciones de microsegundos.
+
+    Args:
+        func (callable): Función a medir.
+        args_list (list): Tuplas de argumentos, una por llamada.
+        repeat (int): Rondas medidas (tras una de calentamiento).
+        batch_size (int): Puntos procesados por llamada.
+
+    Returns:
+        dict: Latencia por unidad (us) mínima, mediana y máxima entre
+        rondas, y throughput (unidades/s) de la mediana.
+    """
+    for args in args_list:
+        func(*args)
+    units = len(args_list) * batch_size
+    rounds = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for args in args_list:
+            func(*args)
+        rounds.append((time.perf_counter_ns() - start) / units / 1e3)
+    rounds = np.array(rounds)
+    median = float(np.median(rounds))
+    return {
+        "us_min": float(rounds.min()),
+        "us_median": median,
+        "us_max": float(rounds.max()),
+        "throughput": 1e6 / median if median > 0 else float("inf"),
+        "calls": len(args_list),
+        "batch_size": batch_size,
+    }
+
+
+def run_suite(count: int = 200, repeat: int = 5, seed: int = 0) -> dict:
+    """
+    Ejecuta todos los casos del banco.
+
+    Args:
+        count (int): Objetivos / configuraciones por caso.
+        repeat (int): Rondas medidas por caso.
+        seed (int): Semilla de los datos de entrada.
+
+    Returns:
+        dict: Resultados por nombre de caso.
+    """
+    rng = np.random.default_rng(seed)
+    targets = sample_targets(count, seed)
+    limits = np.radians(_TARGET_LIMITS)
+    configs = rng.uniform(limits[:, 0], limits[:, 1], (count, 4))
+    worker = KinematicsWorker()
+    target_args = [tuple(t) for t in targets]
+    config_args = [(q,) for q in configs]
+
+    def ci_cold(px, py, pz):
+        worker._ik_cache.clear()
+        return worker.ci(px, py, pz)
+
+    def pid_step(target):
+        worker._reset_pid_state()
+        return worker._pid_step(target, _TARGET_LIMITS)
+
+    results = {}
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        results["cinematica_directa"] = measure(
+            worker._cinematica_directa, config_args, repeat)
+        results["calcular_pseudoinversa"] = measure(
+            worker._calcular_pseudoinversa, config_args, repeat)
+        results["calcular_dls"] = measure(worker._calcular_dls, config_args, repeat)
+        results["ci_cold"] = measure(ci_cold, target_args, repeat)
+        results["ci_cached"] = measure(worker.ci, target_args, repeat)
+        results["pid_step"] = measure(pid_step, [(t,) for t in targets], repeat)
+        results["apply_physical_limits"] = measure(
+            CartesianPidCompensator.apply_physical_limits, config_args, repeat)
+        results["corregir_xy"] = measure(
+            corregir_xy, [(t[0], t[1]) for t in targets], repeat)
+        results["fk_batch"] = measure(fk_batch, [(configs,)] * 20, repeat, count)
+        results["ik_batch"] = measure(ik_batch, [(targets,)] * 2, repeat, count)
+        results["corregir_xy_batch"] = measure(
+            corregir_xy_batch, [(targets[:, :2],)] * 20, repeat, count)
+    return results
+
+
+def _git_commit():
+    """Commit actual del repositorio, si está disponible."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+            text=True, check=True, timeout=5).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def compare(current: dict, previous: dict, threshold: float) -> list:
+    """
+    Compara dos ejecuciones por la mediana de latencia.
+
+    Args:
+        current (dict): Resultados actuales (`results`).
+        previous (dict): Resultados de referencia (`results`).
+        threshold (float): Razón actual/referencia considerada regresión.
+
+    Returns:
+        list: Tuplas (caso, razón, es_regresión) de los casos comunes.
+    """
+    rows = []
+    for name, result in current.items():
+        if name not in previous:
+            continue
+        ratio = result["us_median"] / previous[name]["us_median"]
+        rows.append((name, ratio, ratio > threshold))
+    return rows
+
+
+def main():
+    """Punto de entrada por línea de comandos del banco de pruebas."""
+    parser = argparse.ArgumentParser(
+        description="Banco de rendimiento de la cinemática y el control.")
+    parser.add_argument("--count", type=int, default=200,
+                        help="Objetivos por caso (default: 200).")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Rondas medidas por caso (default: 5).")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Semilla de los datos de entrada.")
+    parser.add_argument("--output", default=None,
+                        help="Archivo JSON donde guardar los resultados.")
+    parser.add_argument("--compare", default=None,
+                        help="JSON de una ejecución anterior para comparar.")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="Razón de latencia considerada regresión (default: 1.25).")
+    args = parser.parse_args()
+
+    results = run_suite(args.count, args.repeat, args.seed)
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "count": args.count,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+
+    for name, result in results.items():
+        print(f"{name:<24} {result['us_median']:>10.2f} us  "
+              f"{result['throughput']:>12.0f} /s")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Resultados guardados en {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+        rows = compare(results, previous["results"], args.threshold)
+        print(f"\nComparación con {previous['meta'].get('commit')}:")
+        for name, ratio, regression in rows:
+            mark = "  REGRESIÓN" if regression else ""
+            print(f"{name:<24} x{ratio:.2f}{mark}")
+        if any(regression for _, _, regression in rows):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
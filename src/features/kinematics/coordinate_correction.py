@@ -1,37 +1,159 @@
+"""
+Corrección de coordenadas cartesianas a partir de la tabla de compensación.
+
+La tabla `datos_robot.csv` contiene, para una rejilla de puntos deseados, el
+error medido en X e Y. La triangulación de Delaunay y el interpolador lineal
+se construyen una sola vez (compartidos para ambos ejes) y se reutilizan en
+cada consulta; `reload()` los reconstruye si la tabla cambia.
+
+Fuera de la envolvente convexa de la tabla el interpolador lineal no está
+definido: por defecto la corrección es 0, u opcionalmente se usa un modelo
+cuadrático suave ajustado por mínimos cuadrados a toda la tabla y saturado al
+rango de errores medidos.
+"""
+
 import math
+import threading
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
-from scipy.interpolate import griddata
+from scipy.interpolate import LinearNDInterpolator
+from scipy.spatial import Delaunay
 
 _CSV_PATH = Path(__file__).parents[3] / "src" / "resources" / "tabla_compensacion" / "datos_robot.csv"
-_df_cache = None
 
 
-def _load_data():
-    global _df_cache
-    if _df_cache is None:
-        _df_cache = pd.read_csv(_CSV_PATH, sep=';')
-    return _df_cache
+class CorrectionEngine:
+    """
+    Motor de corrección XY con interpolador precalculado.
+
+    Args:
+        csv_path (Path): Ruta de la tabla de compensación.
+        fallback (bool): Usar el modelo cuadrático fuera de la envolvente
+            convexa en lugar de corrección nula.
+    """
+
+    def __init__(self, csv_path=_CSV_PATH, fallback: bool = False):
+        self._csv_path = Path(csv_path)
+        self._fallback = fallback
+        self._lock = threading.Lock()
+        self._interpolator = None
+        self._coefficients = None
+        self._error_range = None
+        self.reload()
+
+    def reload(self):
+        """Vuelve a leer la tabla y reconstruye triangulación e interpoladores."""
+        df = pd.read_csv(self._csv_path, sep=';')
+        points = df[['X_deseado mm', 'Y_deseado mm']].to_numpy(dtype=float)
+        errors = df[['error X mm', 'error Y mm']].to_numpy(dtype=float)
+
+        interpolator = LinearNDInterpolator(Delaunay(points), errors)
+        coefficients, *_ = np.linalg.lstsq(
+            self._quadratic_terms(points[:, 0], points[:, 1]), errors, rcond=None)
+
+        with self._lock:
+            self._interpolator = interpolator
+            self._coefficients = coefficients
+            self._error_range = (errors.min(axis=0), errors.max(axis=0))
+
+    def set_fallback(self, enabled: bool):
+        """
+        Activa o desactiva el modelo suave fuera de la envolvente convexa.
+
+        Args:
+            enabled (bool): True para extrapolar con el modelo cuadrático.
+        """
+        self._fallback = bool(enabled)
+
+    @staticmethod
+    def _quadratic_terms(x, y):
+        """Matriz de términos [1, x, y, x², xy, y²] del modelo suave."""
+        return np.column_stack([np.ones_like(x), x, y, x * x, x * y, y * y])
+
+    def errors(self, x, y, fallback: bool | None = None):
+        """
+        Calcula el error estimado en X e Y para uno o varios puntos.
 
+        Args:
+            x, y (float | np.ndarray): Coordenadas deseadas en mm.
+            fallback (bool, optional): Sobrescribe la política fuera de la
+                envolvente convexa.
 
-def corregir_xy(x_objetivo, y_objetivo):
-    df = _load_data()
-    x_d = df['X_deseado mm'].values
-    y_d = df['Y_deseado mm'].values
-    e_x = df['error X mm'].values
-    e_y = df['error Y mm'].values
+        Returns:
+            np.ndarray: Errores (N, 2) [error X, error Y] en mm.
+        """
+        if fallback is None:
+            fallback = self._fallback
+        with self._lock:
+            interpolator = self._interpolator
+            coefficients = self._coefficients
+            error_range = self._error_range
 
-    delta_x = griddata((x_d, y_d), e_x, (x_objetivo, y_objetivo), method='linear')
-    delta_y = griddata((x_d, y_d), e_y, (x_objetivo, y_objetivo), method='linear')
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        y = np.atleast_1d(np.asarray(y, dtype=float))
+        delta = interpolator(np.column_stack([x, y]))
+        outside = np.isnan(delta[:, 0])
+        if outside.any():
+            if fallback:
+                delta[outside] = np.clip(
+                    self._quadratic_terms(x[outside], y[outside]) @ coefficients,
+                    *error_range)
+            else:
+                delta[outside] = 0.0
+        return delta
 
-    delta_x = 0 if np.isnan(delta_x) else delta_x
-    delta_y = 0 if np.isnan(delta_y) else delta_y
+    def correct_batch(self, points, fallback: bool | None = None):
+        """
+        Corrige un lote de puntos XY.
 
+        Args:
+            points (np.ndarray): Puntos deseados (N, 2) en mm.
+            fallback (bool, optional): Sobrescribe la política fuera de la
+                envolvente convexa.
+
+        Returns:
+            np.ndarray: Puntos corregidos (N, 2), redondeados al milímetro.
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        delta = self.errors(points[:, 0], points[:, 1], fallback)
+        return np.rint(points + delta)
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> CorrectionEngine:
+    """
+    Obtiene el motor de corrección compartido (se construye al primer uso).
+
+    Returns:
+        CorrectionEngine: Instancia única del motor.
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = CorrectionEngine()
+    return _engine
+
+
+def reload():
+    """Recarga la tabla de compensación en el motor compartido."""
+    get_engine().reload()
+
+
+def corregir_xy(x_objetivo, y_objetivo, fallback=None):
+    delta_x, delta_y = get_engine().errors(x_objetivo, y_objetivo, fallback)[0]
     return round(x_objetivo + delta_x), round(y_objetivo + delta_y)
 
 
+def corregir_xy_batch(points, fallback=None):
+    return get_engine().correct_batch(points, fallback)
+
+
 def corregir_z(x_objetivo, y_objetivo, z_objetivo):
     radio = math.sqrt(x_objetivo**2 + y_objetivo**2)
     errorz = 0.0007 * radio**2 - 0.1316 * radio + 14.694
@@ -0,0 +1,131 @@
+"""
+Módulo de caché de soluciones de cinemática inversa.
+
+Pick and place solicita repetidamente objetivos casi idénticos (aproximación
+y agarre de la misma esfera, mismas coordenadas de depósito). IkCache guarda
+las soluciones indexadas por el objetivo cuantizado a una rejilla
+configurable, con desalojo LRU y contadores de aciertos/fallos, y ofrece la
+solución almacenada más cercana como punto de partida (warm start) para los
+objetivos que no están en caché.
+
+Conexiones:
+    - Lo utiliza `KinematicsWorker.ci`; la rejilla y la capacidad se leen de
+      `settings.json` (`kinematics.ik_cache`) en `KinematicsController`.
+"""
+
+import threading
+from collections import OrderedDict
+import numpy as np
+
+
+class IkCache:
+    """
+    Caché LRU de soluciones articulares por objetivo cartesiano cuantizado.
+
+    Dos objetivos que caen en la misma celda de la rejilla comparten
+    solución, por lo que el error de posición de un acierto está acotado
+    por la mitad de la resolución en cada eje.
+
+    Args:
+        resolution_mm (float): Tamaño de celda de la rejilla en mm.
+        capacity (int): Número máximo de soluciones almacenadas.
+    """
+
+    def __init__(self, resolution_mm: float = 1.0, capacity: int = 256):
+        if resolution_mm <= 0:
+            raise ValueError("La resolución debe ser positiva")
+        self._resolution = float(resolution_mm)
+        self._capacity = max(1, int(capacity))
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _key(self, target, tag):
+        """Celda de la rejilla (y etiqueta opcional, p. ej. el pitch)."""
+        cell = tuple(int(round(v / self._resolution)) for v in target)
+        return cell, tag
+
+    def get(self, target, tag=None):
+        """
+        Busca la solución de un objetivo.
+
+        Args:
+            target (sequence): Objetivo cartesiano [x, y, z] en mm.
+            tag (hashable, optional): Parámetro adicional de la solución.
+
+        Returns:
+            np.ndarray | None: Copia de la solución o None si no está.
+        """
+        key = self._key(target, tag)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1].copy()
+
+    def put(self, target, q, tag=None):
+        """
+        Almacena una solución desalojando la menos usada si está lleno.
+
+        Args:
+            target (sequence): Objetivo cartesiano [x, y, z] en mm.
+            q (np.ndarray): Ángulos articulares en radianes.
+            tag (hashable, optional): Parámetro adicional de la solución.
+        """
+        key = self._key(target, tag)
+        entry = (np.asarray(target, dtype=float), np.array(q, dtype=float))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._capacity:
+                self._entries.popitem(last=False)
+
+    def nearest(self, target, max_distance: float | None = None):
+        """
+        Obtiene la solución almacenada cuyo objetivo está más cerca.
+
+        Args:
+            target (sequence): Objetivo cartesiano [x, y, z] en mm.
+            max_distance (float, optional): Distancia máxima aceptada en mm.
+
+        Returns:
+            np.ndarray | None: Copia de la solución o None si no hay
+            ninguna dentro de la distancia.
+        """
+        with self._lock:
+            if not self._entries:
+                return None
+            targets = np.array([e[0] for e in self._entries.values()])
+            solutions = [e[1] for e in self._entries.values()]
+        distances = np.linalg.norm(targets - np.asarray(target, dtype=float), axis=1)
+        i = int(np.argmin(distances))
+        if max_distance is not None and distances[i] > max_distance:
+            return None
+        return solutions[i].copy()
+
+    def clear(self):
+        """Vacía la caché y reinicia los contadores."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def get_stats(self) -> dict:
+        """
+        Obtiene los contadores de la caché.
+
+        Returns:
+            dict: hits, misses, size, capacity y resolution_mm.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._entries),
+                "capacity": self._capacity,
+                "resolution_mm": self._resolution,
+            }
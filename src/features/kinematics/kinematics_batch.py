@@ -0,0 +1,90 @@
+"""
+Módulo de cinemática vectorizada por lotes.
+
+Proporciona versiones NumPy de la cinemática directa, del jacobiano y de la
+cinemática inversa que procesan N configuraciones en una sola llamada, sin
+bucles de Python. Están pensadas para barridos del espacio de trabajo,
+muestreo de trayectorias, reconstrucción cartesiana de telemetría y
+generación de tablas de compensación.
+
+Las ecuaciones son las mismas que `KinematicsWorker._cinematica_directa` y
+`KinematicsWorker._calcular_pseudoinversa` (ángulos en radianes, longitudes
+en mm).
+
+Conexiones:
+    - `ik_batch` proviene de `analytic_ik` (solución analítica por lotes).
+"""
+
+import numpy as np
+from .analytic_ik import LINKS, ik_batch
+
+__all__ = ["fk_batch", "jacobian_batch", "ik_batch"]
+
+
+def _angles(Q):
+    """Convierte Q a arreglo (N, 4) y devuelve sus columnas."""
+    Q = np.asarray(Q, dtype=float).reshape(-1, 4)
+    return Q[:, 0], Q[:, 1], Q[:, 2], Q[:, 3]
+
+
+def fk_batch(Q, links=LINKS):
+    """
+    Cinemática directa de N configuraciones.
+
+    Args:
+        Q (np.ndarray): Ángulos articulares (N, 4) en radianes.
+        links (tuple): Longitudes (L1, L2, L3, L4, L5) en mm.
+
+    Returns:
+        np.ndarray: Posiciones cartesianas (N, 3) en mm.
+    """
+    t1, t2, t3, t4 = _angles(Q)
+    L1, L2, L3, L4, L5 = links
+    a23 = t2 + t3
+    a234 = a23 + t4
+    s23, c23 = np.sin(a23), np.cos(a23)
+    projection = L4 * c23 + L3 * s23 + L2 * np.sin(t2) + L5 * np.sin(a234)
+
+    P = np.empty((len(t1), 3))
+    P[:, 0] = np.cos(t1) * projection
+    P[:, 1] = np.sin(t1) * projection
+    P[:, 2] = L1 + L3 * c23 - L4 * s23 + L2 * np.cos(t2) + L5 * np.cos(a234)
+    return P
+
+
+def jacobian_batch(Q, links=LINKS):
+    """
+    Jacobiano de posición (3x4) de N configuraciones.
+
+    Args:
+        Q (np.ndarray): Ángulos articulares (N, 4) en radianes.
+        links (tuple): Longitudes (L1, L2, L3, L4, L5) en mm.
+
+    Returns:
+        np.ndarray: Jacobianos (N, 3, 4) en mm/rad.
+    """
+    t1, t2, t3, t4 = _angles(Q)
+    _, L2, L3, L4, L5 = links
+    s1, c1 = np.sin(t1), np.cos(t1)
+    s2, c2 = np.sin(t2), np.cos(t2)
+    a23 = t2 + t3
+    s23, c23 = np.sin(a23), np.cos(a23)
+    s234, c234 = np.sin(a23 + t4), np.cos(a23 + t4)
+
+    f = L4 * c23 + L3 * s23 + L2 * s2 + L5 * s234
+    df_dt4 = L5 * c234
+    df_dt3 = -L4 * s23 + L3 * c23 + df_dt4
+    df_dt2 = df_dt3 + L2 * c2
+    dz_dt4 = -L5 * s234
+    dz_dt3 = -L3 * s23 - L4 * c23 + dz_dt4
+    dz_dt2 = dz_dt3 - L2 * s2
+
+    J = np.zeros((len(t1), 3, 4))
+    J[:, 0, 0] = -s1 * f
+    J[:, 1, 0] = c1 * f
+    J[:, 0, 1:] = c1[:, None] * np.stack([df_dt2, df_dt3, df_dt4], axis=1)
+    J[:, 1, 1:] = s1[:, None] * np.stack([df_dt2, df_dt3, df_dt4], axis=1)
+    J[:, 2, 1] = dz_dt2
+    J[:, 2, 2] = dz_dt3
+    J[:, 2, 3] = dz_dt4
+    return J
@@ -7,21 +7,27 @@ y el motor de cálculo y control realimentado (KinematicsWorker).
 
 Conexiones:
     - Escucha eventos de clic del widget para iniciar trayectorias.
+    - Valida los destinos contra el mapa del espacio de trabajo (confirmado
+      con la IK analítica) y recorta los inalcanzables al punto alcanzable
+      más cercano.
     - Sincroniza la telemetría real del robot con el worker cinemático.
     - Emite actualizaciones de estado a los managers de simulación y hardware.
 """
 
+from datetime import datetime
 import numpy as np
 from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QTimer
 from src.features.kinematics.kinematics_widget import KinematicsWidget
 from src.features.kinematics.kinematics_worker import KinematicsWorker
 from src.services.data.signals import (
     PhysicalSignalManager, KinematicsSignalManager,
-    SimulationSignalManager, SlidersSignalManager
+    SimulationSignalManager, SlidersSignalManager, ConfigSignalManager
 )
+from src.services.data.config_manager import APP_DIR
 from src.services.data.enums import Modes
 from src.services.data.utils import rad_to_deg
 from .coordinate_correction import corregir_xy, corregir_z
+from .workspace_map import get_workspace_map
 
 
 class KinematicsController(QObject):
@@ -48,11 +54,22 @@ class KinematicsController(QObject):
         self._first_kinematic_entry = True
         self.kinematics_widget = KinematicsWidget(parent)
         self.kinematics_worker = KinematicsWorker()
+        ik_cache = ConfigSignalManager.get_instance().get_param(
+            "settings.json", "kinematics", "ik_cache", default={})
+        self.kinematics_worker.configure_ik_cache(
+            ik_cache.get("resolution_mm", 1.0), ik_cache.get("capacity", 256))
+        # Ganancias del PID (p. ej. las escritas por `pid_tuner --write`)
+        pid = ConfigSignalManager.get_instance().get_param(
+            "settings.json", "kinematics", "pid", default={})
+        self.kinematics_worker.configure_pid(**{
+            key: value for key, value in pid.items()
+            if key in KinematicsWorker.PID_DEFAULTS})
+        self._enable_trace_from_config()
 
         self.send_enabled.connect(self.kinematics_widget.set_send_enabled)
 
         # Temporizador de sincronización de UI a 30 Hz (33 ms): desacopla
-        # el renderizado del modelo 3D y los sliders del lazo PID a 100 Hz.
+        # el renderizado del modelo 3D y los sliders del lazo PID.
         self._ui_timer = QTimer(self)
         self._ui_timer.setInterval(33)
         self._ui_timer.timeout.connect(self._sync_ui)
@@ -60,12 +77,28 @@ class KinematicsController(QObject):
         self.__setup_connections()
         self.kinematics_worker.start()
 
+    def _enable_trace_from_config(self):
+        """Vuelca la traza del PID a `traces/` si está habilitada en settings.json."""
+        trace = ConfigSignalManager.get_instance().get_param(
+            "settings.json", "kinematics", "trace", default={})
+        if not trace.get("enabled", False):
+            return
+        fmt = trace.get("format", "csv")
+        trace_dir = APP_DIR / "traces"
+        trace_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = trace_dir / f"pid_{stamp}.{'csv' if fmt == 'csv' else 'bin'}"
+        self.kinematics_worker.enable_trace(path, fmt)
+        print(f"Traza del PID en {path}")
+
     def __setup_connections(self):
         """
         Configura las señales internas y globales para el feature.
         """
         # UI -> Controlador (Petición de movimiento)
         self.kinematics_widget.send_clicked.connect(self.execute_kinematics)
+        self.kinematics_widget.coordinates_changed.connect(
+            self._check_reachability)
 
         # Telemetría -> Worker: el KinematicsWorker la lee por polling del
         # RobotWorker (variables compartidas bajo cerrojo), por lo que no
@@ -104,6 +137,24 @@ class KinematicsController(QObject):
         Al entrar al modo Cartesiano ya se envio el home (ver
         `_on_global_mode_changed`); aqui se va al destino solicitado.
         """
+        tx, ty, tz = self._widget_target()
+        workspace = get_workspace_map()
+        if not workspace.is_solvable(tx, ty, tz):
+            clamped = workspace.clamp(tx, ty, tz)
+            print(f"Destino ({tx:.0f}, {ty:.0f}, {tz:.0f}) fuera del espacio de "
+                  f"trabajo; recortado a ({clamped[0]:.0f}, {clamped[1]:.0f}, {clamped[2]:.0f})")
+            tx, ty, tz = clamped
+
+        # Home ya enviado al entrar al modo; aqui se va al destino.
+        self.kinematics_worker.start_target_only(tx, ty, tz)
+
+    def _widget_target(self):
+        """
+        Convierte las coordenadas del widget al destino cartesiano del robot.
+
+        Returns:
+            tuple: (x, y, z) en mm con offset y corrección aplicados.
+        """
         coords = self.kinematics_widget.get_coordinates()
 
         # Aplicar offset y correccion de coordenadas
@@ -111,9 +162,13 @@ class KinematicsController(QObject):
         tx = tx + 110
         tz = corregir_z(tx, ty, tz)
         tx, ty = corregir_xy(tx, ty)
+        return tx, ty, tz
 
-        # Home ya enviado al entrar al modo; aqui se va al destino.
-        self.kinematics_worker.start_target_only(tx, ty, tz)
+    @pyqtSlot()
+    def _check_reachability(self):
+        """Marca en el widget si el destino actual es alcanzable."""
+        self.kinematics_widget.set_reachable(
+            get_workspace_map().is_solvable(*self._widget_target()))
 
     def execute_inverse_kinematics(self, coords: dict):
         """
@@ -212,8 +267,8 @@ class KinematicsController(QObject):
         """
         Inyecta la referencia al RobotWorker en el worker de cinemática.
 
-        Permite al KinematicsWorker leer la telemetría por polling de
-        forma segura (variables compartidas bajo cerrojo).
+        Permite al KinematicsWorker despertar con cada trama válida y
+        leerla mediante instantáneas atómicas (sin cerrojo).
 
         Args:
             robot_worker (RobotWorker): Worker serial del robot físico.
@@ -224,7 +279,7 @@ class KinematicsController(QObject):
         """
         Sincroniza el modelo 3D y los sliders con la posición actual
         del brazo físico a 30 Hz, desacoplando el renderizado del
-        lazo PID a 100 Hz.
+        lazo PID (que avanza con cada trama de telemetría).
         """
         # Usamos la posición COMANDADA (siempre disponible una vez
         # enviado un comando) en lugar de la telemetría física, para
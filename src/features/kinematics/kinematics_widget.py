@@ -6,6 +6,7 @@ ingresar las coordenadas X, Y, Z deseadas para el efector final del robot.
 
 Conexiones:
     - Emite `send_clicked` para notificar al controlador que se desea mover el robot.
+    - Emite `coordinates_changed` al editar cualquier eje (validación de alcance).
     - Soporta layouts dinámicos (horizontal/vertical) para adaptarse a la UI principal.
 """
 
@@ -23,8 +24,10 @@ class KinematicsWidget(QWidget):
 
     Attributes:
         send_clicked (pyqtSignal): Emite al presionar el boton 'Enviar'.
+        coordinates_changed (pyqtSignal): Emite al cambiar alguna coordenada.
     """
     send_clicked = pyqtSignal()
+    coordinates_changed = pyqtSignal()
 
     def __init__(self, parent=None):
         """
@@ -66,6 +69,7 @@ class KinematicsWidget(QWidget):
                 QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed))
             spin.setMaximumSize(QSize(200, 16777215))
             spin.setRange(s_min, s_max)
+            spin.valueChanged.connect(self.coordinates_changed)
             self._spins[self._keys[i]] = spin
 
             # Layout inicial vertical (etiqueta a la izquierda, spin a la derecha)
@@ -139,6 +143,12 @@ class KinematicsWidget(QWidget):
         """Habilita o deshabilita el botón Enviar."""
         self.coordinates_button.setEnabled(enabled)
 
+    def set_reachable(self, reachable: bool):
+        """Indica en el botón Enviar si el destino está fuera de alcance."""
+        self.coordinates_button.setToolTip(
+            "" if reachable else
+            "Fuera del espacio de trabajo: se enviará el punto alcanzable más cercano")
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
 
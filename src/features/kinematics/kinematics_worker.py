@@ -3,15 +3,22 @@ Módulo que define el KinematicsWorker para el cálculo de cinemática.
 
 Este módulo contiene la lógica para el cálculo de cinemática directa (CD) e
 inversa (CI) de un brazo robótico, además de gestionar el control
-realimentado mediante una máquina de estados ejecutándose de forma
-constante a 100 Hz dentro del hilo (QThread).
+realimentado mediante una máquina de estados dentro del hilo (QThread). El
+hilo permanece bloqueado hasta que llega una trama de telemetría válida,
+cambia la secuencia o vence el plazo del home físico.
 
 Conexiones:
     - Emite `commands_ready` cuando se calcula un nuevo comando de posición.
     - Emite `pid_iteration` en cada paso para el graficado cartesiano.
     - Emite `control_finished` al concluir la secuencia (rehabilita la UI).
-    - Lee la telemetría del RobotWorker por polling (variables compartidas
-      bajo cerrojo), evitando dependencias del event loop del hilo.
+    - Lee la telemetría del RobotWorker mediante instantáneas atómicas
+      (`snapshot`, sin cerrojo) y se despierta con un oyente registrado en
+      el RobotWorker, evitando dependencias del event loop del hilo.
+    - Mide con `LoopStats` el `dt` real entre tramas (normalizado a su
+      periodo típico para el PID), la latencia trama-control y las tramas
+      perdidas.
+    - Registra cada paso del PID en un `TraceRecorder` (sin `print` en el
+      lazo); `enable_trace` lo vuelca a disco desde otro hilo.
 """
 
 import math
@@ -20,15 +27,20 @@ import threading
 import numpy as np
 from PyQt6.QtCore import QThread, pyqtSignal
 from src.services.robot.robot_compensator import CartesianPidCompensator
+from src.services.data.timers import LoopStats
+from . import analytic_ik
+from .ik_cache import IkCache
+from . import trace_recorder
+from .trace_recorder import TraceRecorder, TraceWriter
 
 
 class KinematicsWorker(QThread):
     """
     Worker encargado exclusivamente del cálculo de cinemática y control.
 
-    Esta clase implementa algoritmos de cinemática directa e inversa iterativa
-    para controlar un brazo robótico de 4 grados de libertad (DOF) activos,
-    gobernado por una máquina de estados a 100 Hz.
+    Esta clase implementa cinemática directa e inversa (analítica, con
+    Newton-Raphson como respaldo) para controlar un brazo robótico de 4 grados de libertad (DOF) activos,
+    gobernado por una máquina de estados que avanza un paso por trama.
 
     Attributes:
         commands_ready (pyqtSignal): Señal que envía una lista de posiciones
@@ -36,23 +48,53 @@ class KinematicsWorker(QThread):
         error_occurred (pyqtSignal): Señal que envía un mensaje de error (str).
         pid_iteration (pyqtSignal): Señal que reporta (iter, actual, target).
         control_finished (pyqtSignal): Señal que indica fin de secuencia PID.
+        manipulability_updated (pyqtSignal): Manipulabilidad w (mm³) de la
+            configuración medida en cada paso PID (cercanía a singularidad).
     """
     commands_ready = pyqtSignal(list)
     error_occurred = pyqtSignal(str)
     pid_iteration = pyqtSignal(int, list, list)
     control_finished = pyqtSignal()
+    manipulability_updated = pyqtSignal(float)
 
     STATE_IDLE = "idle"
     STATE_PHYSICAL_HOMING = "physical_homing"
     STATE_PID_HOMING = "pid_homing"
     STATE_PID_TARGET = "pid_target"
 
+    # Paso con el que se sintonizaron las ganancias del PID (antes fijo en
+    # cada trama) y máximo admitido para el dt medido, de modo que una pausa
+    # larga no dispare el término integral. Las tramas reales llegan cada
+    # 20-40 ms, así que el dt medido se normaliza a su periodo típico
+    # (`_frame_period`): en régimen el PID ve DT_NOMINAL, como al sintonizar,
+    # y solo las variaciones de periodo (jitter, tramas perdidas) escalan
+    # los términos integral y derivativo.
+    DT_NOMINAL = 0.01
+    DT_MAX = 0.05
+    FRAME_PERIOD_ALPHA = 0.05
+
+    # Mínimos cuadrados amortiguados: manipulabilidad (mm³) por debajo de
+    # la cual se amortigua y amortiguamiento máximo λ (mm) en la singularidad.
+    DLS_W0 = 1.0e6
+    DLS_LAMBDA_MAX = 60.0
+
+    # Parámetros por defecto del PID cartesiano (sobrescritos desde
+    # settings.json `kinematics.pid`, p. ej. con los del `pid_tuner`).
+    PID_DEFAULTS = {
+        "kp": [1.5, 1.0, 1.38],
+        "ki": [0.9375, 0.0, 0.69],
+        "kd": [0.06, 0.0, 0.069],
+        "integral_clamp": 35.0,
+        "tolerance_mm": 5.0,
+        "dead_band_deg": 0.5,
+    }
+
     def __init__(self):
         """
         Inicializa el worker de cinemática con las dimensiones del robot.
 
         Define las longitudes de los eslabones y establece el estado inicial
-        del sistema de control (máquina de estados a 100 Hz).
+        del sistema de control (máquina de estados por evento).
         """
         super().__init__()
         self._links = [155.0, 92.0, 111.0, 8.0, 150.0]
@@ -63,15 +105,20 @@ class KinematicsWorker(QThread):
         self._has_real_telemetry = False
         self._target_pos = None
 
-        # --- Máquina de estados (100 Hz) ---
+        # --- Máquina de estados (despertada por telemetría) ---
         self._state = self.STATE_IDLE
         self._paused = False
         self._running = True
         self._robot_worker = None
         self._last_seen_telemetry_version = -1
+        self._telemetry_t_ns = 0
+        self._telemetry_dt = self.DT_NOMINAL
+        self._frame_period = 0.0
+        self._loop_stats = LoopStats(self.DT_NOMINAL, "kinematics", delay_name="latency")
         self._new_telemetry = False
         self._state_deadline = 0.0
         self._sequence_on_done = None
+        self._wake_event = threading.Event()
 
         # Objetivos de la secuencia
         self._tx_target = 0.0
@@ -88,9 +135,22 @@ class KinematicsWorker(QThread):
         self._pid_error_acumulado = np.zeros(3)
         self._pid_error_anterior = np.zeros(3)
         self._pid_primera_iteracion = True
-        self._dead_band_threshold_deg = 0.5
+        self._manipulability = float("nan")
+        self._kp = np.array(self.PID_DEFAULTS["kp"])
+        self._ki = np.array(self.PID_DEFAULTS["ki"])
+        self._kd = np.array(self.PID_DEFAULTS["kd"])
+        self._integral_clamp = self.PID_DEFAULTS["integral_clamp"]
+        self._tolerance_mm = self.PID_DEFAULTS["tolerance_mm"]
+        self._dead_band_threshold_deg = self.PID_DEFAULTS["dead_band_deg"]
         self._go_to_target_after_home = True
 
+        # Caché de soluciones de CI (objetivos repetidos de pick and place)
+        self._ik_cache = IkCache()
+
+        # Traza estructurada del PID (el volcado a disco es opcional)
+        self._trace = TraceRecorder()
+        self._trace_writer = None
+
         # Cerrojo para variables compartidas entre el hilo y la UI
         self._lock = threading.Lock()
 
@@ -112,7 +172,7 @@ class KinematicsWorker(QThread):
         return np.array([px, py, pz])
 
     @staticmethod
-    def _calcular_pseudoinversa(q, L=None):
+    def _calcular_jacobiano(q, L=None):
         if L is None:
             L = [155.0, 92.0, 111.0, 8.0, 150.0]
         t1, t2, t3, t4 = q
@@ -128,22 +188,129 @@ class KinematicsWorker(QThread):
         dz_dt2 = -L3 * s23 - L4 * c23 - L2 * s2 - L5 * s234
         dz_dt3 = -L3 * s23 - L4 * c23 - L5 * s234
         dz_dt4 = -L5 * s234
-        J = np.array([
+        return np.array([
             [-s1 * f,  c1 * df_dt2,  c1 * df_dt3,  c1 * df_dt4],
             [ c1 * f,  s1 * df_dt2,  s1 * df_dt3,  s1 * df_dt4],
             [ 0,       dz_dt2,       dz_dt3,       dz_dt4]
         ])
-        return np.linalg.pinv(J)
+
+    @staticmethod
+    def _calcular_pseudoinversa(q, L=None):
+        return np.linalg.pinv(KinematicsWorker._calcular_jacobiano(q, L))
+
+    @staticmethod
+    def _calcular_dls(q, L=None):
+        """
+        Inversa por mínimos cuadrados amortiguados J^T (J J^T + λ²I)^-1.
+
+        La matriz 3x3 se invierte en forma cerrada (adjunta / determinante).
+        El amortiguamiento λ² crece cuadráticamente a medida que la
+        manipulabilidad w = sqrt(det(J J^T)) cae por debajo de `DLS_W0`, y es
+        cero lejos de las singularidades, donde el resultado coincide con la
+        pseudoinversa.
+
+        Args:
+            q (np.ndarray): Ángulos [q1, q2, q3, q4] en radianes.
+            L (list, optional): Longitudes de los eslabones en mm.
+
+        Returns:
+            tuple: (J_dls (4x3), manipulabilidad w en mm³).
+        """
+        J = KinematicsWorker._calcular_jacobiano(q, L)
+        (a, b, c), (_, d, e), (_, _, f) = J @ J.T
+        # Cofactores de la matriz simétrica [[a b c] [b d e] [c e f]]
+        det = a * (d * f - e * e) - b * (b * f - c * e) + c * (b * e - c * d)
+        w = math.sqrt(max(det, 0.0))
+
+        ratio = w / KinematicsWorker.DLS_W0
+        lam2 = 0.0 if ratio >= 1.0 else (KinematicsWorker.DLS_LAMBDA_MAX * (1.0 - ratio)) ** 2
+        a, d, f = a + lam2, d + lam2, f + lam2
+        c00, c01, c02 = d * f - e * e, c * e - b * f, b * e - c * d
+        c11, c12, c22 = a * f - c * c, b * c - a * e, a * d - b * b
+        det = a * c00 + b * c01 + c * c02
+        inv = np.array([
+            [c00, c01, c02],
+            [c01, c11, c12],
+            [c02, c12, c22]
+        ]) / det
+        return J.T @ inv, w
 
     def cd(self, t1, t2, t3, t4):
         return self._cinematica_directa(np.array([t1, t2, t3, t4], dtype=float))
 
-    def ci(self, px, py, pz, max_iter=100, tol=1.0, gain=0.5):
+    def ci(self, px, py, pz, max_iter=100, tol=1.0, gain=0.5, pitch=None):
+        """
+        Calcula cinemática inversa para un objetivo.
+
+        Consulta primero la caché (objetivo cuantizado). Si no está, usa la
+        solución analítica (`analytic_ik.ik_best`) con el pitch de
+        herramienta más cercano al solicitado dentro de los límites físicos.
+        Solo si el objetivo no es alcanzable se recurre a Newton-Raphson,
+        partiendo de la solución en caché más cercana, del estado articular
+        medido o, en su defecto, del home angular.
+
+        Args:
+            px, py, pz (float): Coordenadas objetivo en mm.
+            max_iter (int): Máximo de iteraciones de Newton (respaldo).
+            tol (float): Tolerancia de convergencia en mm.
+            gain (float): Factor de amortiguación (0-1).
+            pitch (float, optional): Pitch preferido de la herramienta en
+                radianes (por defecto el del home angular).
+
+        Returns:
+            np.ndarray: Ángulos articulares [q1, q2, q3, q4] en radianes.
+        """
+        target = (px, py, pz)
+        q = self._ik_cache.get(target, pitch)
+        if q is not None:
+            return q
+
+        preferred = analytic_ik.HOME_PITCH if pitch is None else pitch
+        branch = analytic_ik.ik_best(px, py, pz, preferred, self._links)
+        if branch is not None:
+            q = branch.q
+        else:
+            q0 = self._ik_cache.nearest(target, max_distance=50.0)
+            if q0 is None:
+                q0 = self._measured_joint_angles()
+            q = self._ci_newton(px, py, pz, q0, max_iter, tol, gain)
+
+        self._ik_cache.put(target, q, pitch)
+        return q.copy()
+
+    def _measured_joint_angles(self):
+        """
+        Ángulos articulares [q1, q2, q3, q4] (radianes) de la última
+        telemetría, o del home angular si no hay robot conectado.
+        """
+        with self._lock:
+            if not self._has_real_telemetry:
+                return np.radians([0.0, -45.0, 120.0, 30.0])
+            q_deg = CartesianPidCompensator.robotang_angulos(
+                *self._current_positions)
+        return np.radians([q_deg[0], q_deg[1], q_deg[2], q_deg[4]])
+
+    def ci_branches(self, px, py, pz, pitch=analytic_ik.HOME_PITCH):
+        """
+        Calcula todas las ramas analíticas (codo arriba/abajo, base frontal
+        o girada) para un pitch de herramienta fijo.
+
+        Args:
+            px, py, pz (float): Coordenadas objetivo en mm.
+            pitch (float): Pitch de la herramienta en radianes.
+
+        Returns:
+            list[analytic_ik.IkBranch]: Ramas alcanzables.
+        """
+        return analytic_ik.ik_branches(px, py, pz, pitch, self._links)
+
+    def _ci_newton(self, px, py, pz, q0, max_iter=100, tol=1.0, gain=0.5):
         """
-        Calcula cinemática inversa iterativa (Newton-Raphson) para un objetivo.
+        Cinemática inversa iterativa (Newton-Raphson) desde `q0`.
 
         Args:
             px, py, pz (float): Coordenadas objetivo en mm.
+            q0 (np.ndarray): Ángulos iniciales en radianes.
             max_iter (int): Máximo de iteraciones.
             tol (float): Tolerancia de convergencia en mm.
             gain (float): Factor de amortiguación (0-1).
@@ -151,7 +318,8 @@ class KinematicsWorker(QThread):
         Returns:
             np.ndarray: Ángulos articulares [q1, q2, q3, q4] en radianes.
         """
-        q = np.zeros(4, dtype=float)
+        q = np.array(q0, dtype=float)
+        q[0] = math.atan2(py, px)
         target = np.array([px, py, pz], dtype=float)
 
         for _ in range(max_iter):
@@ -161,7 +329,7 @@ class KinematicsWorker(QThread):
             if np.linalg.norm(error) < tol:
                 break
 
-            J_inv = self._calcular_pseudoinversa(q)
+            J_inv, _ = self._calcular_dls(q)
             dq = J_inv @ error
             q = q + dq * gain
             q = CartesianPidCompensator.apply_physical_limits(q)
@@ -188,44 +356,80 @@ class KinematicsWorker(QThread):
 
     def _send_servo_command(self, q_deg_list):
         servo_positions = CartesianPidCompensator.angulos_robotang(*q_deg_list)
-        rounded = [round(p, 1) for p in servo_positions]
-        print(f"[CMD] servo_positions={rounded}")
         self._emit_servo_positions(servo_positions)
+        return servo_positions
 
-    # --- Bucle principal (máquina de estados a 100 Hz) ---
+    # --- Bucle principal (máquina de estados por evento) ---
 
     def run(self):
         """
-        Bucle del hilo: sincroniza telemetría y ejecuta la máquina de
-        estados a ~100 Hz (10 ms) de forma ininterrumpida.
+        Bucle del hilo: espera un evento (trama válida, cambio de secuencia
+        o plazo del home físico), sincroniza telemetría y ejecuta un paso
+        de la máquina de estados. En IDLE no hay despertares periódicos.
         """
         while self._running:
+            self._wake_event.wait(self._wait_timeout())
+            self._wake_event.clear()
             self._sync_telemetry()
             if not self._paused:
                 self._state_machine_step()
-            time.sleep(0.01)
+
+    def _wake(self):
+        """Despierta al hilo de control (seguro desde cualquier hilo)."""
+        self._wake_event.set()
+
+    def _wait_timeout(self):
+        """
+        Calcula cuánto puede dormir el hilo sin perder un plazo.
+
+        Solo el home físico tiene plazo propio; el resto de estados avanzan
+        únicamente con telemetría nueva o con órdenes de la UI.
+
+        Returns:
+            float | None: Segundos hasta el plazo o None (sin límite).
+        """
+        if self._state != self.STATE_PHYSICAL_HOMING or self._paused:
+            return None
+        remaining = self._state_deadline - time.monotonic()
+        return remaining if remaining > 0 else None
 
     def _sync_telemetry(self):
         """
-        Obtiene la telemetría más reciente del RobotWorker por polling.
+        Obtiene la telemetría más reciente del RobotWorker.
 
-        Solo marca datos nuevos cuando el contador de telemetría avanza,
-        de modo que el PID ejecuta un paso por cada trama física recibida.
+        Usa una única instantánea atómica (`RobotWorker.snapshot`) para
+        que posiciones, secuencia y marca de tiempo provengan de la misma
+        trama, sin tomar el cerrojo del hilo serial. Solo marca datos nuevos
+        cuando la secuencia avanza, de modo que el PID ejecuta un paso por
+        cada trama física aceptada.
         """
         if self._robot_worker is None:
             return
-        version = self._robot_worker.get_telemetry_counter()
-        if version == self._last_seen_telemetry_version:
+        snapshot = self._robot_worker.snapshot()
+        if snapshot is None:
             return
-        self._last_seen_telemetry_version = version
-
-        pos = self._robot_worker.get_last_positions_locked()
-        temps = self._robot_worker.get_last_temperatures_locked()
-        if not any(p is not None for p in pos[:4]):
+        if snapshot.sequence == self._last_seen_telemetry_version:
             return
+        skipped = snapshot.sequence - self._last_seen_telemetry_version - 1
+        self._last_seen_telemetry_version = snapshot.sequence
+
+        dt = self.DT_NOMINAL
+        if self._telemetry_t_ns:
+            measured = (snapshot.t_ns - self._telemetry_t_ns) / 1e9
+            self._loop_stats.record(
+                measured, (time.monotonic_ns() - snapshot.t_ns) / 1e9, max(skipped, 0))
+            measured = min(max(measured, 1e-3), self.DT_MAX)
+            if self._frame_period:
+                self._frame_period += self.FRAME_PERIOD_ALPHA * (
+                    measured - self._frame_period)
+            else:
+                self._frame_period = measured
+            dt = self.DT_NOMINAL * measured / self._frame_period
 
         with self._lock:
-            self._current_positions = list(pos)
+            self._current_positions = snapshot.positions
+            self._telemetry_t_ns = snapshot.t_ns
+            self._telemetry_dt = dt
             self._has_real_telemetry = True
             self._new_telemetry = True
 
@@ -239,6 +443,7 @@ class KinematicsWorker(QThread):
             home_l = self._home_limits
             final_t = self._final_target
             final_l = self._target_limits
+            dt = self._telemetry_dt
 
         if state == self.STATE_IDLE:
             return
@@ -246,7 +451,7 @@ class KinematicsWorker(QThread):
             return
 
         if state == self.STATE_PHYSICAL_HOMING:
-            if time.time() >= self._state_deadline:
+            if time.monotonic() >= self._state_deadline:
                 self._enter_pid_home()
             return
 
@@ -256,13 +461,13 @@ class KinematicsWorker(QThread):
             self._new_telemetry = False
 
         if state == self.STATE_PID_HOMING:
-            if self._pid_step(home_t, home_l):
+            if self._pid_step(home_t, home_l, dt):
                 if self._go_to_target_after_home:
                     self._enter_pid_target()
                 else:
                     self._finish_sequence()
         elif state == self.STATE_PID_TARGET:
-            if self._pid_step(final_t, final_l):
+            if self._pid_step(final_t, final_l, dt):
                 self._finish_sequence()
 
     # --- Transiciones de estado ---
@@ -273,7 +478,7 @@ class KinematicsWorker(QThread):
         home_servos = CartesianPidCompensator.angulos_robotang(
             0, -45, 120, 0, 30, 0)
         self._emit_servo_positions(home_servos)
-        self._state_deadline = time.time() + 2.5
+        self._state_deadline = time.monotonic() + 2.5
 
     def _enter_pid_home(self):
         """Inicia el control PID hacia el Home Cartesiano [185, 0, 170]."""
@@ -313,13 +518,15 @@ class KinematicsWorker(QThread):
 
     # --- Paso de control PID cartesiano ---
 
-    def _pid_step(self, target, limits):
+    def _pid_step(self, target, limits, dt=DT_NOMINAL):
         """
         Ejecuta un paso del PID cartesiano hacia `target`.
 
         Args:
             target (np.ndarray): Objetivo cartesiano [x, y, z] en mm.
             limits (list): Límites físicos por articulación.
+            dt (float): Tiempo entre tramas normalizado al periodo típico
+                (DT_NOMINAL en régimen) para la integral y la derivada.
 
         Returns:
             bool: True si se alcanzó la estabilidad (fin de fase).
@@ -339,64 +546,53 @@ class KinematicsWorker(QThread):
         error_actual = target - p_actual
         dist_total = np.linalg.norm(error_actual)
 
-        if self._pid_iteracion % 100 == 0:
-            print(f"[PID] tick {self._pid_iteracion} "
-                  f"actual=({p_actual[0]:.1f}, {p_actual[1]:.1f}, {p_actual[2]:.1f}) "
-                  f"target=({target[0]:.1f}, {target[1]:.1f}, {target[2]:.1f}) "
-                  f"error=({error_actual[0]:.1f}, {error_actual[1]:.1f}, {error_actual[2]:.1f}) "
-                  f"dist={dist_total:.2f}")
+        record = self._trace.begin()
+        record["iteration"] = self._pid_iteracion
+        record["p_actual"] = p_actual
+        record["target"] = target
+        record["error"] = error_actual
 
-        TOLERANCIAS = [5.0, 5.0, 5.0]
         error_abs = np.abs(error_actual)
-        if (error_abs[0] < TOLERANCIAS[0] and
-                error_abs[1] < TOLERANCIAS[1] and
-                error_abs[2] < TOLERANCIAS[2]):
+        if np.all(error_abs < self._tolerance_mm):
             self._pid_contador_estabilidad += 1
             self._pid_error_anterior = error_actual.copy()
-            if self._pid_contador_estabilidad >= 10:
-                print(f"[PID] CONVERGIO en iteracion {self._pid_iteracion}!")
-                return True
-            return False
+            converged = self._pid_contador_estabilidad >= 10
+            record["events"] = trace_recorder.EVENT_IN_TOLERANCE | (
+                trace_recorder.EVENT_CONVERGED if converged else 0)
+            self._trace.commit()
+            return converged
         else:
             if self._pid_contador_estabilidad > 0:
-                print(f"[PID] perdio tolerancia estabilidad={self._pid_contador_estabilidad}")
+                record["events"] = trace_recorder.EVENT_LOST_TOLERANCE
             self._pid_contador_estabilidad = 0
 
-        KP_EJES = np.array([1.5, 1.0, 1.38])
-        KI_EJES = np.array([0.9375, 0.0, 0.69])
-        KD_EJES = np.array([0.06, 0.0, 0.069])
-
-        P = error_actual * KP_EJES
+        P = error_actual * self._kp
 
         umbral_mm = 1.5
         if dist_total < umbral_mm * 2:
             self._pid_error_acumulado *= 0.7
         else:
-            self._pid_error_acumulado += error_actual * 0.01
+            self._pid_error_acumulado += error_actual * dt
 
         self._pid_error_acumulado = np.clip(
-            self._pid_error_acumulado, -35, 35)
-        I = self._pid_error_acumulado * KI_EJES
+            self._pid_error_acumulado, -self._integral_clamp, self._integral_clamp)
+        I = self._pid_error_acumulado * self._ki
 
         if self._pid_primera_iteracion:
             D = np.zeros(3)
             self._pid_primera_iteracion = False
         else:
-            d_cruda = (error_actual - self._pid_error_anterior) / 0.01
-            D = d_cruda * KD_EJES
+            d_cruda = (error_actual - self._pid_error_anterior) / dt
+            D = d_cruda * self._kd
 
         v_control = P + I + D
         self._pid_error_anterior = error_actual.copy()
 
-        J_inv = self._calcular_pseudoinversa(q_actual_rad)
+        J_inv, self._manipulability = self._calcular_dls(q_actual_rad)
+        self.manipulability_updated.emit(self._manipulability)
         dq = J_inv @ v_control
 
-        dq_deg = np.degrees(dq)
-        umbral_motor = 0.5
-        for j in range(len(dq_deg)):
-            if 0 < abs(dq_deg[j]) < umbral_motor:
-                dq_deg[j] += np.sign(dq_deg[j]) * umbral_motor
-        dq = np.radians(dq_deg)
+        dq = self._apply_dead_band(dq)
 
         q_next_rad = CartesianPidCompensator.apply_physical_limits(
             q_actual_rad + dq, limits)
@@ -404,16 +600,33 @@ class KinematicsWorker(QThread):
         q_out_deg = np.degrees(q_next_rad)
         q_final = [q_out_deg[0], q_out_deg[1], q_out_deg[2],
                    0, q_out_deg[3], -80]
-        print(f"[PID] servo_cmd q_out_deg=({q_out_deg[0]:.1f}, {q_out_deg[1]:.1f}, "
-              f"{q_out_deg[2]:.1f}, {q_out_deg[3]:.1f})")
-        self._send_servo_command(q_final)
+        record["p"] = P
+        record["i"] = I
+        record["d"] = D
+        record["dq"] = dq
+        record["command"] = self._send_servo_command(q_final)
+        record["events"] |= trace_recorder.EVENT_COMMAND
+        self._trace.commit()
         return False
 
     # --- API de secuencia (invocada desde el controlador / UI) ---
 
     def set_robot_worker(self, robot_worker):
-        """Inyecta la referencia al RobotWorker para el polling de telemetría."""
+        """
+        Inyecta la referencia al RobotWorker y se suscribe a sus tramas
+        válidas para despertar el lazo de control.
+        """
+        if self._robot_worker is not None:
+            self._robot_worker.remove_telemetry_listener(self._wake)
+        with self._lock:
+            # La secuencia y la marca de tiempo son propias de cada worker
+            self._last_seen_telemetry_version = -1
+            self._telemetry_t_ns = 0
+            self._frame_period = 0.0
         self._robot_worker = robot_worker
+        if robot_worker is not None:
+            robot_worker.add_telemetry_listener(self._wake)
+        self._wake()
 
     def start_full_sequence(self, tx, ty, tz, on_done=None):
         """
@@ -428,6 +641,7 @@ class KinematicsWorker(QThread):
         self._sequence_on_done = on_done
         self._pid_stop()
         self._enter_physical_home()
+        self._wake()
 
     def start_target_only(self, tx, ty, tz):
         """
@@ -440,6 +654,7 @@ class KinematicsWorker(QThread):
         self._target_pos = np.array([tx, ty, tz], dtype=float)
         self._pid_stop()
         self._enter_pid_home()
+        self._wake()
 
     def go_home_sequence(self, on_done=None):
         """
@@ -451,6 +666,7 @@ class KinematicsWorker(QThread):
         self._sequence_on_done = on_done
         self._pid_stop()
         self._enter_physical_home()
+        self._wake()
 
     def send_home_only(self):
         """Home físico sin PID — solo al cambiar a modo Cinemática."""
@@ -473,14 +689,18 @@ class KinematicsWorker(QThread):
     def resume_pid(self):
         """Reanuda el lazo PID cartesiano."""
         self._paused = False
+        self._wake()
 
     def set_paused(self, paused: bool):
         """Pausa/reanuda el control (API alternativa)."""
         self._paused = paused
+        self._wake()
 
     def stop(self):
         """Detiene el hilo de ejecución de forma ordenada."""
         self._running = False
+        self.disable_trace()
+        self._wake()
         self.quit()
         self.wait()
 
@@ -511,6 +731,127 @@ class KinematicsWorker(QThread):
         with self._lock:
             return list(self._last_commanded_positions)
 
+    def get_loop_stats(self):
+        """
+        Obtiene las estadísticas del lazo de control.
+
+        `period_*` es el dt real entre tramas, `latency_*` la latencia desde
+        la recepción de la trama hasta su lectura y `overruns` las tramas
+        que el lazo no alcanzó a procesar.
+
+        Returns:
+            dict: Ver `LoopStats.get_stats`.
+        """
+        return self._loop_stats.get_stats()
+
+    def configure_ik_cache(self, resolution_mm: float, capacity: int):
+        """
+        Reemplaza la caché de CI con una nueva rejilla y capacidad.
+
+        Args:
+            resolution_mm (float): Tamaño de celda en mm.
+            capacity (int): Número máximo de soluciones almacenadas.
+        """
+        self._ik_cache = IkCache(resolution_mm, capacity)
+
+    def configure_pid(self, kp=None, ki=None, kd=None, integral_clamp=None,
+                      tolerance_mm=None, dead_band_deg=None):
+        """
+        Ajusta los parámetros del PID cartesiano (los omitidos se conservan).
+
+        Args:
+            kp, ki, kd (sequence, optional): Ganancias por eje [x, y, z].
+            integral_clamp (float, optional): Saturación del acumulador (mm·s).
+            tolerance_mm (float, optional): Tolerancia de llegada por eje.
+            dead_band_deg (float, optional): Compensación de banda muerta.
+        """
+        with self._lock:
+            if kp is not None:
+                self._kp = np.array(kp, dtype=float)
+            if ki is not None:
+                self._ki = np.array(ki, dtype=float)
+            if kd is not None:
+                self._kd = np.array(kd, dtype=float)
+            if integral_clamp is not None:
+                self._integral_clamp = float(integral_clamp)
+            if tolerance_mm is not None:
+                self._tolerance_mm = float(tolerance_mm)
+            if dead_band_deg is not None:
+                self._dead_band_threshold_deg = float(dead_band_deg)
+
+    def get_pid_params(self):
+        """
+        Obtiene los parámetros vigentes del PID cartesiano.
+
+        Returns:
+            dict: Mismas llaves que `PID_DEFAULTS`.
+        """
+        with self._lock:
+            return {
+                "kp": self._kp.tolist(),
+                "ki": self._ki.tolist(),
+                "kd": self._kd.tolist(),
+                "integral_clamp": self._integral_clamp,
+                "tolerance_mm": self._tolerance_mm,
+                "dead_band_deg": self._dead_band_threshold_deg,
+            }
+
+    def enable_trace(self, path, fmt: str = "csv"):
+        """
+        Comienza a volcar la traza del PID a disco desde un hilo aparte.
+
+        Args:
+            path (str | Path): Archivo destino.
+            fmt (str): 'csv' o 'binary' (`np.fromfile` con `TRACE_DTYPE`).
+        """
+        self.disable_trace()
+        self._trace_writer = TraceWriter(self._trace, path, fmt)
+        self._trace_writer.start()
+
+    def disable_trace(self):
+        """
+        Detiene el volcado de la traza (la grabación en memoria continúa).
+
+        Returns:
+            dict | None: Estadísticas del escritor detenido.
+        """
+        writer, self._trace_writer = self._trace_writer, None
+        if writer is None:
+            return None
+        writer.stop()
+        return writer.get_stats()
+
+    def get_trace(self, since: int = 0):
+        """
+        Obtiene los registros del PID posteriores a una secuencia.
+
+        Args:
+            since (int): Última secuencia ya consumida.
+
+        Returns:
+            np.ndarray: Registros con dtype `TRACE_DTYPE`.
+        """
+        return self._trace.since(since)
+
+    def get_ik_cache_stats(self):
+        """
+        Obtiene los contadores de aciertos/fallos de la caché de CI.
+
+        Returns:
+            dict: Ver `IkCache.get_stats`.
+        """
+        return self._ik_cache.get_stats()
+
+    def get_manipulability(self):
+        """
+        Obtiene la manipulabilidad del último paso PID.
+
+        Returns:
+            float: w = sqrt(det(J J^T)) en mm³ (NaN si aún no hay pasos);
+            valores por debajo de `DLS_W0` indican cercanía a singularidad.
+        """
+        return self._manipulability
+
     def get_target_pos(self):
         """
         Obtiene el objetivo cartesiano actual.
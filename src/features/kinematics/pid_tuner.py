@@ -0,0 +1,285 @@
+"""
+Sintonizador fuera de línea de las ganancias del PID cartesiano.
+
+Ejecuta exactamente `KinematicsWorker._pid_step` (sin arrancar el hilo)
+contra el modelo de servo del emulador (`ServoModel`: primer orden con
+límite de velocidad y banda muerta), a la cadencia nominal de telemetría.
+Cada conjunto de parámetros candidato se evalúa sobre los mismos objetivos
+aleatorios del espacio de trabajo, partiendo del home físico, y se mide:
+
+    - Iteraciones hasta la convergencia (retorno True de `_pid_step`).
+    - Sobreimpulso: cuánto rebasa el efector el objetivo en la dirección
+      del movimiento (mm).
+    - Tiempo de establecimiento: instante desde el que el error queda
+      dentro de la tolerancia en los tres ejes (s).
+
+La búsqueda es aleatoria en escala logarítmica alrededor de los parámetros
+vigentes, en varias rondas de radio decreciente, y reparte los candidatos
+entre procesos con `ProcessPoolExecutor`. La tolerancia de llegada no se
+optimiza (relajarla reduciría las iteraciones a costa de precisión).
+
+Uso:
+    python -m src.features.kinematics.pid_tuner --candidates 64 --targets 24
+    python -m src.features.kinematics.pid_tuner --write   # guarda el mejor
+
+Conexiones:
+    - Con `--write` guarda el mejor conjunto en settings.json
+      (`kinematics.pid`), que `KinematicsController` aplica al iniciar.
+"""
+
+import os
+import argparse
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.services.robot.robot_compensator import CartesianPidCompensator
+from src.services.robot.robot_emulator import ServoModel
+from .kinematics_batch import fk_batch
+from .kinematics_worker import KinematicsWorker
+
+# Home angular que envía el worker antes de la fase PID
+_HOME_SERVOS = CartesianPidCompensator.angulos_robotang(0, -45, 120, 0, 30, 0)
+_TARGET_LIMITS = [(-100, 100), (-90, 90), (-130, 130), (-90, 120)]
+_TUNED_KEYS = ("kp", "ki", "kd", "integral_clamp", "dead_band_deg")
+
+
+def sample_targets(count: int, seed: int = 0) -> np.ndarray:
+    """
+    Genera objetivos alcanzables representativos de la mesa de trabajo.
+
+    Args:
+        count (int): Número de objetivos.
+        seed (int): Semilla del generador.
+
+    Returns:
+        np.ndarray: Objetivos (count, 3) en mm.
+    """
+    rng = np.random.default_rng(seed)
+    limits = np.radians(_TARGET_LIMITS)
+    targets = []
+    while len(targets) < count:
+        q = rng.uniform(limits[:, 0], limits[:, 1], (count * 8, 4))
+        q[:, 0] = rng.uniform(-np.pi / 3, np.pi / 3, len(q))
+        p = fk_batch(q)
+        mask = (p[:, 0] > 120) & (p[:, 2] > 20) & (p[:, 2] < 250)
+        targets.extend(p[mask])
+    return np.array(targets[:count])
+
+
+def simulate(worker, target, plant, dt: float, max_ticks: int) -> dict:
+    """
+    Simula una fase PID desde el home físico hasta `target`.
+
+    Args:
+        worker (KinematicsWorker): Worker configurado (hilo sin arrancar).
+        target (np.ndarray): Objetivo cartesiano [x, y, z] en mm.
+        plant (dict): Parámetros de `ServoModel` (tau, max_speed, dead_band).
+        dt (float): Periodo de telemetría en segundos.
+        max_ticks (int): Iteraciones máximas antes de abandonar.
+
+    Returns:
+        dict: converged, ticks, overshoot_mm y settling_s.
+    """
+    servos = [ServoModel(p, **plant) for p in _HOME_SERVOS]
+    commands = []
+    trace = []
+    worker.commands_ready.connect(commands.append)
+    worker.pid_iteration.connect(lambda _, actual, __: trace.append(actual))
+    worker._reset_pid_state()
+    converged = False
+    try:
+        for _ in range(max_ticks):
+            worker._current_positions = [s.position for s in servos]
+            if worker._pid_step(target, _TARGET_LIMITS, dt):
+                converged = True
+                break
+            if commands:
+                for servo, command in zip(servos, commands[-1]):
+                    servo.target = command
+                commands.clear()
+            for servo in servos:
+                servo.step(dt)
+    finally:
+        worker.commands_ready.disconnect()
+        worker.pid_iteration.disconnect()
+
+    errors = target - np.array(trace)
+    direction = errors[0] / max(np.linalg.norm(errors[0]), 1e-9)
+    overshoot = max(0.0, float(-(errors @ direction).min()))
+    outside = np.flatnonzero(np.any(np.abs(errors) >= worker._tolerance_mm, axis=1))
+    settled = outside[-1] + 1 if len(outside) else 0
+    return {
+        "converged": converged,
+        "ticks": len(trace),
+        "overshoot_mm": overshoot,
+        "settling_s": float(settled * dt),
+    }
+
+
+def evaluate(params: dict, targets, plant: dict, dt: float = 0.01,
+             max_ticks: int = 600) -> dict:
+    """
+    Evalúa un conjunto de parámetros sobre todos los objetivos.
+
+    Los objetivos no convergidos cuentan como `2 * max_ticks` en el costo.
+
+    Args:
+        params (dict): Argumentos de `KinematicsWorker.configure_pid`.
+        targets (np.ndarray): Objetivos (N, 3) en mm.
+        plant (dict): Parámetros de `ServoModel`.
+        dt (float): Periodo de telemetría en segundos.
+        max_ticks (int): Iteraciones máximas por objetivo.
+
+    Returns:
+        dict: params, cost y métricas agregadas.
+    """
+    worker = KinematicsWorker()
+    worker.configure_pid(**params)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        runs = [simulate(worker, np.asarray(t, dtype=float), plant, dt, max_ticks)
+                for t in targets]
+
+    converged = np.array([r["converged"] for r in runs])
+    ticks = np.array([r["ticks"] for r in runs], dtype=float)
+    overshoot = np.array([r["overshoot_mm"] for r in runs])
+    settling = np.array([r["settling_s"] for r in runs])
+    penalized = np.where(converged, ticks, 2 * max_ticks)
+    return {
+        "params": params,
+        "cost": float(penalized.mean() + 2.0 * overshoot.mean()),
+        "success_rate": float(converged.mean()),
+        "ticks_mean": float(ticks[converged].mean()) if converged.any() else float("nan"),
+        "ticks_p95": float(np.percentile(ticks[converged], 95)) if converged.any() else float("nan"),
+        "overshoot_mean_mm": float(overshoot.mean()),
+        "settling_mean_s": float(settling.mean()),
+    }
+
+
+def perturb(params: dict, sigma: float, rng) -> dict:
+    """
+    Genera un candidato multiplicando cada parámetro por exp(N(0, sigma)).
+
+    Las ganancias nulas permanecen nulas (se respeta la estructura P/PI/PID
+    de cada eje).
+
+    Args:
+        params (dict): Parámetros base.
+        sigma (float): Desviación en escala logarítmica.
+        rng (np.random.Generator): Generador aleatorio.
+
+    Returns:
+        dict: Nuevo conjunto de parámetros.
+    """
+    candidate = dict(params)
+    for key in _TUNED_KEYS:
+        value = np.asarray(params[key], dtype=float)
+        scaled = value * np.exp(rng.normal(0.0, sigma, value.shape))
+        candidate[key] = scaled.round(4).tolist() if value.ndim else round(float(scaled), 4)
+    return candidate
+
+
+def tune(base: dict, targets, plant: dict, candidates: int = 64,
+         rounds: int = 3, sigma: float = 0.5, workers=None, seed: int = 0,
+         dt: float = 0.01, max_ticks: int = 600, log=print) -> list:
+    """
+    Búsqueda aleatoria por rondas alrededor del mejor conjunto.
+
+    Args:
+        base (dict): Parámetros iniciales (incluido en la evaluación).
+        targets (np.ndarray): Objetivos (N, 3) en mm.
+        plant (dict): Parámetros de `ServoModel`.
+        candidates (int): Candidatos por ronda.
+        rounds (int): Rondas; el radio se reduce a la mitad en cada una.
+        sigma (float): Radio inicial en escala logarítmica.
+        workers (int, optional): Procesos del pool (por defecto, núcleos).
+        seed (int): Semilla del generador.
+        dt (float): Periodo de telemetría en segundos.
+        max_ticks (int): Iteraciones máximas por objetivo.
+        log (callable): Función de registro de progreso.
+
+    Returns:
+        list: Resultados de `evaluate` ordenados por costo.
+    """
+    rng = np.random.default_rng(seed)
+    targets = np.asarray(targets, dtype=float)
+    results = []
+    best = base
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for round_index in range(rounds):
+            batch = [best] + [perturb(best, sigma, rng) for _ in range(candidates - 1)]
+            results.extend(pool.map(
+                evaluate, batch, [targets] * len(batch), [plant] * len(batch),
+                [dt] * len(batch), [max_ticks] * len(batch)))
+            results.sort(key=lambda r: r["cost"])
+            best = results[0]["params"]
+            log(f"ronda {round_index + 1}/{rounds}: costo={results[0]['cost']:.1f} "
+                f"éxito={results[0]['success_rate']:.0%} "
+                f"iteraciones={results[0]['ticks_mean']:.0f}")
+            sigma *= 0.5
+    return results
+
+
+def format_report(result: dict, label: str) -> str:
+    """Resume las métricas de un resultado en una línea."""
+    return (f"{label}: éxito={result['success_rate']:.0%} "
+            f"iteraciones media={result['ticks_mean']:.0f} p95={result['ticks_p95']:.0f} "
+            f"sobreimpulso={result['overshoot_mean_mm']:.1f} mm "
+            f"establecimiento={result['settling_mean_s']:.2f} s")
+
+
+def main():
+    """Punto de entrada por línea de comandos del sintonizador."""
+    parser = argparse.ArgumentParser(
+        description="Sintonizador fuera de línea del PID cartesiano.")
+    parser.add_argument("--candidates", type=int, default=64,
+                        help="Candidatos por ronda (default: 64).")
+    parser.add_argument("--rounds", type=int, default=3,
+                        help="Rondas de búsqueda (default: 3).")
+    parser.add_argument("--targets", type=int, default=24,
+                        help="Objetivos simulados por candidato (default: 24).")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Procesos en paralelo (default: núcleos).")
+    parser.add_argument("--rate", type=float, default=100.0,
+                        help="Tramas de telemetría por segundo (default: 100).")
+    parser.add_argument("--max-ticks", type=int, default=600,
+                        help="Iteraciones máximas por objetivo (default: 600).")
+    parser.add_argument("--tau", type=float, default=0.08,
+                        help="Constante de tiempo de los servos en s (default: 0.08).")
+    parser.add_argument("--max-speed", type=float, default=120.0,
+                        help="Velocidad máxima de los servos en grados/s (default: 120).")
+    parser.add_argument("--dead-band", type=float, default=0.3,
+                        help="Banda muerta de los servos en grados (default: 0.3).")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Semilla de objetivos y candidatos.")
+    parser.add_argument("--write", action="store_true",
+                        help="Guarda el mejor conjunto en settings.json.")
+    args = parser.parse_args()
+
+    from src.services.data import config_manager
+    base = dict(KinematicsWorker.PID_DEFAULTS)
+    base.update(config_manager.get("settings.json", "kinematics", "pid", default={}))
+    plant = {"tau": args.tau, "max_speed": args.max_speed, "dead_band": args.dead_band}
+    targets = sample_targets(args.targets, args.seed)
+    dt = 1.0 / args.rate
+
+    baseline = evaluate(base, targets, plant, dt, args.max_ticks)
+    print(format_report(baseline, "actual"))
+    results = tune(base, targets, plant, args.candidates, args.rounds,
+                   workers=args.workers, seed=args.seed, dt=dt,
+                   max_ticks=args.max_ticks)
+    best = results[0]
+    print(format_report(best, "mejor"))
+    print(f"parámetros: {best['params']}")
+
+    if args.write:
+        if best["cost"] < baseline["cost"]:
+            config_manager.set_value("settings.json", ["kinematics", "pid"], best["params"])
+            print(f"Guardado en {config_manager.CONFIG_DIR / 'settings.json'}")
+        else:
+            print("Ningún candidato mejora los parámetros actuales; no se guarda.")
+
+
+if __name__ == "__main__":
+    main()
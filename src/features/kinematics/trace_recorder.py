@@ -0,0 +1,223 @@
+"""
+Registro estructurado de alta frecuencia del lazo PID cartesiano.
+
+Sustituye los `print` por tick del `KinematicsWorker`: cada paso del PID
+escribe un registro en un arreglo estructurado de NumPy preasignado
+
+    (seq, t_ns, iteration, events, p_actual[3], target[3], error[3],
+     p[3], i[3], d[3], dq[4], command[6])
+
+sin formatear texto ni tocar la E/S. Igual que `TelemetryRing`, hay un
+único escritor (el hilo de cinemática) y los lectores no toman cerrojos:
+validan cada registro copiado con su número de secuencia.
+
+Solo cuando el registro está habilitado, un `TraceWriter` en segundo plano
+drena periódicamente los registros nuevos a disco, en binario crudo
+(`np.fromfile(path, dtype=TRACE_DTYPE)`) o en CSV.
+
+Conexiones:
+    - Lo escribe `KinematicsWorker._pid_step`.
+    - `KinematicsController` lo habilita según settings.json
+      (`kinematics.trace`).
+"""
+
+import time
+import threading
+import numpy as np
+
+# Eventos por registro
+EVENT_IN_TOLERANCE = 0x01   # Error dentro de la tolerancia en los tres ejes
+EVENT_CONVERGED = 0x02      # Fin de fase (estabilidad alcanzada)
+EVENT_LOST_TOLERANCE = 0x04  # Salió de la tolerancia tras estar dentro
+EVENT_COMMAND = 0x08        # Se envió un comando a los servos
+
+TRACE_DTYPE = np.dtype([
+    ("seq", np.int64),
+    ("t_ns", np.int64),
+    ("iteration", np.int32),
+    ("events", np.uint8),
+    ("p_actual", np.float64, (3,)),
+    ("target", np.float64, (3,)),
+    ("error", np.float64, (3,)),
+    ("p", np.float64, (3,)),
+    ("i", np.float64, (3,)),
+    ("d", np.float64, (3,)),
+    ("dq", np.float64, (4,)),
+    ("command", np.float64, (6,)),
+])
+
+
+class TraceRecorder:
+    """
+    Buffer circular de registros del PID de un escritor sin cerrojo.
+
+    El escritor obtiene la ranura con `begin`, llena los campos y la
+    publica con `commit`; mientras tanto la ranura queda invalidada
+    (`seq = -1`) para los lectores.
+
+    Args:
+        capacity (int): Número de registros conservados.
+    """
+
+    def __init__(self, capacity: int = 4096):
+        self._capacity = int(capacity)
+        self._data = np.zeros(self._capacity, dtype=TRACE_DTYPE)
+        self._data["seq"] = -1
+        self._head = 0
+
+    # --- Escritura (solo hilo de cinemática) ---
+
+    def begin(self) -> np.void:
+        """
+        Reserva la siguiente ranura y la limpia.
+
+        Returns:
+            np.void: Vista del registro a llenar (campos numéricos en NaN,
+            salvo los que se asignen antes de `commit`).
+        """
+        seq = self._head + 1
+        record = self._data[seq % self._capacity]
+        record["seq"] = -1
+        record["t_ns"] = time.monotonic_ns()
+        record["events"] = 0
+        for name in ("p", "i", "d", "dq", "command"):
+            record[name] = np.nan
+        return record
+
+    def commit(self):
+        """Publica la ranura reservada por `begin`."""
+        seq = self._head + 1
+        self._data[seq % self._capacity]["seq"] = seq
+        self._head = seq
+
+    # --- Lectura (cualquier hilo) ---
+
+    def sequence(self) -> int:
+        """
+        Obtiene la secuencia del último registro publicado.
+
+        Returns:
+            int: 0 si aún no hay registros.
+        """
+        return self._head
+
+    def since(self, seq: int) -> np.ndarray:
+        """
+        Obtiene copia de los registros con secuencia mayor que `seq`.
+
+        Args:
+            seq (int): Última secuencia ya consumida por el lector.
+
+        Returns:
+            np.ndarray: Registros consistentes en orden cronológico.
+        """
+        head = self._head
+        first = max(int(seq) + 1, head - self._capacity + 1, 1)
+        if head < first:
+            return np.empty(0, dtype=TRACE_DTYPE)
+        expected = np.arange(first, head + 1)
+        out = self._data[expected % self._capacity]
+        valid = out["seq"] == expected
+        if valid.all():
+            return out
+        # El escritor alcanzó el inicio del rango: conservar el sufijo íntegro
+        return out[int(np.flatnonzero(~valid)[-1]) + 1:]
+
+
+def csv_header() -> str:
+    """Encabezado CSV con una columna por componente de cada campo."""
+    columns = []
+    for name in TRACE_DTYPE.names:
+        shape = TRACE_DTYPE[name].shape
+        if shape:
+            columns.extend(f"{name}_{k}" for k in range(shape[0]))
+        else:
+            columns.append(name)
+    return ",".join(columns)
+
+
+def to_rows(records: np.ndarray) -> np.ndarray:
+    """
+    Aplana registros estructurados a una matriz (N, columnas).
+
+    Args:
+        records (np.ndarray): Registros con dtype `TRACE_DTYPE`.
+
+    Returns:
+        np.ndarray: Matriz float64 en el orden de `csv_header`.
+    """
+    return np.column_stack([
+        records[name].reshape(len(records), -1).astype(np.float64)
+        for name in TRACE_DTYPE.names])
+
+
+class TraceWriter:
+    """
+    Hilo en segundo plano que drena un `TraceRecorder` a disco.
+
+    Args:
+        recorder (TraceRecorder): Origen de los registros.
+        path (str | Path): Archivo destino (se sobrescribe).
+        fmt (str): 'csv' o 'binary'.
+        period_s (float): Intervalo entre drenajes en segundos.
+    """
+
+    def __init__(self, recorder: TraceRecorder, path, fmt: str = "csv",
+                 period_s: float = 0.25):
+        if fmt not in ("csv", "binary"):
+            raise ValueError(f"Formato de traza desconocido: {fmt}")
+        self._recorder = recorder
+        self._path = path
+        self._fmt = fmt
+        self._period = period_s
+        self._last_seq = recorder.sequence()
+        self._written = 0
+        self._lost = 0
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="TraceWriter", daemon=True)
+
+    def start(self):
+        """Abre el archivo y arranca el hilo de drenaje."""
+        self._file = open(self._path, "w" if self._fmt == "csv" else "wb")
+        if self._fmt == "csv":
+            self._file.write(csv_header() + "\n")
+        self._thread.start()
+
+    def stop(self):
+        """Drena lo pendiente, detiene el hilo y cierra el archivo."""
+        self._stop_event.set()
+        self._thread.join()
+
+    def get_stats(self) -> dict:
+        """
+        Obtiene los contadores de escritura.
+
+        Returns:
+            dict: path, written y lost (registros sobrescritos antes de
+            drenarse).
+        """
+        return {"path": str(self._path), "written": self._written, "lost": self._lost}
+
+    def _run(self):
+        """Ciclo de drenaje periódico."""
+        try:
+            while not self._stop_event.wait(self._period):
+                self._drain()
+            self._drain()
+        finally:
+            self._file.close()
+
+    def _drain(self):
+        """Escribe los registros nuevos desde el último drenaje."""
+        records = self._recorder.since(self._last_seq)
+        if not len(records):
+            return
+        self._lost += int(records["seq"][0]) - self._last_seq - 1
+        self._last_seq = int(records["seq"][-1])
+        if self._fmt == "csv":
+            np.savetxt(self._file, to_rows(records), delimiter=",", fmt="%.6g")
+        else:
+            records.tofile(self._file)
+        self._file.flush()
+        self._written += len(records)
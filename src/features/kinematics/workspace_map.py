@@ -0,0 +1,288 @@
+"""
+Módulo del mapa de alcanzabilidad del espacio de trabajo.
+
+El mapa se genera muestreando los límites articulares con la cinemática
+directa por lotes. Como la base solo gira el plano del brazo, basta con
+barrer las articulaciones 2-4 en el plano (alcance con signo, z) y después
+proyectar cada vóxel del espacio 3D sobre ese plano con el giro de la base
+(directo o invertido 180°) que respete sus límites.
+
+El resultado es una rejilla de ocupación booleana (consulta O(1) por
+índice) y un KD-tree de los centros alcanzables para recortar objetivos al
+punto alcanzable más cercano. La rejilla se guarda en un `.npz` cuyo nombre
+depende de las longitudes de los eslabones, los límites y la resolución, por
+lo que cambiar cualquiera de ellos genera un mapa nuevo.
+
+En la frontera de la rejilla la discretización puede discrepar de la
+cinemática inversa, por lo que `is_solvable` usa el mapa solo como
+prefiltro y confirma con `ik_best`.
+
+Conexiones:
+    - `KinematicsController` recorta los destinos del widget cartesiano.
+    - `analytic_ik.ik_best` confirma los puntos de frontera.
+    - `PickExecutor` rechaza esferas fuera del espacio de trabajo antes de
+      solicitar la cinemática inversa.
+"""
+
+import hashlib
+import threading
+from pathlib import Path
+
+import numpy as np
+from scipy import ndimage
+from scipy.spatial import cKDTree
+
+from src.services.data.config_manager import CONFIG_DIR
+from src.services.robot.robot_compensator import CartesianPidCompensator
+from .analytic_ik import LINKS, ik_best
+from .kinematics_batch import fk_batch
+
+_CACHE_DIR = CONFIG_DIR.parent / "cache"
+
+
+class WorkspaceMap:
+    """
+    Rejilla de ocupación de los puntos alcanzables por el efector final.
+
+    Args:
+        occupancy (np.ndarray): Rejilla booleana (nx, ny, nz).
+        origin (np.ndarray): Centro del vóxel (0, 0, 0) en mm.
+        voxel_mm (float): Tamaño de vóxel en mm.
+        links (tuple): Longitudes de los eslabones usadas para confirmar con IK.
+        limits_deg (list, optional): Límites articulares [(min, max)] x 4.
+    """
+
+    # Centros alcanzables candidatos que se prueban al recortar
+    _CLAMP_CANDIDATES = 64
+
+    def __init__(self, occupancy, origin, voxel_mm: float, links=LINKS,
+                 limits_deg=None):
+        self._occupancy = np.asarray(occupancy, dtype=bool)
+        self._origin = np.asarray(origin, dtype=float)
+        self._voxel = float(voxel_mm)
+        self._shape = np.array(self._occupancy.shape)
+        self._links = tuple(links)
+        self._limits = limits_deg
+        self._tree = None
+        self._boundary = None
+
+    @classmethod
+    def build(cls, links=LINKS, limits_deg=None, voxel_mm: float = 10.0,
+              step_deg: float = 2.0):
+        """
+        Genera el mapa barriendo los límites articulares.
+
+        Args:
+            links (tuple): Longitudes (L1, L2, L3, L4, L5) en mm.
+            limits_deg (list, optional): Límites articulares [(min, max)] x 4.
+            voxel_mm (float): Tamaño de vóxel en mm.
+            step_deg (float): Paso angular del barrido en grados.
+
+        Returns:
+            WorkspaceMap: Mapa generado.
+        """
+        if limits_deg is None:
+            limits_deg = CartesianPidCompensator.LIMITS_DEG
+        reach = sum(links[1:])
+        plane_cell = voxel_mm / 2.0
+
+        # Barrido de las articulaciones 2-4 con la base en 0 (plano x-z)
+        t2, t3, t4 = (np.radians(np.arange(low, high + step_deg, step_deg))
+                      for low, high in limits_deg[1:])
+        grid = np.stack(np.meshgrid(0.0, t2, t3, t4, indexing="ij"),
+                        axis=-1).reshape(-1, 4)
+        plane_shape = (int(2 * reach / plane_cell) + 2,
+                       int(2 * reach / plane_cell) + 2)
+        plane = np.zeros(plane_shape, dtype=bool)
+        for start in range(0, len(grid), 65536):
+            P = fk_batch(grid[start:start + 65536], links)
+            ir = np.floor((P[:, 0] + reach) / plane_cell).astype(int)
+            iz = np.floor((P[:, 2] - links[0] + reach) / plane_cell).astype(int)
+            plane[ir, iz] = True
+        # Cierra los huecos que deja el paso finito del barrido
+        plane = ndimage.binary_closing(plane, iterations=2) | plane
+
+        # Proyección de cada vóxel sobre el plano con el giro de base válido
+        axis = np.arange(-reach, reach + voxel_mm, voxel_mm)
+        z_axis = axis + links[0]
+        X, Y, Z = np.meshgrid(axis, axis, z_axis, indexing="ij")
+        radius = np.hypot(X, Y)
+        base = np.arctan2(Y, X)
+        low, high = np.radians(limits_deg[0])
+        iz = np.floor((Z - links[0] + reach) / plane_cell).astype(int)
+
+        def lookup(signed_radius):
+            ir = np.floor((signed_radius + reach) / plane_cell).astype(int)
+            inside = ((ir >= 0) & (ir < plane_shape[0])
+                      & (iz >= 0) & (iz < plane_shape[1]))
+            hit = np.zeros(ir.shape, dtype=bool)
+            hit[inside] = plane[ir[inside], iz[inside]]
+            return hit
+
+        flipped = np.where(base > 0, base - np.pi, base + np.pi)
+        occupancy = (((base >= low) & (base <= high) & lookup(radius))
+                     | ((flipped >= low) & (flipped <= high) & lookup(-radius)))
+        origin = np.array([axis[0], axis[0], z_axis[0]])
+        return cls(occupancy, origin, voxel_mm, links, limits_deg)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Carga un mapa guardado con `save`.
+
+        Args:
+            path (Path): Ruta del archivo `.npz`.
+
+        Returns:
+            WorkspaceMap: Mapa cargado.
+        """
+        with np.load(path) as data:
+            return cls(np.unpackbits(data["occupancy"])[:int(np.prod(data["shape"]))]
+                       .reshape(data["shape"]).astype(bool),
+                       data["origin"], float(data["voxel_mm"]))
+
+    def save(self, path):
+        """
+        Guarda la rejilla comprimida en un `.npz`.
+
+        Args:
+            path (Path): Ruta destino.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            path, occupancy=np.packbits(self._occupancy.ravel()),
+            shape=self._shape, origin=self._origin, voxel_mm=self._voxel)
+
+    def _indices(self, points):
+        """Índices de vóxel (N, 3) y máscara de los que caen en la rejilla."""
+        idx = np.rint((points - self._origin) / self._voxel).astype(int)
+        inside = np.all((idx >= 0) & (idx < self._shape), axis=1)
+        return idx, inside
+
+    def reachable_batch(self, points) -> np.ndarray:
+        """
+        Consulta la alcanzabilidad de N puntos.
+
+        Args:
+            points (np.ndarray): Puntos cartesianos (N, 3) en mm.
+
+        Returns:
+            np.ndarray: (N,) bool.
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        idx, inside = self._indices(points)
+        result = np.zeros(len(points), dtype=bool)
+        i = idx[inside]
+        result[inside] = self._occupancy[i[:, 0], i[:, 1], i[:, 2]]
+        return result
+
+    def is_reachable(self, x: float, y: float, z: float) -> bool:
+        """
+        Indica si un punto cae en un vóxel alcanzable.
+
+        Args:
+            x, y, z (float): Coordenadas cartesianas en mm.
+
+        Returns:
+            bool: True si el punto es alcanzable.
+        """
+        return bool(self.reachable_batch([x, y, z])[0])
+
+    def is_solvable(self, x: float, y: float, z: float) -> bool:
+        """
+        Indica si la cinemática inversa tiene solución dentro de límites.
+
+        El mapa actúa como prefiltro: un punto fuera de la rejilla ocupada y
+        lejos de su frontera se descarta sin resolver; el resto se confirma
+        con `ik_best`, que en el interior suele resolverse en forma cerrada.
+
+        Args:
+            x, y, z (float): Coordenadas cartesianas en mm.
+
+        Returns:
+            bool: True si existe una configuración que alcanza el punto.
+        """
+        idx, inside = self._indices(np.array([[x, y, z]], dtype=float))
+        if not inside[0]:
+            return False
+        if self._boundary is None:
+            self._boundary = (ndimage.binary_dilation(self._occupancy)
+                              != ndimage.binary_erosion(self._occupancy))
+        i, j, k = idx[0]
+        if not self._occupancy[i, j, k] and not self._boundary[i, j, k]:
+            return False
+        return ik_best(x, y, z, links=self._links, limits_deg=self._limits) is not None
+
+    def clamp(self, x: float, y: float, z: float):
+        """
+        Recorta un punto al centro alcanzable más cercano.
+
+        Se prueban los centros más cercanos del mapa y se devuelve el primero
+        confirmado por `is_solvable`; si ninguno lo está, el más cercano.
+
+        Args:
+            x, y, z (float): Coordenadas cartesianas en mm.
+
+        Returns:
+            tuple: (x, y, z) sin cambios si ya es alcanzable.
+        """
+        if self.is_solvable(x, y, z):
+            return x, y, z
+        if self._tree is None:
+            centers = np.argwhere(self._occupancy) * self._voxel + self._origin
+            self._tree = cKDTree(centers)
+        _, candidates = self._tree.query([x, y, z], k=self._CLAMP_CANDIDATES)
+        for i in candidates:
+            center = tuple(float(v) for v in self._tree.data[i])
+            if self.is_solvable(*center):
+                return center
+        return tuple(float(v) for v in self._tree.data[candidates[0]])
+
+
+def cache_path(links=LINKS, limits_deg=None, voxel_mm: float = 10.0) -> Path:
+    """
+    Ruta del `.npz` asociado a una geometría y unos límites.
+
+    Args:
+        links (tuple): Longitudes de los eslabones en mm.
+        limits_deg (list, optional): Límites articulares [(min, max)] x 4.
+        voxel_mm (float): Tamaño de vóxel en mm.
+
+    Returns:
+        Path: Archivo dentro del directorio de caché de la aplicación.
+    """
+    if limits_deg is None:
+        limits_deg = CartesianPidCompensator.LIMITS_DEG
+    key = repr((tuple(map(float, links)),
+                tuple(tuple(map(float, lim)) for lim in limits_deg),
+                float(voxel_mm)))
+    digest = hashlib.sha1(key.encode()).hexdigest()[:12]
+    return _CACHE_DIR / f"workspace_{digest}.npz"
+
+
+_map = None
+_map_lock = threading.Lock()
+
+
+def get_workspace_map() -> WorkspaceMap:
+    """
+    Obtiene el mapa compartido; lo carga del disco o lo genera al primer uso.
+
+    Returns:
+        WorkspaceMap: Mapa de la geometría y límites por defecto.
+    """
+    global _map
+    if _map is None:
+        with _map_lock:
+            if _map is None:
+                path = cache_path()
+                try:
+                    _map = WorkspaceMap.load(path)
+                except (OSError, KeyError, ValueError):
+                    _map = WorkspaceMap.build()
+                    try:
+                        _map.save(path)
+                    except OSError as e:
+                        print(f"No se pudo guardar el mapa del espacio de trabajo: {e}")
+    return _map
@@ -2,6 +2,9 @@
 Módulo que define la base para los ejecutores de lógica de Pick and Place.
 """
 
+from src.features.kinematics.workspace_map import get_workspace_map
+from src.features.kinematics.coordinate_correction import corregir_xy, corregir_z
+
 class BaseExecutor:
     """Clase base para ejecutores de secuencias.
     
@@ -29,6 +32,19 @@ class BaseExecutor:
         updated[-1] = float(gripper_degrees + 150.0)
         return updated
 
+    def _is_reachable(self, coords):
+        """
+        Comprueba un objetivo cartesiano contra el mapa del espacio de trabajo,
+        confirmado con la cinemática inversa.
+
+        Aplica la misma corrección que `KinematicsController` antes de la
+        IK, de modo que se valida el punto que realmente se resuelve.
+        """
+        tx, ty, tz = coords['x'], coords['y'], coords['z']
+        tz = corregir_z(tx, ty, tz)
+        tx, ty = corregir_xy(tx, ty)
+        return get_workspace_map().is_solvable(tx, ty, tz)
+
     def _fail(self, reason):
         """Notifica fallo al worker."""
         self.worker._fail(reason)
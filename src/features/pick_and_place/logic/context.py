@@ -24,9 +24,12 @@ class PickPlaceContext:
         self.last_positions = None
         self.current_feedback = None
         self.current_target = None
+        # Instante (time.monotonic, s) en que debe terminar la trayectoria en curso
+        self.arrival_deadline = None
         
         # Constantes de control
         self.STALL_TIMEOUT_MS = 1500
+        self.ARRIVAL_MARGIN_MS = 500
         self.MOVEMENT_TOLERANCE = 0.5
         self.SUCCESS_THRESHOLD = 2.0
         self.ERROR_THRESHOLD = 5.0
@@ -37,4 +40,5 @@ class PickPlaceContext:
         self.place_target_coords = None
         self.ik_target = None
         self.current_target = None
+        self.arrival_deadline = None
         # Mantenemos sphere_poses y configuración de pinza
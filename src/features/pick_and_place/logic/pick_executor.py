@@ -35,11 +35,16 @@ class PickExecutor(BaseExecutor):
         x_comp = x + r*math.sin(1.5708 - angle)
         y_comp = y - r*math.cos(1.5708 - angle)
         above_z = 100
+        coords = {'x': y_comp, 'y': x_comp, 'z': above_z}
+        if not self._is_reachable(coords):
+            self.worker._fail(
+                f'La esfera {self.context.selected_color} está fuera del espacio de trabajo')
+            return
 
         self.worker.action_request.emit({
             'type': 'compute_ik',
             'color': self.context.selected_color,
-            'coords': {'x': y_comp, 'y': x_comp, 'z': above_z},
+            'coords': coords,
             'gripper_degrees': self.context.gripper_closed,
             'description': f'Calculando posición elevada para {self.context.selected_color}'
         })
@@ -88,11 +93,16 @@ class PickExecutor(BaseExecutor):
         angle = math.atan(x/(y+100))
         x_comp = x + r*math.sin(1.5708 - angle)
         y_comp = y - r*math.cos(1.5708 - angle)
+        coords = {'x': y_comp, 'y': x_comp, 'z': radius - 10.0}
+        if not self._is_reachable(coords):
+            self.worker._fail(
+                f'La esfera {self.context.selected_color} está fuera del espacio de trabajo')
+            return
 
         self.worker.action_request.emit({
             'type': 'compute_ik',
             'color': self.context.selected_color,
-            'coords': {'x': y_comp, 'y': x_comp, 'z': radius - 10.0},
+            'coords': coords,
             'gripper_degrees': self.context.gripper_open,
             'description': f'Calculando IK para esfera {self.context.selected_color}'
         })
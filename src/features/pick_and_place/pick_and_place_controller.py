@@ -78,6 +78,8 @@ class PickAndPlaceController(QObject):
             self.worker.on_target_reached)
         self.signal_manager.inverse_kinematics_ready.connect(
             self.worker.on_ik_ready)
+        self.signal_manager.trajectory_started.connect(
+            self.worker.on_trajectory_started)
 
         self.worker.action_request.connect(self._route_action)
         self.worker.sequence_completed.connect(self._on_sequence_completed)
@@ -212,7 +214,7 @@ class PickAndPlaceController(QObject):
         """
         action_type = action.get('type')
         if action_type == 'move':
-            self.sim_signals.update_target_signal.emit(action['target'])
+            self.signal_manager.move_requested.emit(action['target'])
         elif action_type == 'compute_ik':
             self.signal_manager.inverse_kinematics_requested.emit(action)
 
@@ -2,6 +2,8 @@
 Módulo que orquesta el PickAndPlaceWorker utilizando composición de ejecutores.
 """
 
+import time
+
 from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QTimer
 from src.features.pick_and_place.pick_place_states import PickPlaceState
 from src.features.pick_and_place.pick_place_state_machine import PickPlaceStateMachine
@@ -88,6 +90,14 @@ class PickAndPlaceWorker(QObject):
         self._state_stall_timer.stop()
         self._handle_movement_finished()
 
+    @pyqtSlot(float)
+    def on_trajectory_started(self, duration):
+        """Programa la verificación de llegada para el fin de la trayectoria."""
+        if self._state_stall_timer.isActive():
+            timeout_ms = int(duration * 1000) + self.context.ARRIVAL_MARGIN_MS
+            self.context.arrival_deadline = time.monotonic() + timeout_ms / 1000.0
+            self._state_stall_timer.start(timeout_ms)
+
     @pyqtSlot(dict)
     def on_ik_ready(self, result):
         current = self.current_state_value
@@ -153,7 +163,8 @@ class PickAndPlaceWorker(QObject):
                             self.context.last_positions = mapped
                             return
             if max_delta > self.context.MOVEMENT_TOLERANCE:
-                if self._state_stall_timer.isActive():
+                # Mientras la trayectoria no termina, el timer ya apunta a su fin
+                if self._state_stall_timer.isActive() and not self._arrival_pending():
                     self._state_stall_timer.start(self.context.STALL_TIMEOUT_MS)
 
         self.context.last_positions = mapped
@@ -162,8 +173,14 @@ class PickAndPlaceWorker(QObject):
 
     def _start_stall_timer(self):
         self.context.last_positions = None
+        self.context.arrival_deadline = None
         self._state_stall_timer.start(self.context.STALL_TIMEOUT_MS)
 
+    def _arrival_pending(self):
+        """Indica si la trayectoria en curso aún no alcanza su instante de llegada."""
+        deadline = self.context.arrival_deadline
+        return deadline is not None and time.monotonic() < deadline
+
     def _on_state_timeout(self):
         self._handle_movement_finished()
 
@@ -195,6 +212,7 @@ class PickAndPlaceWorker(QObject):
 
     def _advance_state(self):
         self._state_stall_timer.stop()
+        self.context.arrival_deadline = None
         current = self.current_state_value
         transitions = {
             PickPlaceState.HOMING.value: self._sm.homing_done,
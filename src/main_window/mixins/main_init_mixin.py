@@ -363,7 +363,7 @@ class MainInitMixin:
         self.robot_service.start_service()
 
         # Inyectar el RobotWorker al controlador de cinemática para el
-        # polling de telemetría seguro (variables compartidas bajo cerrojo).
+        # lazo de control despertado por telemetría (instantáneas sin cerrojo).
         self.kinematics_controller.set_robot_worker(
             self.robot_service.get_worker())
 
@@ -1,15 +1,17 @@
 """
 Paquete de servicios transversales de la aplicación.
 
-Proporciona los subsistemas de datos, dispositivos, robot, simulación,
-estilos, interfaz de usuario y visión artificial.
+Proporciona los subsistemas de datos, dispositivos, planificación de
+movimiento, robot, simulación, estilos, interfaz de usuario y visión
+artificial.
 """
 
-from . import data, devices, robot, simulation, styling, ui, vision
+from . import data, devices, motion, robot, simulation, styling, ui, vision
 
 __all__ = [
     "data",
     "devices",
+    "motion",
     "robot",
     "simulation",
     "styling",
@@ -85,6 +85,17 @@ DEFAULTS: dict[str, dict] = {
             "kinematics": False,
             "pick_place": False
         },
+        "robot": {"codec": "ascii"},
+        "kinematics": {
+            "ik_cache": {"resolution_mm": 1.0, "capacity": 256},
+            "trace": {"enabled": False, "format": "csv"},
+        },
+        "motion": {
+            "profile": "trapezoidal",
+            "max_velocity": 60.0,
+            "max_acceleration": 120.0,
+            "rate_hz": 20,
+        },
     },
     "camera.json": {
         "resolution": {"width": 1280, "height": 720, "fps": 30, },
@@ -108,6 +119,8 @@ DEFAULTS: dict[str, dict] = {
             "naranja": [5, 150, 150, 15, 255, 255],
             "morado": [130, 50, 50, 160, 255, 255],
         },
+        "tracker": {"enabled": True, "refresh_frames": 10, "window_scale": 2.5},
+        "board_lock": {"enabled": True, "stable_frames": 5},
     },
     "graphics.json": {
         "grid": {
@@ -23,6 +23,7 @@ from src.services.data.signals import (
 from src.services.data.enums import Modes, Units
 from src.services.data.timers import GlobalTimer
 from src.services.data.utils import deg_to_rad, rad_to_deg
+from src.services.motion import Trajectory, TrajectoryStreamer
 
 
 class DataController(QObject):
@@ -72,6 +73,11 @@ class DataController(QObject):
         self._sync_timer.sync_simulation_tick.connect(self._handle_sync_tick)
         self._sync_timer.sync_robot_tick.connect(self._handle_sync_tick)
 
+        # Emisor de trayectorias para los movimientos de Pick and Place
+        self._streamer = TrajectoryStreamer(self.config_signals.get_param(
+            "settings.json", "motion", "rate_hz", default=20))
+        self._streamer.sample_ready.connect(self._on_trajectory_sample)
+
     def _load_initial_config(self):
         """Carga la configuración persistente."""
         config_manager.init_config()
@@ -125,6 +131,9 @@ class DataController(QObject):
         self.pick_signals.search_circle_request.connect(
             self.search_signals.set_circle)
 
+        # Movimientos de Pick and Place -> trayectoria temporizada
+        self.pick_signals.move_requested.connect(self._on_move_requested)
+
         # Bridge cinemática inversa: Pick and Place <-> Kinematics.
         # Ninguna feature conoce a la otra; el DataController media el diálogo.
         self.pick_signals.inverse_kinematics_requested.connect(
@@ -159,7 +168,8 @@ class DataController(QObject):
     @pyqtSlot()
     def _handle_sync_tick(self):
         """Despacha posiciones y detecta llegada al objetivo."""
-        if self._target_data is None:
+        if self._target_data is None or self._streamer.is_active():
+            # Durante una trayectoria las consignas las despacha el emisor
             return
 
         data_rad = deg_to_rad(self._target_data)
@@ -186,9 +196,45 @@ class DataController(QObject):
 
     @pyqtSlot(list)
     def update_target_positions(self, data: list):
-        """Actualiza el buffer de estado central."""
+        """Actualiza el buffer de estado central (cancela la trayectoria en curso)."""
+        self._streamer.stop()
         self._target_data = data
 
+    @pyqtSlot(list)
+    def _on_move_requested(self, target: list):
+        """
+        Planifica una trayectoria articular desde la consigna actual hasta
+        `target` e inicia su emisión a frecuencia fija.
+
+        Args:
+            target (list): 6 posiciones de servo destino (0-300).
+        """
+        start = self._target_data
+        if start is None or len(start) != len(target):
+            self.update_target_positions(list(target))
+            self.pick_signals.trajectory_started.emit(0.0)
+            return
+
+        motion = self.config_signals.get_param("settings.json", "motion", default={})
+        trajectory = Trajectory(
+            start, target,
+            motion.get("max_velocity", 60.0),
+            motion.get("max_acceleration", 120.0),
+            motion.get("profile", "trapezoidal"))
+        self._streamer.stop()
+        self._streamer.set_rate(motion.get("rate_hz", 20))
+        self._streamer.start(trajectory)
+        self.pick_signals.trajectory_started.emit(trajectory.get_duration())
+
+    @pyqtSlot(list)
+    def _on_trajectory_sample(self, sample: list):
+        """Aplica y despacha una consigna intermedia de la trayectoria."""
+        self._target_data = sample
+        self.sim_signals.update_pybullet_signal.emit(
+            deg_to_rad(sample).tolist())
+        if self.phys_signals.is_connected:
+            self.phys_signals.send_to_robot.emit(sample)
+
     @pyqtSlot(object)
     def set_mode(self, mode: Modes):
         """Cambia el modo de operación global."""
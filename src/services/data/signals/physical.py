@@ -19,8 +19,14 @@ class PhysicalSignalManager(_SignalManager):
     Signals:
         send_to_robot: Emite una lista de posiciones de servos.
         data_received: Emite (posiciones, temperaturas) desde el hardware.
+
+    Attributes:
+        is_connected (bool): Estado de la conexión serial.
+        telemetry_buffer (TelemetryRing | None): Historial de telemetría del
+            RobotWorker activo, para consumidores que leen sin señales.
     """
     is_connected = False
+    telemetry_buffer = None
     send_to_robot = pyqtSignal(list)
     data_received = pyqtSignal(list, list)
     start_service = pyqtSignal()
@@ -24,6 +24,12 @@ class PickPlaceSignalManager(QObject):
     # Petición de (des)activar la búsqueda de esferas en la cámara.
     # Sender PickAndPlaceController, receiver DataController -> SearchSignalManager.
     search_circle_request = pyqtSignal(bool)
+    # Movimiento de la secuencia (servos 0-300) a ejecutar como trayectoria.
+    # Sender PickAndPlaceController, receiver DataController.
+    move_requested = pyqtSignal(list)
+    # Duración (s) de la trayectoria iniciada para el último movimiento.
+    # Sender DataController, receiver PickAndPlaceWorker.
+    trajectory_started = pyqtSignal(float)
 
     @classmethod
     def get_instance(cls):
@@ -1,12 +1,14 @@
 """
 Paquete de temporizadores del sistema.
 
-Proporciona los componentes de temporización global (GlobalTimer) y
-contador de fotogramas (FrameCounter) para la sincronización de
-procesamiento de video y actualización de datos.
+Proporciona los componentes de temporización global (GlobalTimer),
+contador de fotogramas (FrameCounter) y el planificador periódico sin
+deriva (PeriodicScheduler / LoopStats) para la sincronización de
+procesamiento de video, actualización de datos y lazos de control.
 """
 
 from .global_timer import GlobalTimer
 from .frame_counter import FrameCounter
+from .periodic_scheduler import PeriodicScheduler, LoopStats
 
-__all__ = ['GlobalTimer', 'FrameCounter']
\ No newline at end of file
+__all__ = ['GlobalTimer', 'FrameCounter', 'PeriodicScheduler', 'LoopStats']
\ No newline at end of file
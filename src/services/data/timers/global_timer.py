@@ -3,11 +3,15 @@ Módulo que define el temporizador global de sincronización.
 
 Proporciona un singleton QTimer que emite ticks a diferentes
 frecuencias para la actualización del modelo 3D, los gráficos
-y la sincronización con el robot físico.
+y la sincronización con el robot físico. El QTimer se reprograma en cada
+ciclo hacia plazos absolutos (PeriodicScheduler), por lo que la carga del
+hilo de la GUI no acumula deriva en los ticks de baja frecuencia.
 """
 
-from PyQt6.QtCore import pyqtSignal, QObject, QTimer
+import math
+from PyQt6.QtCore import pyqtSignal, QObject, QTimer, Qt
 from ..signals import PhysicalSignalManager
+from .periodic_scheduler import PeriodicScheduler
 
 
 class GlobalTimer(QObject):
@@ -30,6 +34,8 @@ class GlobalTimer(QObject):
     model_tick = pyqtSignal()
     sync_robot_tick = pyqtSignal()
 
+    PERIOD_S = 0.004
+
     _instance = None
     _initialized = False
 
@@ -49,47 +55,76 @@ class GlobalTimer(QObject):
         if GlobalTimer._initialized:
             return
         super().__init__()
+        self._scheduler = PeriodicScheduler(self.PERIOD_S, "global_timer")
         self._timer = QTimer()
-        self._timer.setInterval(4)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
         self._timer.timeout.connect(self._tick)
-        self._timer.start()
 
+        self._running = True
         self._sync_counter = 0
         self._model_counter = 0
+        self._scheduler.reset()
+        self._timer.start(self._msec_to_next())
         GlobalTimer._initialized = True
 
         self.signal_manager = PhysicalSignalManager.get_instance()
 
+    def _msec_to_next(self) -> int:
+        """Milisegundos hasta el siguiente plazo absoluto."""
+        return math.ceil(self._scheduler.time_to_next() * 1000)
+
     def _tick(self):
         """
         Ejecuta la lógica de distribución de ticks según contadores internos.
-        """
-        self._sync_counter += 1
-        self._model_counter += 1
 
-        if self._model_counter >= 4:
-            self.model_tick.emit()
-            self._model_counter = 0
-
-        if self._sync_counter >= 25:
-            if not self.signal_manager.is_connected:
-                self.sync_simulation_tick.emit()
+        Los contadores avanzan según los periodos realmente transcurridos;
+        si el hilo se retrasó, los ticks perdidos se agrupan en una sola
+        emisión en lugar de acumular deriva.
+        """
+        elapsed = self._scheduler.tick()
+        if elapsed:
+            self._sync_counter += elapsed
+            self._model_counter += elapsed
+
+            if self._model_counter >= 4:
+                self.model_tick.emit()
+                self._model_counter %= 4
+
+            if self._sync_counter >= 25:
+                if not self.signal_manager.is_connected:
+                    self.sync_simulation_tick.emit()
+                else:
+                    self.sync_robot_tick.emit()
+                self._sync_counter %= 25
             else:
-                self.sync_robot_tick.emit()
-            self._sync_counter = 0
-        else:
-            self.update_tick.emit()
+                self.update_tick.emit()
+
+        if self._running:
+            self._timer.start(self._msec_to_next())
 
     def start(self):
         """
         Inicia el temporizador si no está activo.
         """
-        if not self._timer.isActive():
-            self._timer.start()
+        if not self._running:
+            self._running = True
+            self._scheduler.reset()
+            self._timer.start(self._msec_to_next())
 
     def stop(self):
         """
         Detiene el temporizador si está activo.
         """
+        self._running = False
         if self._timer.isActive():
             self._timer.stop()
+
+    def get_stats(self) -> dict:
+        """
+        Obtiene las estadísticas de periodo, jitter y desbordes del tick.
+
+        Returns:
+            dict: Ver `LoopStats.get_stats`.
+        """
+        return self._scheduler.get_stats()
@@ -0,0 +1,205 @@
+"""
+Módulo que define el planificador periódico sin deriva para lazos de control.
+
+Proporciona PeriodicScheduler, que calcula plazos absolutos sobre
+`time.monotonic_ns()` (inicio + k * periodo) en lugar de dormir un intervalo
+relativo tras cada ciclo, de modo que el retraso de un ciclo no se acumula en
+los siguientes. Los ciclos perdidos por sobrecarga se cuentan como
+desbordes (overruns) y se saltan sin recuperar ráfagas.
+
+LoopStats acumula, con histogramas de bins fijos, el periodo medido, un
+retraso por ciclo (el jitter respecto al plazo en lazos periódicos, u otra
+latencia que el lazo nombre) y los desbordes de cualquier lazo, ya sea
+periódico o despertado por eventos.
+
+Conexiones:
+    - Lo usa `GlobalTimer` para reprogramar su QTimer a plazos absolutos.
+    - Lo usa `TrajectoryStreamer` para emitir consignas a frecuencia fija.
+    - `KinematicsWorker` usa LoopStats para medir el `dt` real entre tramas
+      y la latencia trama-control.
+"""
+
+import time
+import numpy as np
+
+_HISTOGRAM_BINS = 50
+
+
+class LoopStats:
+    """
+    Estadísticas de periodo, retraso y desbordes de un lazo.
+
+    Los histogramas usan bins fijos relativos al periodo nominal: el de
+    periodo cubre [0, 3 * periodo) y el de retraso [0, periodo); los valores
+    fuera de rango se acumulan en el último bin.
+
+    Args:
+        period_s (float): Periodo nominal del lazo en segundos.
+        name (str): Nombre del lazo (para reportes).
+        delay_name (str): Prefijo de las llaves del retraso en `get_stats`
+            ('jitter' para el retraso respecto al plazo).
+    """
+
+    def __init__(self, period_s: float, name: str = "", delay_name: str = "jitter"):
+        self._name = name
+        self._delay_name = delay_name
+        self._period_ns = int(period_s * 1e9)
+        self._period_edges = np.linspace(
+            0.0, 3.0 * period_s, _HISTOGRAM_BINS + 1)
+        self._jitter_edges = np.linspace(0.0, period_s, _HISTOGRAM_BINS + 1)
+        self.reset()
+
+    def reset(self):
+        """Descarta todas las muestras acumuladas."""
+        self._period_hist = np.zeros(_HISTOGRAM_BINS, dtype=np.int64)
+        self._jitter_hist = np.zeros(_HISTOGRAM_BINS, dtype=np.int64)
+        self._count = 0
+        self._overruns = 0
+        self._period_sum = 0.0
+        self._period_max = 0.0
+        self._jitter_sum = 0.0
+        self._jitter_max = 0.0
+
+    def record(self, dt: float, jitter: float = 0.0, overruns: int = 0):
+        """
+        Agrega una muestra de un ciclo.
+
+        Args:
+            dt (float): Tiempo medido desde el ciclo anterior en segundos.
+            jitter (float): Retraso del ciclo en segundos (respecto al
+                plazo, o la latencia que mida el lazo).
+            overruns (int): Ciclos perdidos antes de este.
+        """
+        self._count += 1
+        self._overruns += overruns
+        self._period_sum += dt
+        self._period_max = max(self._period_max, dt)
+        self._jitter_sum += jitter
+        self._jitter_max = max(self._jitter_max, jitter)
+        self._period_hist[self._bin(self._period_edges, dt)] += 1
+        self._jitter_hist[self._bin(self._jitter_edges, jitter)] += 1
+
+    @staticmethod
+    def _bin(edges, value) -> int:
+        """Índice del bin para `value`, saturado a los extremos."""
+        idx = int(np.searchsorted(edges, value, side="right")) - 1
+        return min(max(idx, 0), _HISTOGRAM_BINS - 1)
+
+    def get_stats(self) -> dict:
+        """
+        Obtiene un resumen de las estadísticas acumuladas.
+
+        Returns:
+            dict: Nombre, periodo nominal, número de ciclos, periodo medio y
+            máximo, retraso medio y máximo (`<delay_name>_mean/_max`),
+            desbordes y los histogramas (`*_hist` con sus bordes `*_edges`,
+            en segundos).
+        """
+        count = max(self._count, 1)
+        delay = self._delay_name
+        return {
+            "name": self._name,
+            "period": self._period_ns / 1e9,
+            "count": self._count,
+            "overruns": self._overruns,
+            "period_mean": self._period_sum / count,
+            "period_max": self._period_max,
+            f"{delay}_mean": self._jitter_sum / count,
+            f"{delay}_max": self._jitter_max,
+            "period_hist": self._period_hist.copy(),
+            "period_edges": self._period_edges.copy(),
+            f"{delay}_hist": self._jitter_hist.copy(),
+            f"{delay}_edges": self._jitter_edges.copy(),
+        }
+
+
+class PeriodicScheduler:
+    """
+    Planificador de frecuencia fija con plazos absolutos.
+
+    Se usa desde un event loop que reprograma su temporizador con
+    `time_to_next` y registra cada despertar con `tick`.
+
+    Args:
+        period_s (float): Periodo del lazo en segundos.
+        name (str): Nombre del lazo (para reportes).
+    """
+
+    def __init__(self, period_s: float, name: str = ""):
+        if period_s <= 0:
+            raise ValueError("El periodo debe ser positivo")
+        self._period_ns = int(period_s * 1e9)
+        self._stats = LoopStats(period_s, name)
+        self.reset()
+
+    def reset(self, start_ns: int | None = None):
+        """
+        Reinicia la referencia de tiempo; el primer plazo es un periodo
+        después de `start_ns`.
+
+        Args:
+            start_ns (int, optional): Instante de inicio (monotonic_ns).
+        """
+        now = time.monotonic_ns() if start_ns is None else start_ns
+        self._last_tick_ns = now
+        self._deadline_ns = now + self._period_ns
+
+    def get_period(self) -> float:
+        """
+        Obtiene el periodo nominal.
+
+        Returns:
+            float: Periodo en segundos.
+        """
+        return self._period_ns / 1e9
+
+    def time_to_next(self, now_ns: int | None = None) -> float:
+        """
+        Calcula el tiempo restante hasta el siguiente plazo.
+
+        Args:
+            now_ns (int, optional): Instante actual (monotonic_ns).
+
+        Returns:
+            float: Segundos hasta el plazo (0 si ya venció).
+        """
+        now = time.monotonic_ns() if now_ns is None else now_ns
+        return max(0, self._deadline_ns - now) / 1e9
+
+    def tick(self, now_ns: int | None = None) -> int:
+        """
+        Registra un despertar y avanza al siguiente plazo absoluto.
+
+        Args:
+            now_ns (int, optional): Instante del despertar (monotonic_ns).
+
+        Returns:
+            int: Periodos transcurridos desde el despertar anterior (1 en
+            régimen normal, >1 si hubo desbordes, 0 si se despertó antes
+            del plazo).
+        """
+        now = time.monotonic_ns() if now_ns is None else now_ns
+        if now < self._deadline_ns:
+            return 0
+        late_ns = now - self._deadline_ns
+        elapsed = 1 + late_ns // self._period_ns
+        self._deadline_ns += elapsed * self._period_ns
+        self._stats.record(
+            (now - self._last_tick_ns) / 1e9,
+            (late_ns % self._period_ns) / 1e9,
+            int(elapsed - 1))
+        self._last_tick_ns = now
+        return int(elapsed)
+
+    def get_stats(self) -> dict:
+        """
+        Obtiene las estadísticas de periodo, jitter y desbordes.
+
+        Returns:
+            dict: Ver `LoopStats.get_stats`.
+        """
+        return self._stats.get_stats()
+
+    def reset_stats(self):
+        """Descarta las estadísticas acumuladas."""
+        self._stats.reset()
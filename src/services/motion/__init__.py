@@ -0,0 +1,12 @@
+"""
+Paquete de planificación de movimiento.
+
+Proporciona la generación de trayectorias parametrizadas en el tiempo
+(trapezoidal, curva S y quíntica) de las articulaciones y su emisión
+a frecuencia fija hacia la simulación y el robot físico.
+"""
+
+from .trajectory import Trajectory, PROFILES
+from .trajectory_streamer import TrajectoryStreamer
+
+__all__ = ["Trajectory", "PROFILES", "TrajectoryStreamer"]
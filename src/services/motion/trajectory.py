@@ -0,0 +1,162 @@
+"""
+Módulo de generación de trayectorias parametrizadas en el tiempo.
+
+Proporciona perfiles de escalado temporal s(t) ∈ [0, 1] con límites de
+velocidad y aceleración, evaluados de forma vectorizada con NumPy:
+
+    - trapezoidal: aceleración constante, crucero y frenado.
+    - scurve: como el trapezoidal pero con rampas sinusoidales, de modo que
+      la aceleración es continua (jerk acotado).
+    - quintic: polinomio 10τ³ - 15τ⁴ + 6τ⁵ (velocidad y aceleración nulas
+      en los extremos).
+
+Las trayectorias articulares están sincronizadas: todas las articulaciones
+comparten el mismo s(t), dimensionado por la articulación que más se
+desplaza, y llegan a la vez.
+
+Conexiones:
+    - `TrajectoryStreamer` muestrea las trayectorias a frecuencia fija.
+    - `DataController` planifica los movimientos de Pick and Place.
+"""
+
+import math
+import numpy as np
+
+PROFILES = ("trapezoidal", "scurve", "quintic")
+
+# Velocidad y aceleración pico del quíntico normalizado (T = 1, D = 1)
+_QUINTIC_PEAK_VEL = 1.875
+_QUINTIC_PEAK_ACC = 10.0 / math.sqrt(3.0)
+
+
+class Trajectory:
+    """
+    Trayectoria lineal en un espacio de N dimensiones con perfil temporal.
+
+    Args:
+        start (sequence): Posición inicial (N,).
+        goal (sequence): Posición final (N,).
+        max_velocity (float): Velocidad máxima (unidades/s) del eje que más
+            se desplaza.
+        max_acceleration (float): Aceleración máxima (unidades/s²).
+        profile (str): 'trapezoidal', 'scurve' o 'quintic'.
+
+    Raises:
+        ValueError: Si el perfil no existe o los límites no son positivos.
+    """
+
+    def __init__(self, start, goal, max_velocity: float,
+                 max_acceleration: float, profile: str = "trapezoidal"):
+        if profile not in PROFILES:
+            raise ValueError(f"Perfil de trayectoria desconocido: {profile}")
+        if max_velocity <= 0 or max_acceleration <= 0:
+            raise ValueError("Los límites de velocidad y aceleración deben ser positivos")
+        self._start = np.asarray(start, dtype=float)
+        self._goal = np.asarray(goal, dtype=float)
+        self._delta = self._goal - self._start
+        self._profile = profile
+
+        distance = float(np.max(np.abs(self._delta))) if self._delta.size else 0.0
+        self._duration, self._ramp, self._peak = self._plan(
+            distance, float(max_velocity), float(max_acceleration))
+        self._distance = distance
+
+    def _plan(self, distance, vmax, amax):
+        """
+        Dimensiona el perfil para recorrer `distance` sin exceder los límites.
+
+        Returns:
+            tuple: (duración T, tiempo de rampa ta, velocidad pico vp).
+        """
+        if distance <= 0.0:
+            return 0.0, 0.0, 0.0
+        if self._profile == "quintic":
+            duration = max(_QUINTIC_PEAK_VEL * distance / vmax,
+                           math.sqrt(_QUINTIC_PEAK_ACC * distance / amax))
+            return duration, 0.0, _QUINTIC_PEAK_VEL * distance / duration
+
+        # En la rampa sinusoidal la aceleración media es 2/π de la pico
+        accel = amax if self._profile == "trapezoidal" else 2.0 * amax / math.pi
+        if distance >= vmax * vmax / accel:
+            ramp = vmax / accel
+            return distance / vmax + ramp, ramp, vmax
+        ramp = math.sqrt(distance / accel)
+        return 2.0 * ramp, ramp, accel * ramp
+
+    def get_duration(self) -> float:
+        """
+        Obtiene la duración total de la trayectoria.
+
+        Returns:
+            float: Segundos.
+        """
+        return self._duration
+
+    def get_goal(self) -> np.ndarray:
+        """
+        Obtiene la posición final.
+
+        Returns:
+            np.ndarray: Copia de la posición final (N,).
+        """
+        return self._goal.copy()
+
+    def scaling(self, t):
+        """
+        Evalúa el escalado temporal normalizado s(t).
+
+        Args:
+            t (float | np.ndarray): Tiempos en segundos.
+
+        Returns:
+            np.ndarray: s(t) en [0, 1].
+        """
+        t = np.clip(np.asarray(t, dtype=float), 0.0, self._duration)
+        if self._duration <= 0.0:
+            return np.ones_like(t)
+        if self._profile == "quintic":
+            tau = t / self._duration
+            return tau ** 3 * (10.0 + tau * (-15.0 + 6.0 * tau))
+
+        ta, vp, T = self._ramp, self._peak, self._duration
+        if self._profile == "trapezoidal":
+            ramp_up = 0.5 * vp / ta * t * t
+            tb = T - t
+            ramp_down = self._distance - 0.5 * vp / ta * tb * tb
+        else:
+            k = math.pi / ta
+            ramp_up = 0.5 * vp * (t - np.sin(k * t) / k)
+            tb = T - t
+            ramp_down = self._distance - 0.5 * vp * (tb - np.sin(k * tb) / k)
+        cruise = 0.5 * vp * ta + vp * (t - ta)
+        position = np.where(t < ta, ramp_up, np.where(t > T - ta, ramp_down, cruise))
+        return position / self._distance
+
+    def sample(self, t):
+        """
+        Evalúa la trayectoria en uno o varios instantes.
+
+        Args:
+            t (float | np.ndarray): Tiempos en segundos (M,).
+
+        Returns:
+            np.ndarray: Posiciones (M, N) (o (N,) para un escalar).
+        """
+        s = self.scaling(t)
+        return self._start + np.multiply.outer(s, self._delta)
+
+    def sample_rate(self, rate_hz: float):
+        """
+        Muestrea la trayectoria completa a frecuencia fija.
+
+        Args:
+            rate_hz (float): Frecuencia de muestreo en Hz.
+
+        Returns:
+            tuple: (tiempos (M,), posiciones (M, N)); la última muestra
+            coincide exactamente con el destino.
+        """
+        count = max(1, math.ceil(self._duration * rate_hz))
+        times = np.append(np.arange(count) / rate_hz, self._duration)
+        return times, self.sample(times)
+
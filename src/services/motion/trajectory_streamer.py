@@ -0,0 +1,112 @@
+"""
+Módulo que define el emisor de trayectorias a frecuencia fija.
+
+TrajectoryStreamer reproduce una `Trajectory` sobre el event loop de Qt:
+en cada ciclo evalúa la trayectoria en el tiempo transcurrido real (no en
+un índice de muestra), por lo que los retrasos del hilo no alargan el
+movimiento. Los ciclos se programan con plazos absolutos mediante
+`PeriodicScheduler`.
+
+Conexiones:
+    - Emite `sample_ready` con cada consigna intermedia.
+    - Emite `finished` al entregar la posición final.
+"""
+
+import math
+import time
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+from src.services.data.timers import PeriodicScheduler
+
+
+class TrajectoryStreamer(QObject):
+    """
+    Emisor de consignas de una trayectoria a frecuencia fija.
+
+    Args:
+        rate_hz (float): Frecuencia de emisión en Hz.
+
+    Signals:
+        sample_ready (list): Consigna a aplicar en este ciclo.
+        finished: Se alcanzó el final de la trayectoria.
+    """
+    sample_ready = pyqtSignal(list)
+    finished = pyqtSignal()
+
+    def __init__(self, rate_hz: float = 20.0):
+        super().__init__()
+        self._trajectory = None
+        self._t0_ns = 0
+        self._scheduler = PeriodicScheduler(1.0 / rate_hz, "trajectory")
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+
+    def set_rate(self, rate_hz: float):
+        """
+        Cambia la frecuencia de emisión (aplica al siguiente movimiento).
+
+        Args:
+            rate_hz (float): Frecuencia en Hz.
+        """
+        if not self.is_active():
+            self._scheduler = PeriodicScheduler(1.0 / rate_hz, "trajectory")
+
+    def start(self, trajectory):
+        """
+        Comienza a reproducir una trayectoria, reemplazando la actual.
+
+        Args:
+            trajectory (Trajectory): Trayectoria a reproducir.
+        """
+        self._trajectory = trajectory
+        self._t0_ns = time.monotonic_ns()
+        self._scheduler.reset(self._t0_ns)
+        self._emit_sample(0.0)
+        self._timer.start(self._msec_to_next())
+
+    def stop(self):
+        """Detiene la reproducción sin emitir `finished`."""
+        self._timer.stop()
+        self._trajectory = None
+
+    def is_active(self) -> bool:
+        """
+        Indica si hay una trayectoria en reproducción.
+
+        Returns:
+            bool: True mientras no se haya entregado la posición final.
+        """
+        return self._trajectory is not None
+
+    def get_stats(self) -> dict:
+        """
+        Obtiene las estadísticas de periodo y jitter de la emisión.
+
+        Returns:
+            dict: Ver `LoopStats.get_stats`.
+        """
+        return self._scheduler.get_stats()
+
+    def _msec_to_next(self) -> int:
+        """Milisegundos hasta el siguiente plazo absoluto."""
+        return math.ceil(self._scheduler.time_to_next() * 1000)
+
+    def _emit_sample(self, elapsed):
+        """Emite la consigna para el tiempo transcurrido `elapsed`."""
+        self.sample_ready.emit(self._trajectory.sample(elapsed).tolist())
+
+    def _tick(self):
+        """Ciclo de emisión: muestrea en el tiempo real transcurrido."""
+        if self._trajectory is None:
+            return
+        self._scheduler.tick()
+        elapsed = (time.monotonic_ns() - self._t0_ns) / 1e9
+        if elapsed >= self._trajectory.get_duration():
+            goal = self._trajectory.get_goal().tolist()
+            self._trajectory = None
+            self.sample_ready.emit(goal)
+            self.finished.emit()
+            return
+        self._emit_sample(elapsed)
+        self._timer.start(self._msec_to_next())
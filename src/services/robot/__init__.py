@@ -2,8 +2,9 @@
 Paquete de servicios de comunicación y control del robot.
 
 Proporciona las clases RobotController (interfaz principal),
-RobotWorker (comunicación serial) y RobotCompensator
-(procesamiento de datos de salida).
+RobotWorker (comunicación serial), RobotCompensator
+(procesamiento de datos de salida) y los códecs de trama
+(AsciiCodec / BinaryCodec).
 
 Señales:
     - RobotWorker.data_received: Emitida al recibir telemetría válida
@@ -15,6 +15,8 @@ _LIMITS_DEG = [(-100.0, 100.0), (-90.0, 90.0),
 class CartesianPidCompensator:
     """Metodos estaticos de conversion y limitacion articular."""
 
+    LIMITS_DEG = _LIMITS_DEG
+
     @staticmethod
     def angulos_robotang(q1, q2, q3, q4, q5, q6):
         """Convierte angulos articulares a posiciones de servo (0-300)."""
@@ -13,7 +13,7 @@ Conexiones:
 
 from PyQt6.QtCore import QObject
 from .robot_worker import RobotWorker
-from src.services.data.signals import PhysicalSignalManager
+from src.services.data.signals import PhysicalSignalManager, ConfigSignalManager
 
 
 class RobotController(QObject):
@@ -28,8 +28,11 @@ class RobotController(QObject):
 
     def __init__(self, com: str):
         super().__init__()
-        self._worker = RobotWorker(com)
+        codec = ConfigSignalManager.get_instance().get_param(
+            "settings.json", "robot", "codec", default="ascii")
+        self._worker = RobotWorker(com, codec)
         self._signal_manager = PhysicalSignalManager.get_instance()
+        self._signal_manager.telemetry_buffer = self._worker.get_telemetry_buffer()
 
         # Conexiones Locales (Worker -> Controller)
         self._worker.data_received.connect(self._on_data_received)
@@ -0,0 +1,396 @@
+"""
+Emulador por software de la placa OpenCM9.04 sobre un pseudo-terminal.
+
+Permite ejercitar RobotWorker, RobotController y el lazo PID del
+KinematicsWorker sin el hardware físico. El emulador abre un pty de Linux,
+expone su extremo esclavo (e.g. `/dev/pts/5`) como puerto serie y habla el
+mismo protocolo que el firmware (`Codigos_test/Programa_OpenCM9_04_v2.txt`):
+
+    - Comandos:   `A<pwm>B<pwm>C<pwm>D<pwm>E<pwm>F<pwm>\\n` (cuentas 0-1023),
+      saturados con los mismos rangos por motor que el firmware.
+    - Telemetría: `A<pos>TA<temp>;B<pos>TB<temp>;...F<pos>TF<temp>;\\n`
+      (posición en grados 0-300) a una cadencia fija.
+
+También acepta el formato binario de `telemetry_codec.BinaryCodec`.
+
+El modelo de cada servo es de primer orden con límite de velocidad, banda
+muerta configurable, ruido gaussiano en la lectura y pérdida aleatoria de
+tramas, lo que permite medir throughput serial, latencia comando-telemetría
+y tiempo de convergencia del PID en un equipo Linux cualquiera.
+
+Uso:
+    python -m src.services.robot.robot_emulator --rate 50 --noise 0.2
+"""
+
+import os
+import re
+import math
+import time
+import random
+import select
+import struct
+import argparse
+import threading
+from .telemetry_codec import BinaryCodec, MOTOR_COUNT
+
+# Rangos (cuentas PWM) que el firmware aplica por motor antes de escribir
+_FIRMWARE_LIMITS = [(171, 853), (239, 682), (171, 682),
+                    (171, 853), (512, 853), (130, 583)]
+# Pose inicial que el firmware fija en el primer ciclo de loop()
+_FIRMWARE_HOME = [512, 512, 512, 512, 712, 580]
+_COUNTS_TO_DEG = 300 / 1023
+
+
+class ServoModel:
+    """
+    Modelo de primer orden de un servo Dynamixel AX-12A.
+
+    La posición sigue al objetivo con constante de tiempo `tau`, saturada a
+    `max_speed` grados/s. Si el error es menor que `dead_band` el servo no
+    se mueve, imitando el margen de compliance del motor.
+
+    Args:
+        position (float): Posición inicial en grados (0-300).
+        tau (float): Constante de tiempo en segundos.
+        max_speed (float): Velocidad máxima en grados/s.
+        dead_band (float): Banda muerta en grados.
+    """
+
+    def __init__(self, position: float, tau: float = 0.08,
+                 max_speed: float = 120.0, dead_band: float = 0.3):
+        self.position = float(position)
+        self.target = float(position)
+        self.tau = tau
+        self.max_speed = max_speed
+        self.dead_band = dead_band
+
+    def step(self, dt: float) -> float:
+        """
+        Integra la dinámica del servo durante `dt` segundos.
+
+        Args:
+            dt (float): Paso de integración en segundos.
+
+        Returns:
+            float: Nueva posición en grados.
+        """
+        error = self.target - self.position
+        if abs(error) <= self.dead_band:
+            return self.position
+        delta = error * (1.0 - math.exp(-dt / self.tau)) if self.tau > 0 else error
+        max_delta = self.max_speed * dt
+        self.position += max(-max_delta, min(max_delta, delta))
+        return self.position
+
+    def is_moving(self) -> bool:
+        """
+        Indica si el servo aún no alcanza su objetivo (bit MOVING).
+
+        Returns:
+            bool: True si el error supera la banda muerta.
+        """
+        return abs(self.target - self.position) > self.dead_band
+
+
+class OpenCMEmulator:
+    """
+    Emulador de la placa OpenCM9.04 conectado a un pseudo-terminal.
+
+    Un hilo dedicado atiende el extremo maestro del pty: decodifica los
+    comandos entrantes, integra el modelo de los servos y publica la
+    telemetría a la cadencia configurada.
+
+    Args:
+        rate (float): Tramas de telemetría por segundo.
+        tau (float): Constante de tiempo de los servos (s).
+        max_speed (float): Velocidad máxima de los servos (grados/s).
+        dead_band (float): Banda muerta de los servos (grados).
+        noise (float): Desviación estándar del ruido de lectura (grados).
+        drop_rate (float): Probabilidad (0-1) de perder una trama.
+        temperature (int): Temperatura reportada por los motores (Celsius).
+        codec (str): Formato de trama, 'ascii' o 'binary'.
+        seed (int | None): Semilla del generador aleatorio.
+    """
+
+    _COMMAND_PATTERN = re.compile(rb"([A-F])(\d+)")
+    _BINARY_COMMAND = struct.Struct("<6H")
+
+    def __init__(self, rate: float = 50.0, tau: float = 0.08,
+                 max_speed: float = 120.0, dead_band: float = 0.3,
+                 noise: float = 0.0, drop_rate: float = 0.0,
+                 temperature: int = 25, codec: str = "ascii", seed=None):
+        self._period = 1.0 / rate
+        self._noise = noise
+        self._drop_rate = drop_rate
+        self._temperature = int(temperature)
+        self._codec = codec
+        self._binary = BinaryCodec()
+        self._random = random.Random(seed)
+        self._servos = [
+            ServoModel(count * _COUNTS_TO_DEG, tau, max_speed, dead_band)
+            for count in _FIRMWARE_HOME
+        ]
+        self._rx_buffer = bytearray()
+        self._master_fd = None
+        self._slave_fd = None
+        self._port = None
+        self._thread = None
+        self._running = False
+        self._lock = threading.Lock()
+
+        self._commands_received = 0
+        self._frames_sent = 0
+        self._frames_dropped = 0
+
+    # --- Ciclo de vida ---
+
+    def start(self) -> str:
+        """
+        Abre el pty y arranca el hilo del emulador.
+
+        Returns:
+            str: Ruta del extremo esclavo para abrir con pyserial.
+        """
+        import pty
+        import tty
+        self._master_fd, self._slave_fd = pty.openpty()
+        tty.setraw(self._slave_fd)
+        self._port = os.ttyname(self._slave_fd)
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name="OpenCMEmulator", daemon=True)
+        self._thread.start()
+        return self._port
+
+    def stop(self):
+        """Detiene el hilo y cierra ambos extremos del pty."""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        for fd in (self._master_fd, self._slave_fd):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._master_fd = self._slave_fd = None
+
+    # --- Getters ---
+
+    def get_port(self) -> str:
+        """
+        Obtiene la ruta del puerto serie emulado.
+
+        Returns:
+            str: Ruta del extremo esclavo del pty o None si no ha iniciado.
+        """
+        return self._port
+
+    def get_positions(self) -> list:
+        """
+        Obtiene la posición real (sin ruido) de los 6 servos emulados.
+
+        Returns:
+            list: 6 posiciones en grados (0-300).
+        """
+        with self._lock:
+            return [servo.position for servo in self._servos]
+
+    def get_stats(self) -> dict:
+        """
+        Obtiene los contadores del emulador.
+
+        Returns:
+            dict: Comandos recibidos, tramas enviadas y tramas descartadas.
+        """
+        with self._lock:
+            return {
+                "commands_received": self._commands_received,
+                "frames_sent": self._frames_sent,
+                "frames_dropped": self._frames_dropped,
+            }
+
+    # --- Bucle principal ---
+
+    def _run(self):
+        """
+        Atiende el pty: espera comandos hasta el siguiente instante de
+        telemetría y luego integra la dinámica y publica la trama.
+        """
+        last_step = time.monotonic()
+        next_frame = last_step + self._period
+        while self._running:
+            timeout = max(0.0, next_frame - time.monotonic())
+            try:
+                readable, _, _ = select.select([self._master_fd], [], [], timeout)
+            except (OSError, ValueError):
+                break
+            if readable:
+                try:
+                    data = os.read(self._master_fd, 4096)
+                except OSError:
+                    break
+                self._handle_input(data)
+
+            now = time.monotonic()
+            if now < next_frame:
+                continue
+            with self._lock:
+                for servo in self._servos:
+                    servo.step(now - last_step)
+            last_step = now
+            next_frame += self._period
+            if next_frame < now:
+                # El hilo se retrasó: reanclar sin ráfagas de tramas
+                next_frame = now + self._period
+            self._send_telemetry()
+
+    def _handle_input(self, data: bytes):
+        """
+        Decodifica los comandos completos recibidos y actualiza los objetivos.
+
+        Args:
+            data (bytes): Bytes leídos del extremo maestro.
+        """
+        self._rx_buffer += data
+        if self._codec == "binary":
+            commands = self._parse_binary_commands()
+        else:
+            commands = self._parse_ascii_commands()
+        if not commands:
+            return
+        with self._lock:
+            for counts in commands:
+                for idx, count in enumerate(counts):
+                    if count is None:
+                        continue
+                    low, high = _FIRMWARE_LIMITS[idx]
+                    count = max(low, min(high, max(0, min(1023, count))))
+                    self._servos[idx].target = count * _COUNTS_TO_DEG
+                self._commands_received += 1
+
+    def _parse_ascii_commands(self) -> list:
+        """
+        Extrae las líneas `A<pwm>...F<pwm>` completas del buffer.
+
+        Returns:
+            list: Listas de 6 cuentas PWM (None para motores ausentes).
+        """
+        commands = []
+        buffer = self._rx_buffer
+        start = 0
+        while True:
+            end = buffer.find(b"\n", start)
+            if end < 0:
+                break
+            counts = [None] * MOTOR_COUNT
+            for motor, value in self._COMMAND_PATTERN.findall(buffer, start, end):
+                counts[motor[0] - 0x41] = int(value)
+            start = end + 1
+            if any(c is not None for c in counts):
+                commands.append(counts)
+        del buffer[:start]
+        return commands
+
+    def _parse_binary_commands(self) -> list:
+        """
+        Extrae las tramas binarias de comando válidas del buffer.
+
+        Returns:
+            list: Listas de 6 cuentas PWM.
+        """
+        commands = []
+        buffer = self._rx_buffer
+        size = self._BINARY_COMMAND.size
+        pos = 0
+        while True:
+            pos = buffer.find(BinaryCodec.HEADER, pos)
+            if pos < 0 or len(buffer) - pos < 4 + size + 1:
+                break
+            end = pos + 3 + buffer[pos + 2]
+            if (buffer[pos + 2] != 1 + size
+                    or buffer[pos + 3] != BinaryCodec.TYPE_COMMAND
+                    or BinaryCodec.checksum(buffer[pos + 2:end]) != buffer[end]):
+                pos += 1
+                continue
+            commands.append(list(self._BINARY_COMMAND.unpack_from(buffer, pos + 4)))
+            pos = end + 1
+        del buffer[:max(0, len(buffer) - 1) if pos < 0 else pos]
+        return commands
+
+    def _send_telemetry(self):
+        """Publica una trama de telemetría con ruido y pérdida simulados."""
+        if self._drop_rate and self._random.random() < self._drop_rate:
+            with self._lock:
+                self._frames_dropped += 1
+            return
+
+        with self._lock:
+            positions = [servo.position for servo in self._servos]
+        if self._noise:
+            positions = [p + self._random.gauss(0.0, self._noise) for p in positions]
+        positions = [max(0.0, min(300.0, p)) for p in positions]
+        temperatures = [self._temperature] * MOTOR_COUNT
+
+        if self._codec == "binary":
+            frame = self._binary.encode_telemetry(positions, temperatures)
+        else:
+            frame = "".join(
+                f"{motor}{position:.1f}T{motor}{temperature};"
+                for motor, position, temperature
+                in zip("ABCDEF", positions, temperatures)).encode("ascii") + b"\n"
+        try:
+            os.write(self._master_fd, frame)
+        except OSError:
+            # Buffer del pty lleno (nadie está leyendo): se pierde la trama
+            with self._lock:
+                self._frames_dropped += 1
+            return
+        with self._lock:
+            self._frames_sent += 1
+
+
+def main():
+    """Punto de entrada por línea de comandos del emulador."""
+    parser = argparse.ArgumentParser(
+        description="Emulador de la placa OpenCM9.04 sobre un pseudo-terminal.")
+    parser.add_argument("--rate", type=float, default=50.0,
+                        help="Tramas de telemetría por segundo (default: 50).")
+    parser.add_argument("--tau", type=float, default=0.08,
+                        help="Constante de tiempo de los servos en s (default: 0.08).")
+    parser.add_argument("--max-speed", type=float, default=120.0,
+                        help="Velocidad máxima de los servos en grados/s (default: 120).")
+    parser.add_argument("--dead-band", type=float, default=0.3,
+                        help="Banda muerta de los servos en grados (default: 0.3).")
+    parser.add_argument("--noise", type=float, default=0.0,
+                        help="Desviación estándar del ruido de lectura en grados.")
+    parser.add_argument("--drop", type=float, default=0.0,
+                        help="Probabilidad de perder una trama (0-1).")
+    parser.add_argument("--codec", choices=("ascii", "binary"), default="ascii",
+                        help="Formato de trama (default: ascii).")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Semilla del generador aleatorio.")
+    args = parser.parse_args()
+
+    emulator = OpenCMEmulator(
+        rate=args.rate, tau=args.tau, max_speed=args.max_speed,
+        dead_band=args.dead_band, noise=args.noise, drop_rate=args.drop,
+        codec=args.codec, seed=args.seed)
+    port = emulator.start()
+    print(f"Emulador OpenCM9.04 escuchando en {port} (Ctrl+C para salir)")
+    try:
+        while True:
+            time.sleep(1.0)
+            stats = emulator.get_stats()
+            print(f"\rcomandos={stats['commands_received']} "
+                  f"tramas={stats['frames_sent']} "
+                  f"perdidas={stats['frames_dropped']}", end="", flush=True)
+    except KeyboardInterrupt:
+        print()
+    finally:
+        emulator.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,22 +8,34 @@ control (OpenCM9.04) utilizando un hilo dedicado.
 Conexiones:
     - Utiliza `PhysicalSignalManager` para reportar el estado de conexión.
     - Emite `data_received` al recibir telemetría válida.
-    - Recibe datos mediante una cola (`queue.Queue`) para evitar bloqueos.
+    - Publica cada trama en un `TelemetryRing` que los consumidores leen
+      sin cerrojo (historial con marca de tiempo) y expone la última trama
+      válida con `snapshot()` (seqlock de doble buffer), avisando a los
+      oyentes registrados con `add_telemetry_listener`.
+    - Recibe datos mediante una cola (`queue.Queue`) para evitar bloqueos;
+      cada encolado despierta al hilo mediante un self-pipe.
+    - Delega el formato de las tramas en un códec (`telemetry_codec`).
 """
 
-import re
-import queue
+import os
 import time
+import queue
 import serial
-import threading
+import selectors
 from PyQt6.QtCore import QThread, pyqtSignal
+from .telemetry_codec import create_codec
+from .telemetry_ring import (
+    TelemetryRing, SnapshotBuffer, TelemetrySnapshot,
+    FLAG_VALID, FLAG_HELD, FLAG_NULL
+)
 
 class RobotWorker(QThread):
     """
     Worker encargado de la comunicación serial bidireccional con el robot.
 
-    Gestiona un buffer de recepción, procesa expresiones regulares para extraer
-    datos de telemetría y utiliza una cola de prioridad para los comandos de salida.
+    Gestiona un buffer de recepción, delega en un códec (ASCII o binario) la
+    decodificación de la telemetría y utiliza una cola de prioridad para los
+    comandos de salida.
 
     Attributes:
         data_received (pyqtSignal): Señal que envía (lista_posiciones, lista_temperaturas).
@@ -33,21 +45,26 @@ class RobotWorker(QThread):
     data_received = pyqtSignal(list, list)
     connection_status_changed = pyqtSignal(bool)
 
-    _TELEMETRY_PATTERN = re.compile(r"([A-F])(\d+\.?\d*)T[A-F](\d+)")
-
-    def __init__(self, com: str):
+    def __init__(self, com: str, codec: str = "ascii"):
         """
         Inicializa el worker serial y abre la conexión con el puerto COM.
 
         Args:
             com (str): Nombre del puerto serial (e.g., 'COM3' o '/dev/ttyACM0').
+            codec (str): Formato de trama, 'ascii' (por defecto) o 'binary'.
         """
         super().__init__()
         self._com = com
         self._cm904 = None
+        self._codec = create_codec(codec)
         self._send_queue = queue.Queue()
         self._running = True
 
+        # Self-pipe: despierta al selector cuando se encola un comando
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+
         # Intentar abrir el puerto serial
         try:
             self._cm904 = serial.Serial(self._com, 9600, timeout=1)
@@ -57,13 +74,20 @@ class RobotWorker(QThread):
             self._cm904 = None
             self.connection_status_changed.emit(False)
 
-        self._last_positions = [None] * 6
+        # Estado del filtro (solo lo modifica el hilo serial)
         self._last_temperaturas = [None] * 6
         self._last_valid_positions = [150.0] * 6
         self._jump_freeze_count = [0] * 6
-        self._lock = threading.Lock()
         self._telemetry_counter = 0
 
+        # Historial y última trama válida compartidos con los consumidores
+        # (lectura sin cerrojo)
+        self._telemetry = TelemetryRing()
+        self._snapshot = SnapshotBuffer()
+
+        # Callbacks invocados en el hilo serial al aceptar una trama válida
+        self._telemetry_listeners = ()
+
     # --- Getters and Setters ---
     def get_com(self) -> str:
         """
@@ -83,45 +107,78 @@ class RobotWorker(QThread):
         """
         return self._cm904 is not None and getattr(self._cm904, 'is_open', False)
 
+    def get_codec_name(self) -> str:
+        """
+        Obtiene el nombre del códec de trama en uso.
+
+        Returns:
+            str: 'ascii' o 'binary'.
+        """
+        return self._codec.name
+
+    def get_telemetry_buffer(self) -> TelemetryRing:
+        """
+        Obtiene el buffer circular con el historial de telemetría.
+
+        Returns:
+            TelemetryRing: Buffer de registros (seq, t_ns, pos, temp, flags).
+        """
+        return self._telemetry
+
+    def snapshot(self) -> TelemetrySnapshot | None:
+        """
+        Obtiene de forma atómica la última telemetría válida.
+
+        Posiciones, temperaturas, número de secuencia y marca de tiempo
+        provienen siempre de la misma trama. Usa un seqlock de doble buffer:
+        no toma cerrojos ni bloquea al hilo serial.
+
+        Returns:
+            TelemetrySnapshot | None: Instantánea o None si aún no hay datos.
+        """
+        return self._snapshot.read()
+
     def get_last_positions(self) -> list:
         """
-        Obtiene la última lectura de posiciones de los servos.
+        Obtiene la última lectura válida de posiciones de los servos.
 
         Returns:
             list: Lista de 6 posiciones (grados) o None.
         """
-        with self._lock:
-            return list(self._last_positions)
+        snapshot = self._snapshot.read()
+        return [None] * 6 if snapshot is None else snapshot.positions
 
     def get_last_temperatures(self) -> list:
         """
-        Obtiene la última lectura de temperaturas de los motores.
+        Obtiene la última lectura válida de temperaturas de los motores.
 
         Returns:
             list: Lista de 6 temperaturas (Celsius) o None.
         """
-        with self._lock:
-            return list(self._last_temperaturas)
+        snapshot = self._snapshot.read()
+        return [None] * 6 if snapshot is None else snapshot.temperatures
 
     def get_last_positions_locked(self) -> list:
         """
-        Lectura segura (bajo cerrojo) de posiciones de servos.
+        Lectura consistente de posiciones de servos (sin cerrojo).
+
+        Se conserva por compatibilidad; equivale a `get_last_positions`.
 
         Returns:
             list: Copia de 6 posiciones (grados).
         """
-        with self._lock:
-            return list(self._last_positions)
+        return self.get_last_positions()
 
     def get_last_temperatures_locked(self) -> list:
         """
-        Lectura segura (bajo cerrojo) de temperaturas de motores.
+        Lectura consistente de temperaturas de motores (sin cerrojo).
+
+        Se conserva por compatibilidad; equivale a `get_last_temperatures`.
 
         Returns:
             list: Copia de 6 temperaturas (Celsius).
         """
-        with self._lock:
-            return list(self._last_temperaturas)
+        return self.get_last_temperatures()
 
     def get_telemetry_counter(self) -> int:
         """
@@ -133,8 +190,31 @@ class RobotWorker(QThread):
         Returns:
             int: Numero de tramas validas procesadas.
         """
-        with self._lock:
-            return self._telemetry_counter
+        return self._telemetry_counter
+
+    def add_telemetry_listener(self, callback):
+        """
+        Registra un callback que se invoca en cada trama válida aceptada.
+
+        El callback se ejecuta en el hilo serial, por lo que debe ser
+        inmediato (p. ej. `threading.Event.set`); los datos se leen después
+        con `snapshot()`.
+
+        Args:
+            callback (callable): Función sin argumentos.
+        """
+        if callback not in self._telemetry_listeners:
+            self._telemetry_listeners = self._telemetry_listeners + (callback,)
+
+    def remove_telemetry_listener(self, callback):
+        """
+        Elimina un callback registrado con `add_telemetry_listener`.
+
+        Args:
+            callback (callable): Función registrada previamente.
+        """
+        self._telemetry_listeners = tuple(
+            cb for cb in self._telemetry_listeners if cb != callback)
 
     def enqueue_data(self, valorm):
         """
@@ -152,17 +232,112 @@ class RobotWorker(QThread):
             except queue.Empty:
                 break
         self._send_queue.put(valorm)
+        self._wake()
+
+    def _wake(self):
+        """
+        Despierta al hilo de comunicación escribiendo en el self-pipe.
+
+        Si el pipe ya tiene bytes pendientes el hilo despertará de todos
+        modos, por lo que un pipe lleno se ignora.
+        """
+        wake_w = self._wake_w
+        if wake_w is None:
+            return
+        try:
+            os.write(wake_w, b"\0")
+        except (BlockingIOError, OSError):
+            pass
+
+    def _drain_wake_pipe(self):
+        """Vacía el self-pipe tras un despertar."""
+        try:
+            while os.read(self._wake_r, 512):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def _close_wake_pipe(self):
+        """Cierra los descriptores del self-pipe (una vez detenido el hilo)."""
+        fds = (self._wake_r, self._wake_w)
+        self._wake_r = self._wake_w = None
+        for fd in fds:
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+
+    def _serial_fileno(self):
+        """
+        Obtiene el descriptor del puerto serie si está abierto.
+
+        Returns:
+            int | None: Descriptor de archivo o None si no hay conexión.
+        """
+        if self._cm904 is None or not getattr(self._cm904, 'is_open', False):
+            return None
+        try:
+            return self._cm904.fileno()
+        except (AttributeError, OSError, serial.SerialException):
+            return None
 
     def run(self):
         """
-        Bucle principal del hilo de comunicación continuo y asíncrono.
+        Bucle principal del hilo de comunicación, dirigido por eventos.
+
+        En POSIX el hilo se bloquea en un selector sobre el descriptor del
+        puerto serie y el self-pipe de la cola de envío: despierta solo
+        cuando llegan bytes o se encola un comando, de modo que la latencia
+        queda limitada por el hardware y el consumo en reposo es nulo.
+        En plataformas sin descriptores seleccionables (Windows) se usa el
+        sondeo periódico de la cola y del buffer de entrada.
+        """
+        if os.name != "posix":
+            self._run_polling()
+            return
+
+        selector = selectors.DefaultSelector()
+        selector.register(self._wake_r, selectors.EVENT_READ)
+        serial_fd = None
+        try:
+            while self._running:
+                fd = self._serial_fileno()
+                if fd != serial_fd:
+                    if serial_fd is not None:
+                        selector.unregister(serial_fd)
+                    if fd is not None:
+                        selector.register(fd, selectors.EVENT_READ)
+                    serial_fd = fd
+
+                readable = False
+                for key, _ in selector.select():
+                    if key.fd == self._wake_r:
+                        self._drain_wake_pipe()
+                    else:
+                        readable = True
+
+                try:
+                    valorm = self._send_queue.get_nowait()
+                except queue.Empty:
+                    valorm = None
+                if valorm is not None:
+                    self._send_command(valorm)
+
+                if readable:
+                    self._read_telemetry_continuous(readable=True)
+        finally:
+            selector.unregister(self._wake_r)
+            selector.close()
+
+    def _run_polling(self):
+        """
+        Bucle de respaldo por sondeo para plataformas sin selector serial.
 
         En cada ciclo intenta extraer un comando de la cola de envío con un
         tiempo de espera corto; si lo hay, lo transmite. De forma
-        independiente, lee de inmediato cualquier telemetria pendiente en el
-        buffer de entrada del puerto serie y la procesa, actualizando el
-        estado interno bajo cerrojo. Esto garantiza telemetria en tiempo real
-        y a la maxima velocidad del hardware, sin bloqueos ni congelamiento.
+        independiente, lee cualquier telemetria pendiente en el buffer de
+        entrada del puerto serie y la procesa.
         """
         while self._running:
             try:
@@ -197,7 +372,7 @@ class RobotWorker(QThread):
                 self.connection_status_changed.emit(False)
                 return
 
-        # Envío de trama compacta: A<pwm>B<pwm>C<pwm>D<pwm>E<pwm>F<pwm>\n
+        # Envío de trama compacta (ASCII A<pwm>...F<pwm>\n o binaria)
         try:
             frame = self._build_command_frame(valorm)
             self._cm904.write(frame)
@@ -214,77 +389,59 @@ class RobotWorker(QThread):
 
     def _build_command_frame(self, positions: list) -> bytes:
         """
-        Construye la trama compacta esperada por el microcontrolador.
+        Construye la trama de comando esperada por el microcontrolador.
 
         Args:
             positions (list): Lista de 6 posiciones objetivo en grados (0-300).
 
         Returns:
-            bytes: Trama ASCII `A...B...C...D...E...F...\n` con valores PWM.
+            bytes: Trama codificada según el códec activo.
         """
-        frame = ""
-        for index, char in enumerate(['A', 'B', 'C', 'D', 'E', 'F']):
-            position = max(0.0, min(300.0, float(positions[index])))
-            pwm_value = int(round(position * (1023 / 300)))
-            frame += f"{char}{pwm_value}"
-        return f"{frame}\n".encode('ascii')
+        return self._codec.encode_command(positions)
 
-    def _read_telemetry_continuous(self):
+    def _read_telemetry_continuous(self, readable: bool = False):
         """
-        Lee de forma continua las lineas de telemetria disponibles en el
-        puerto serie y actualiza el estado interno cuando se completa una
-        trama valida de 6 motores. No bloquea: solo procesa lo disponible.
+        Lee de un solo golpe los bytes disponibles en el puerto serie, los
+        entrega al códec y actualiza el estado interno por cada trama valida
+        de 6 motores. No bloquea: solo procesa lo disponible.
+
+        Args:
+            readable (bool): True si el selector reportó el puerto como
+                legible; sin bytes pendientes indica una desconexión, que
+                `read` reporta como excepción.
         """
         if self._cm904 is None or not getattr(self._cm904, 'is_open', False):
             return
         try:
             waiting = self._cm904.in_waiting
+            if not waiting and not readable:
+                return
+            data = self._cm904.read(waiting or 1)
         except (serial.SerialException, OSError):
             self.connection_status_changed.emit(False)
             self._cm904 = None
-            return
-        if not waiting:
+            self._codec.reset()
             return
 
-        while self._cm904.in_waiting:
-            try:
-                line = self._cm904.readline().decode(
-                    'ascii', errors='ignore').strip()
-            except (serial.SerialException, OSError):
-                self.connection_status_changed.emit(False)
-                self._cm904 = None
-                return
-            if not line:
-                continue
-            matches = self._TELEMETRY_PATTERN.findall(line)
-            if len(matches) >= 6:
-                self._update_from_matches(matches)
+        for positions, temperatures in self._codec.feed(data):
+            self._update_from_frame(positions, temperatures)
 
-    def _update_from_matches(self, matches):
+    def _update_from_frame(self, temp_pos, frame_temps):
         """
-        Procesa 6+ coincidencias de telemetria, aplica los filtros anti-ruido
-        y de trama nula, y actualiza el estado interno bajo cerrojo.
+        Procesa una trama decodificada de 6 motores, aplica los filtros
+        anti-ruido y de trama nula, y publica el registro en el buffer
+        circular de telemetría.
 
         Args:
-            matches (list): Lista de tuplas (motor, posicion, temperatura).
+            temp_pos (list): 6 posiciones (grados) o None por motor ausente.
+            frame_temps (list): 6 temperaturas (Celsius) o None por motor ausente.
         """
-        temp_pos = [None] * 6
-        with self._lock:
-            temperatures = list(self._last_temperaturas)
-            last_valid = list(self._last_valid_positions)
-
-        for motor_char, position_value, temperature_value in matches:
-            idx = ord(motor_char) - ord('A')
-            if idx < 6:
-                temp_pos[idx] = float(position_value)
-                temperatures[idx] = int(temperature_value)
+        t_ns = time.monotonic_ns()
+        last_valid = self._last_valid_positions
 
         # Deteccion de tramas nulas / caidas de tension
         if all(v is not None and abs(v) < 0.001 for v in temp_pos[:4]):
-            with self._lock:
-                positions = list(self._last_valid_positions)
-                temps = list(self._last_temperaturas)
-            self._emit_telemetry(positions, temps)
+            self._hold_telemetry(FLAG_NULL, t_ns)
             return
 
         # Filtro anti-ruido electromagnetico con escape de seguridad
@@ -300,24 +457,41 @@ class RobotWorker(QThread):
                     self._jump_freeze_count[i] = 0
 
         if not trama_valida:
-            with self._lock:
-                positions = list(self._last_valid_positions)
-                temps = list(self._last_temperaturas)
-            self._emit_telemetry(positions, temps)
+            self._hold_telemetry(FLAG_HELD, t_ns)
             return
 
         # Actualizacion limpia de la telemetria
         positions = list(last_valid)
+        temperatures = list(self._last_temperaturas)
         for i in range(6):
             if temp_pos[i] is not None:
                 positions[i] = temp_pos[i]
+            if frame_temps[i] is not None:
+                temperatures[i] = frame_temps[i]
+
+        self._last_valid_positions = positions
+        self._last_temperaturas = temperatures
+        self._telemetry.push(positions, temperatures, FLAG_VALID, t_ns)
+        self._telemetry_counter += 1
+        self._snapshot.publish(
+            self._telemetry_counter, t_ns, positions, temperatures)
+        for callback in self._telemetry_listeners:
+            callback()
 
-        with self._lock:
-            self._last_valid_positions = list(positions)
-            self._last_positions = list(positions)
-            self._last_temperaturas = list(temperatures)
-            self._telemetry_counter += 1
+        self._emit_telemetry(positions, temperatures)
+
+    def _hold_telemetry(self, flags, t_ns):
+        """
+        Registra y re-emite la última telemetría válida ante una trama
+        descartada por los filtros.
 
+        Args:
+            flags (int): FLAG_NULL o FLAG_HELD según el motivo del descarte.
+            t_ns (int): Marca de tiempo de recepción.
+        """
+        positions = self._last_valid_positions
+        temperatures = self._last_temperaturas
+        self._telemetry.push(positions, temperatures, flags, t_ns)
         self._emit_telemetry(positions, temperatures)
 
     def _emit_telemetry(self, positions, temperatures):
@@ -335,11 +509,13 @@ class RobotWorker(QThread):
         Detiene el hilo de ejecución y cierra el puerto serial de forma segura.
         """
         self._running = False
+        self._wake()
+        self.quit()
+        self.wait()
+        self._close_wake_pipe()
         try:
             if self._cm904 and getattr(self._cm904, 'is_open', False):
                 self._cm904.close()
         except (serial.SerialException, OSError):
             pass
         self.connection_status_changed.emit(False)
-        self.quit()
-        self.wait()
@@ -0,0 +1,271 @@
+"""
+Códecs de trama para la comunicación serial con la placa OpenCM9.04.
+
+Separa el formato de las tramas (comandos y telemetría) de la lógica de
+transporte del RobotWorker. Se ofrecen dos implementaciones intercambiables:
+
+    - AsciiCodec: formato histórico `A<pwm>B<pwm>...F<pwm>\\n` para comandos
+      y `A<pos>TA<temp>;B...` para telemetría.
+    - BinaryCodec: formato compacto con cabecera, longitud, campos de tamaño
+      fijo little-endian y checksum estilo Dynamixel.
+
+Ambos analizadores trabajan sobre un `bytearray` reutilizable, de modo que
+el hilo serial solo entrega los bytes leídos y recibe tramas ya decodificadas
+sin construir cadenas intermedias.
+
+Formato binario (todas las cifras little-endian):
+
+    Comando:    A5 5A | LEN | 0x01 | 6 x uint16 (cuentas PWM 0-1023) | CHK
+    Telemetría: A5 5A | LEN | 0x02 | 6 x uint16 (centésimas de grado)
+                | 6 x uint8 (temperatura en Celsius) | CHK
+
+`LEN` cuenta los bytes entre el propio campo y el checksum (tipo + datos)
+y `CHK = ~(LEN + tipo + datos) & 0xFF`.
+"""
+
+import re
+import struct
+
+MOTOR_COUNT = 6
+_PWM_SCALE = 1023 / 300
+
+
+def position_to_pwm(position: float) -> int:
+    """
+    Convierte una posición de servo en grados a cuentas PWM del AX-12A.
+
+    Args:
+        position (float): Posición en grados (0-300), se satura al rango.
+
+    Returns:
+        int: Cuentas PWM (0-1023).
+    """
+    position = max(0.0, min(300.0, float(position)))
+    return int(round(position * _PWM_SCALE))
+
+
+class AsciiCodec:
+    """
+    Códec del protocolo ASCII original de la placa.
+
+    Los comandos se codifican como `A<pwm>B<pwm>C<pwm>D<pwm>E<pwm>F<pwm>\\n`.
+    La telemetría se separa por líneas y cada línea se analiza con una
+    expresión regular compilada sobre bytes, evitando decodificar a `str`.
+    """
+
+    name = "ascii"
+
+    _TELEMETRY_PATTERN = re.compile(rb"([A-F])(\d+\.?\d*)T[A-F](\d+)")
+    _MAX_BUFFER = 4096
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def encode_command(self, positions: list) -> bytes:
+        """
+        Construye la trama de comando ASCII.
+
+        Args:
+            positions (list): Lista de 6 posiciones objetivo en grados (0-300).
+
+        Returns:
+            bytes: Trama `A...B...C...D...E...F...\\n` con valores PWM.
+        """
+        return b"A%dB%dC%dD%dE%dF%d\n" % tuple(
+            position_to_pwm(positions[i]) for i in range(MOTOR_COUNT))
+
+    def feed(self, data) -> list:
+        """
+        Agrega bytes recibidos y devuelve las tramas completas decodificadas.
+
+        Args:
+            data (bytes | bytearray | memoryview): Bytes leídos del puerto.
+
+        Returns:
+            list: Tuplas (posiciones, temperaturas), cada una con 6 elementos
+            (`None` para los motores ausentes en la trama).
+        """
+        buffer = self._buffer
+        buffer += data
+        frames = []
+        start = 0
+        while True:
+            end = buffer.find(b"\n", start)
+            if end < 0:
+                break
+            matches = self._TELEMETRY_PATTERN.findall(buffer, start, end)
+            start = end + 1
+            if len(matches) < MOTOR_COUNT:
+                continue
+            positions = [None] * MOTOR_COUNT
+            temperatures = [None] * MOTOR_COUNT
+            for motor, position, temperature in matches:
+                idx = motor[0] - 0x41
+                positions[idx] = float(position)
+                temperatures[idx] = int(temperature)
+            frames.append((positions, temperatures))
+        if start:
+            del buffer[:start]
+        if len(buffer) > self._MAX_BUFFER:
+            # Línea sin terminador: se descarta para no crecer sin límite
+            buffer.clear()
+        return frames
+
+    def reset(self):
+        """Descarta los bytes parciales pendientes."""
+        self._buffer.clear()
+
+
+class BinaryCodec:
+    """
+    Códec binario de longitud fija con verificación de integridad.
+
+    El analizador mantiene un único `bytearray` de recepción y decodifica
+    cada trama directamente desde un `memoryview` con `struct.unpack_from`,
+    sin copias intermedias. Las tramas con checksum inválido se descartan
+    y se resincroniza buscando la siguiente cabecera.
+    """
+
+    name = "binary"
+
+    HEADER = b"\xa5\x5a"
+    TYPE_COMMAND = 0x01
+    TYPE_TELEMETRY = 0x02
+
+    _COMMAND = struct.Struct("<6H")
+    _TELEMETRY = struct.Struct("<6H6B")
+    _MAX_BUFFER = 4096
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._command = bytearray(4 + self._COMMAND.size + 1)
+        self._command[0:2] = self.HEADER
+        self._command[2] = 1 + self._COMMAND.size
+        self._command[3] = self.TYPE_COMMAND
+
+    @staticmethod
+    def checksum(data) -> int:
+        """
+        Calcula el checksum complementado de la trama (estilo Dynamixel).
+
+        Args:
+            data (bytes | memoryview): Bytes de LEN, tipo y datos.
+
+        Returns:
+            int: Checksum de 8 bits.
+        """
+        return ~sum(data) & 0xFF
+
+    def encode_command(self, positions: list) -> bytes:
+        """
+        Construye la trama binaria de comando.
+
+        Args:
+            positions (list): Lista de 6 posiciones objetivo en grados (0-300).
+
+        Returns:
+            bytes: Trama binaria de 17 bytes.
+        """
+        frame = self._command
+        self._COMMAND.pack_into(
+            frame, 4, *(position_to_pwm(positions[i]) for i in range(MOTOR_COUNT)))
+        frame[-1] = self.checksum(memoryview(frame)[2:-1])
+        return bytes(frame)
+
+    def encode_telemetry(self, positions: list, temperatures: list) -> bytes:
+        """
+        Construye una trama binaria de telemetría (usada por emuladores y firmware de prueba).
+
+        Args:
+            positions (list): 6 posiciones en grados (0-300).
+            temperatures (list): 6 temperaturas en Celsius.
+
+        Returns:
+            bytes: Trama binaria de 23 bytes.
+        """
+        frame = bytearray(4 + self._TELEMETRY.size + 1)
+        frame[0:2] = self.HEADER
+        frame[2] = 1 + self._TELEMETRY.size
+        frame[3] = self.TYPE_TELEMETRY
+        self._TELEMETRY.pack_into(
+            frame, 4,
+            *(int(round(max(0.0, min(300.0, p)) * 100)) for p in positions),
+            *(max(0, min(255, int(t))) for t in temperatures))
+        frame[-1] = self.checksum(memoryview(frame)[2:-1])
+        return bytes(frame)
+
+    def feed(self, data) -> list:
+        """
+        Agrega bytes recibidos y devuelve las tramas de telemetría válidas.
+
+        Args:
+            data (bytes | bytearray | memoryview): Bytes leídos del puerto.
+
+        Returns:
+            list: Tuplas (posiciones, temperaturas) de 6 elementos cada una.
+        """
+        buffer = self._buffer
+        buffer += data
+        frames = []
+        size = self._TELEMETRY.size
+        pos = 0
+        with memoryview(buffer) as view:
+            while True:
+                pos = buffer.find(self.HEADER, pos)
+                if pos < 0 or len(buffer) - pos < 4:
+                    break
+                length = buffer[pos + 2]
+                # Validar tipo y LEN antes de esperar el resto de la trama:
+                # un LEN corrupto no debe retrasar la resincronización
+                if buffer[pos + 3] != self.TYPE_TELEMETRY or length != 1 + size:
+                    pos += 1
+                    continue
+                end = pos + 3 + length
+                if end >= len(buffer):
+                    break
+                if self.checksum(view[pos + 2:end]) != buffer[end]:
+                    pos += 1
+                    continue
+                values = self._TELEMETRY.unpack_from(view, pos + 4)
+                frames.append((
+                    [v / 100.0 for v in values[:MOTOR_COUNT]],
+                    list(values[MOTOR_COUNT:])))
+                pos = end + 1
+        if pos < 0:
+            # Sin cabecera: conservar solo un posible primer byte de cabecera
+            keep = 1 if buffer[-1:] == self.HEADER[:1] else 0
+            del buffer[:len(buffer) - keep]
+        elif pos:
+            del buffer[:pos]
+        if len(buffer) > self._MAX_BUFFER:
+            buffer.clear()
+        return frames
+
+    def reset(self):
+        """Descarta los bytes parciales pendientes."""
+        self._buffer.clear()
+
+
+CODECS = {
+    AsciiCodec.name: AsciiCodec,
+    BinaryCodec.name: BinaryCodec,
+}
+
+
+def create_codec(name: str = "ascii"):
+    """
+    Crea una instancia de códec a partir de su nombre.
+
+    Args:
+        name (str): 'ascii' o 'binary'.
+
+    Returns:
+        AsciiCodec | BinaryCodec: Instancia nueva del códec solicitado.
+
+    Raises:
+        ValueError: Si el nombre no corresponde a un códec conocido.
+    """
+    try:
+        return CODECS[name]()
+    except KeyError:
+        raise ValueError(f"Códec de telemetría desconocido: {name}") from None
@@ -0,0 +1,258 @@
+"""
+Buffers de telemetría con marca de tiempo para el robot físico.
+
+Proporciona TelemetryRing, un arreglo estructurado de NumPy preasignado que
+el RobotWorker llena con cada trama decodificada:
+
+    (seq, t_ns, pos[6], temp[6], flags)
+
+Hay un único escritor (el hilo serial) y cualquier número de lectores. Los
+lectores no toman cerrojos: copian los registros solicitados y verifican
+con el número de secuencia de cada ranura que el escritor no los haya
+sobrescrito durante la copia, descartando los registros inconsistentes.
+
+Para el lazo de control se ofrece además SnapshotBuffer, un doble buffer con
+contador de secuencia (seqlock) que entrega de una sola vez la última
+telemetría válida (posiciones, temperaturas, secuencia y marca de tiempo).
+
+Conexiones:
+    - Lo posee y escribe `RobotWorker`.
+    - Lo leen `KinematicsWorker` y las gráficas (vía `PhysicalSignalManager`).
+"""
+
+import time
+from typing import NamedTuple
+import numpy as np
+
+MOTOR_COUNT = 6
+
+# Banderas por registro
+FLAG_VALID = 0x01   # Trama aceptada: actualiza la posición válida
+FLAG_HELD = 0x02    # Trama rechazada por el filtro anti-ruido (se repite la última válida)
+FLAG_NULL = 0x04    # Trama nula / caída de tensión (se repite la última válida)
+
+TELEMETRY_DTYPE = np.dtype([
+    ("seq", np.int64),
+    ("t_ns", np.int64),
+    ("pos", np.float64, (MOTOR_COUNT,)),
+    ("temp", np.float32, (MOTOR_COUNT,)),
+    ("flags", np.uint8),
+])
+
+
+class TelemetrySnapshot(NamedTuple):
+    """
+    Telemetría válida más reciente, coherente entre todos sus campos.
+
+    Attributes:
+        positions (list): 6 posiciones en grados (0-300).
+        temperatures (list): 6 temperaturas en Celsius (None si se desconoce).
+        sequence (int): Número de tramas válidas recibidas hasta esta.
+        t_ns (int): Marca `time.monotonic_ns()` de recepción.
+    """
+    positions: list
+    temperatures: list
+    sequence: int
+    t_ns: int
+
+
+class SnapshotBuffer:
+    """
+    Doble buffer con contador de versión (seqlock) de un solo escritor.
+
+    El escritor llena la ranura no publicada y luego incrementa la versión,
+    cuya paridad indica la ranura vigente; nunca espera a los lectores. El
+    lector copia la ranura vigente y reintenta solo si la versión cambió
+    durante la copia, de modo que nunca obtiene campos de tramas distintas.
+    """
+
+    def __init__(self):
+        self._slots = np.zeros(2, dtype=TELEMETRY_DTYPE)
+        self._version = 0
+
+    def publish(self, sequence: int, t_ns: int, positions, temperatures,
+                flags: int = FLAG_VALID):
+        """
+        Publica una nueva telemetría (solo hilo escritor).
+
+        Args:
+            sequence (int): Número de secuencia de la trama.
+            t_ns (int): Marca de tiempo de recepción.
+            positions (list): 6 posiciones en grados.
+            temperatures (list): 6 temperaturas (None se guarda como NaN).
+            flags (int): Banderas del registro.
+        """
+        version = self._version + 1
+        slot = self._slots[version & 1]
+        slot["seq"] = sequence
+        slot["t_ns"] = t_ns
+        slot["pos"] = positions
+        slot["temp"] = [np.nan if t is None else t for t in temperatures]
+        slot["flags"] = flags
+        self._version = version
+
+    def read(self) -> TelemetrySnapshot | None:
+        """
+        Obtiene la última telemetría publicada sin bloquear al escritor.
+
+        Returns:
+            TelemetrySnapshot | None: Instantánea coherente o None si aún
+            no se ha publicado nada.
+        """
+        while True:
+            version = self._version
+            if version == 0:
+                return None
+            record = self._slots[version & 1].copy()
+            if self._version == version:
+                break
+        return TelemetrySnapshot(
+            record["pos"].tolist(),
+            [None if np.isnan(t) else int(t) for t in record["temp"]],
+            int(record["seq"]),
+            int(record["t_ns"]))
+
+
+class TelemetryRing:
+    """
+    Buffer circular de un escritor y múltiples lectores sin cerrojo.
+
+    Cada registro guarda su propio número de secuencia (1, 2, 3, ...). El
+    escritor invalida la ranura (`seq = -1`), escribe los campos y publica
+    la secuencia al final; un lector acepta un registro solo si tras copiarlo
+    su secuencia coincide con la esperada.
+
+    Args:
+        capacity (int): Número de registros conservados (historial).
+    """
+
+    def __init__(self, capacity: int = 4096):
+        self._capacity = int(capacity)
+        self._data = np.zeros(self._capacity, dtype=TELEMETRY_DTYPE)
+        self._data["seq"] = -1
+        self._head = 0
+
+    # --- Escritura (solo hilo serial) ---
+
+    def push(self, positions, temperatures, flags: int = FLAG_VALID,
+             t_ns: int | None = None) -> int:
+        """
+        Agrega un registro sobrescribiendo el más antiguo si está lleno.
+
+        Args:
+            positions (list): 6 posiciones en grados (None se guarda como NaN).
+            temperatures (list): 6 temperaturas en Celsius (None como NaN).
+            flags (int): Combinación de FLAG_VALID / FLAG_HELD / FLAG_NULL.
+            t_ns (int, optional): Marca `time.monotonic_ns()` de recepción.
+
+        Returns:
+            int: Número de secuencia asignado al registro.
+        """
+        seq = self._head + 1
+        record = self._data[seq % self._capacity]
+        record["seq"] = -1
+        record["t_ns"] = time.monotonic_ns() if t_ns is None else t_ns
+        record["pos"] = [np.nan if p is None else p for p in positions]
+        record["temp"] = [np.nan if t is None else t for t in temperatures]
+        record["flags"] = flags
+        record["seq"] = seq
+        self._head = seq
+        return seq
+
+    # --- Lectura (cualquier hilo) ---
+
+    def get_capacity(self) -> int:
+        """
+        Obtiene la capacidad del buffer.
+
+        Returns:
+            int: Número máximo de registros conservados.
+        """
+        return self._capacity
+
+    def sequence(self) -> int:
+        """
+        Obtiene la secuencia del último registro publicado.
+
+        Returns:
+            int: 0 si aún no hay registros.
+        """
+        return self._head
+
+    def latest(self, flags: int | None = None):
+        """
+        Obtiene una copia del registro más reciente.
+
+        Args:
+            flags (int, optional): Si se indica, devuelve el registro más
+                reciente que tenga alguna de estas banderas.
+
+        Returns:
+            np.void | None: Registro con campos seq, t_ns, pos, temp, flags,
+            o None si no hay registros (que cumplan el filtro).
+        """
+        head = self._head
+        oldest = max(1, head - self._capacity + 1)
+        for seq in range(head, oldest - 1, -1):
+            record = self._data[seq % self._capacity].copy()
+            if record["seq"] != seq:
+                # Ranura sobrescrita por el escritor: lo anterior ya no existe
+                return None
+            if flags is None or record["flags"] & flags:
+                return record
+        return None
+
+    def last(self, n: int) -> np.ndarray:
+        """
+        Obtiene copia de los últimos `n` registros en orden cronológico.
+
+        Args:
+            n (int): Cantidad de registros solicitados.
+
+        Returns:
+            np.ndarray: Arreglo estructurado (puede tener menos de `n`).
+        """
+        head = self._head
+        n = min(int(n), head, self._capacity)
+        return self._copy_range(head - n + 1, head)
+
+    def since(self, seq: int) -> np.ndarray:
+        """
+        Obtiene copia de los registros con secuencia mayor que `seq`.
+
+        Si el lector se atrasó más que la capacidad, solo se devuelven los
+        registros aún disponibles.
+
+        Args:
+            seq (int): Última secuencia ya consumida por el lector.
+
+        Returns:
+            np.ndarray: Arreglo estructurado en orden cronológico.
+        """
+        head = self._head
+        first = max(int(seq) + 1, head - self._capacity + 1, 1)
+        return self._copy_range(first, head)
+
+    def _copy_range(self, first: int, last: int) -> np.ndarray:
+        """
+        Copia el rango de secuencias [first, last] descartando registros
+        sobrescritos durante la copia.
+
+        Args:
+            first (int): Primera secuencia (inclusive).
+            last (int): Última secuencia (inclusive).
+
+        Returns:
+            np.ndarray: Registros consistentes en orden cronológico.
+        """
+        if last < first:
+            return np.empty(0, dtype=TELEMETRY_DTYPE)
+        idx = np.arange(first, last + 1) % self._capacity
+        out = self._data[idx]
+        expected = np.arange(first, last + 1)
+        valid = out["seq"] == expected
+        if valid.all():
+            return out
+        # El escritor alcanzó el inicio del rango: conservar el sufijo íntegro
+        start = int(np.flatnonzero(~valid)[-1]) + 1
+        return out[start:]
@@ -3,7 +3,10 @@ Paquete de servicios de visión artificial y detección.
 
 Proporciona herramientas para control de cámara, detección de
 tableros ChArUco, detección de esferas de color por segmentación
-HSV, dibujo de resultados sobre el frame y estimación de pose 3D.
+HSV, dibujo de resultados sobre el frame, estimación de pose 3D,
+un pool de frames preasignados con un hilo de captura que conserva
+el frame más reciente, seguimiento de esferas entre frames y caché
+de la pose del tablero.
 """
 
 from src.services.vision.camera_connection import CameraConnection
@@ -11,11 +14,20 @@ from src.services.vision.charuco_detection import ChArUcoDetection
 from src.services.vision.pose_estimation import PoseEstimation
 from src.services.vision.circle_detection import CircleDetection
 from src.services.vision.detection_drawer import DetectionDrawer
+from src.services.vision.frame_pool import FramePool, FrameSlot
+from src.services.vision.frame_grabber import FrameGrabber
+from src.services.vision.sphere_tracker import SphereTracker
+from src.services.vision.board_pose_cache import BoardPoseCache
 
 __all__ = [
     "CameraConnection",
     "ChArUcoDetection",
     "PoseEstimation",
     "CircleDetection",
-    "DetectionDrawer"
+    "DetectionDrawer",
+    "FramePool",
+    "FrameSlot",
+    "FrameGrabber",
+    "SphereTracker",
+    "BoardPoseCache"
 ]
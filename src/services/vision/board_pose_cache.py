@@ -0,0 +1,218 @@
+"""
+Caché de la pose del tablero ChArUco para cámara y tablero fijos.
+
+Durante una sesión la cámara y el tablero casi nunca se mueven, así que
+repetir en cada frame la detección de marcadores, la homografía, la
+extrapolación de la malla y `solvePnP` es trabajo redundante.
+
+`BoardPoseCache` observa las detecciones completas y, cuando rvec/tvec se
+mantienen dentro de tolerancia durante `stable_frames` detecciones
+seguidas, "bloquea" la pose: guarda el último resultado y pequeños
+parches en escala de grises alrededor de algunas esquinas interiores.
+Mientras está bloqueada, cada frame se verifica comparando esos parches
+(correlación normalizada, robusta a cambios de iluminación) en las mismas
+posiciones de imagen; si suficientes coinciden se reutiliza el resultado
+sin detectar.
+
+Si la verificación falla (deriva u oclusión) se vuelve a detectar y
+`solvePnP` parte de la pose bloqueada (`useExtrinsicGuess`). Si la nueva
+pose concuerda con la bloqueada se renuevan los parches (la falla fue una
+oclusión pasajera); si no, se desbloquea y se vuelve a medir la
+estabilidad.
+
+Conexiones:
+    - `CameraWorker` mantiene una instancia por sesión de cámara.
+    - `ChArUcoDetection` llama a `verify`, `sample_patches`, `guess` y
+      `observe`.
+"""
+
+import threading
+import numpy as np
+import cv2
+
+
+class BoardPoseCache:
+    """
+    Bloqueo de la pose del tablero y verificación fotométrica barata.
+
+    Seguro entre hilos: varias tareas de `ChArUcoDetection` pueden usarlo
+    a la vez.
+
+    Args:
+        stable_frames (int): Detecciones estables seguidas para bloquear.
+        rotation_tol (float): Tolerancia de rvec en radianes.
+        translation_tol (float): Tolerancia de tvec en mm.
+        samples (int): Esquinas muestreadas para la verificación.
+        patch_size (int): Lado del parche en pixeles (impar).
+        ncc_threshold (float): Correlación mínima de un parche coincidente.
+        min_consistent (float): Fracción mínima de parches coincidentes.
+    """
+
+    def __init__(self, stable_frames: int = 5, rotation_tol: float = 0.005,
+                 translation_tol: float = 2.0, samples: int = 12,
+                 patch_size: int = 11, ncc_threshold: float = 0.8,
+                 min_consistent: float = 0.75):
+        self.stable_frames = int(stable_frames)
+        self.rotation_tol = float(rotation_tol)
+        self.translation_tol = float(translation_tol)
+        self.samples = int(samples)
+        self.half = int(patch_size) // 2
+        self.ncc_threshold = float(ncc_threshold)
+        self.min_consistent = float(min_consistent)
+        self._lock = threading.Lock()
+        self._history = []
+        self._locked = None   # (resultado, puntos (N, 2), parches (N, p, p))
+        self._drift = False
+        self._stats = {"hits": 0, "verify_failures": 0, "locks": 0, "unlocks": 0}
+
+    @property
+    def locked(self) -> bool:
+        """True si hay una pose bloqueada."""
+        return self._locked is not None
+
+    def reset(self):
+        """Olvida la pose bloqueada y el historial de estabilidad."""
+        with self._lock:
+            self._history.clear()
+            self._locked = None
+            self._drift = False
+
+    def get_stats(self) -> dict:
+        """
+        Obtiene los contadores de uso.
+
+        Returns:
+            dict: hits (frames servidos desde la caché), verify_failures,
+            locks, unlocks y locked.
+        """
+        with self._lock:
+            return dict(self._stats, locked=self._locked is not None)
+
+    # --- Parches ---
+
+    def sample_patches(self, frame, corners):
+        """
+        Extrae parches en escala de grises alrededor de algunas esquinas.
+
+        Args:
+            frame (np.ndarray): Frame BGR completo.
+            corners (np.ndarray): Esquinas detectadas (N, 1, 2).
+
+        Returns:
+            tuple: (puntos (M, 2) int, parches (M, p, p) float32) con M <=
+            `samples`; solo esquinas cuyo parche cabe en el frame.
+        """
+        points = np.rint(np.asarray(corners, dtype=np.float64).reshape(-1, 2)).astype(int)
+        height, width = frame.shape[:2]
+        h = self.half
+        inside = ((points[:, 0] >= h) & (points[:, 0] < width - h)
+                  & (points[:, 1] >= h) & (points[:, 1] < height - h))
+        points = points[inside]
+        if len(points) > self.samples:
+            points = points[np.linspace(0, len(points) - 1, self.samples).astype(int)]
+        return points, self._patches(frame, points)
+
+    def _patches(self, frame, points) -> np.ndarray:
+        """Parches en gris (M, p, p) centrados en `points`."""
+        h = self.half
+        patches = [frame[y - h:y + h + 1, x - h:x + h + 1] for x, y in points]
+        if not patches:
+            return np.empty((0, 2 * h + 1, 2 * h + 1), dtype=np.float32)
+        if frame.ndim == 3:
+            patches = [cv2.cvtColor(p, cv2.COLOR_BGR2GRAY) for p in patches]
+        return np.asarray(patches, dtype=np.float32)
+
+    def _consistent(self, current, reference) -> float:
+        """Fracción de parches cuya correlación normalizada supera el umbral."""
+        a = current - current.mean(axis=(1, 2), keepdims=True)
+        b = reference - reference.mean(axis=(1, 2), keepdims=True)
+        denom = np.sqrt((a * a).sum(axis=(1, 2)) * (b * b).sum(axis=(1, 2)))
+        flat = denom < 1e-3
+        ncc = np.where(flat, 0.0, (a * b).sum(axis=(1, 2)) / np.where(flat, 1.0, denom))
+        # Parches sin textura: se comparan por diferencia absoluta media
+        same_flat = np.abs(current - reference).mean(axis=(1, 2)) < 10.0
+        return float(np.mean(np.where(flat, same_flat, ncc >= self.ncc_threshold)))
+
+    # --- Ciclo de detección ---
+
+    def verify(self, frame):
+        """
+        Comprueba si el tablero sigue donde se bloqueó.
+
+        Args:
+            frame (np.ndarray): Frame BGR completo.
+
+        Returns:
+            dict | None: Copia del resultado bloqueado si el frame es
+            consistente; None si no hay bloqueo o falla la verificación
+            (en ese caso la siguiente detección usa la pose como guess).
+        """
+        with self._lock:
+            locked = self._locked
+        if locked is None:
+            return None
+        result, points, reference = locked
+        if self._consistent(self._patches(frame, points), reference) >= self.min_consistent:
+            with self._lock:
+                self._drift = False
+                self._stats["hits"] += 1
+            return dict(result)
+        with self._lock:
+            self._drift = True
+            self._stats["verify_failures"] += 1
+        return None
+
+    def guess(self):
+        """
+        Pose inicial para refinar con `useExtrinsicGuess` tras una deriva.
+
+        Returns:
+            tuple | None: (rvec, tvec) copiados de la pose bloqueada, o
+            None si no hay deriva pendiente.
+        """
+        with self._lock:
+            if self._locked is None or not self._drift:
+                return None
+            result = self._locked[0]
+            return result["rvec"].copy(), result["tvec"].copy()
+
+    def observe(self, result, patches):
+        """
+        Registra una detección completa y actualiza el bloqueo.
+
+        Args:
+            result (dict | None): Resultado de `ChArUcoDetection` (con
+                rvec y tvec) o None si la detección falló.
+            patches (tuple): Salida de `sample_patches` del mismo frame.
+        """
+        with self._lock:
+            if result is None:
+                # Tablero no visible (p. ej. tapado): se conserva el bloqueo
+                self._history.clear()
+                return
+            pose = (np.asarray(result["rvec"], dtype=float).ravel(),
+                    np.asarray(result["tvec"], dtype=float).ravel())
+
+            if self._locked is not None:
+                if self._close(pose, self._locked[0]):
+                    self._locked = (result, *patches)
+                    self._drift = False
+                    return
+                self._locked = None
+                self._drift = False
+                self._stats["unlocks"] += 1
+
+            self._history = [p for p in self._history if self._close(pose, p)]
+            self._history.append(pose)
+            if len(self._history) >= self.stable_frames and len(patches[0]):
+                self._locked = (result, *patches)
+                self._history.clear()
+                self._stats["locks"] += 1
+
+    def _close(self, pose, other) -> bool:
+        """True si dos poses difieren menos que las tolerancias."""
+        if isinstance(other, dict):
+            other = (np.asarray(other["rvec"], dtype=float).ravel(),
+                     np.asarray(other["tvec"], dtype=float).ravel())
+        return (np.linalg.norm(pose[0] - other[0]) < self.rotation_tol
+                and np.linalg.norm(pose[1] - other[1]) < self.translation_tol)
@@ -59,8 +59,9 @@ class CameraConnection:
         """Enciende la cámara con configuración optimizada.
 
         Selecciona la API de captura según la plataforma (DShow en
-        Windows, V4L2 en Linux) y configura resolucion, FPS y
-        aceleracion por hardware.
+        Windows, V4L2 en Linux) y configura formato MJPG, resolucion y
+        FPS en ambas, más aceleracion por hardware en Windows y un buffer
+        de un frame en Linux. El modo obtenido se consulta con `get_mode`.
 
         Returns:
             bool: True si la cámara se inicializó correctamente.
@@ -81,6 +82,8 @@ class CameraConnection:
 
             elif sys.platform == "linux":
                 self.cap = cv2.VideoCapture(self.camera_index, cv2.CAP_V4L2)
+                if self.cap.isOpened():
+                    self.__negotiate_v4l2()
 
             if not self.cap or not self.cap.isOpened():
                 raise IOError("No se pudo abrir la cámara")
@@ -97,6 +100,40 @@ class CameraConnection:
             self.__release_camera()
             return False
 
+    def __negotiate_v4l2(self) -> None:
+        """Solicita a V4L2 el modo configurado.
+
+        El orden importa: el driver elige los tamaños disponibles según el
+        formato, así que MJPG se fija antes que la resolución y esta antes
+        que los FPS. Un buffer de un solo frame evita leer frames viejos.
+        """
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.default_width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.default_height)
+        self.cap.set(cv2.CAP_PROP_FPS, self.default_fps)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    def get_mode(self) -> dict:
+        """Obtiene el modo realmente negociado con la cámara.
+
+        Returns:
+            dict: width, height, fps, fourcc (texto) y buffer_size, más el
+            modo solicitado en `requested`. Vacío si la cámara está cerrada.
+        """
+        if not self.cap or not self.cap.isOpened():
+            return {}
+        code = int(self.cap.get(cv2.CAP_PROP_FOURCC))
+        fourcc = "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4)).strip("\x00")
+        return {
+            "width": int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            "height": int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            "fps": float(self.cap.get(cv2.CAP_PROP_FPS)),
+            "fourcc": fourcc,
+            "buffer_size": int(self.cap.get(cv2.CAP_PROP_BUFFERSIZE)),
+            "requested": {"width": self.default_width, "height": self.default_height,
+                          "fps": self.default_fps},
+        }
+
     def camera_off(self):
         """Apaga la cámara y libera los recursos asociados."""
         self.camera_ready = False
@@ -111,15 +148,19 @@ class CameraConnection:
         """
         return self.cap is not None and self.cap.isOpened() and self.camera_ready
 
-    def take_frame(self) -> None | cv2.typing.MatLike:
+    def take_frame(self, out=None) -> None | cv2.typing.MatLike:
         """Captura un frame de la cámara en formato BGR.
 
+        Args:
+            out (np.ndarray, optional): Arreglo destino; OpenCV lo reutiliza
+                si coincide con la forma del frame y, si no, asigna uno nuevo.
+
         Returns:
             np.ndarray or None: Frame capturado o None si falla.
         """
         if not self.camera_ready or not self.cap:
             return None
-        ret, frame = self.cap.read()
+        ret, frame = self.cap.read(out)
         if ret:
             return frame
         return None
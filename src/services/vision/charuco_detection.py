@@ -1,6 +1,141 @@
+"""
+Módulo de detección de tableros ChArUco.
+
+Proporciona ChArUcoDetection, un QRunnable que detecta el tablero en un
+frame, extrapola la malla completa con la homografía y estima su pose, y
+CharucoDetectorPool, que construye una sola vez por configuración de
+tablero el diccionario, el tablero y la malla precalculada, y presta los
+detectores (no seguros entre hilos) a las tareas concurrentes del pool.
+Si se conoce la ROI del tablero en el frame anterior, los marcadores se
+buscan primero en su rectángulo y solo ante un fallo en el frame completo.
+Con un `BoardPoseCache` bloqueado, la detección se sustituye por una
+verificación fotométrica de la pose guardada.
+
+Conexiones:
+    - Ejecutado por un QThreadPool (CameraWorker).
+    - Reporta resultados a traves de `detection_callback`.
+    - Reporta errores a traves de `error_callback`.
+"""
+
+import threading
+from contextlib import contextmanager
 import cv2
 import numpy as np
 from PyQt6.QtCore import QRunnable
+from src.services.vision.geometry_utils import roi_bounds
+
+# Tablero de la mesa: (dictionary_id, (SQUARES_X, SQUARES_Y), lado, marcador)
+DEFAULT_BOARD = (cv2.aruco.DICT_4X4_50, (12, 5), 30, 22)
+
+
+class CharucoDetectorPool:
+    """
+    Tablero ChArUco compartido y reserva de detectores reutilizables.
+
+    El tablero y la malla completa (interiores y exteriores) se construyen
+    una vez y solo se leen. Cada tarea toma un par (CharucoDetector,
+    ArucoDetector) con `acquire` y lo devuelve al terminar; si todos están
+    en uso se construye uno nuevo, por lo que la reserva crece hasta el
+    número de hilos concurrentes y después deja de construir.
+
+    Args:
+        board_config (tuple): (dictionary_id, (SQUARES_X, SQUARES_Y),
+            squareLength, markerLength).
+    """
+
+    _pools = {}
+    _pools_lock = threading.Lock()
+
+    @classmethod
+    def get(cls, board_config=DEFAULT_BOARD):
+        """
+        Obtiene la reserva compartida de una configuración de tablero.
+
+        Args:
+            board_config (tuple): Configuración del tablero.
+
+        Returns:
+            CharucoDetectorPool: Instancia única por configuración.
+        """
+        key = (board_config[0], tuple(board_config[1]), *board_config[2:])
+        with cls._pools_lock:
+            pool = cls._pools.get(key)
+            if pool is None:
+                pool = cls._pools[key] = cls(key)
+            return pool
+
+    def __init__(self, board_config):
+        dictionary_id, size, square_length, marker_length = board_config
+        self.dictionary = cv2.aruco.getPredefinedDictionary(dictionary_id)
+        self.board = cv2.aruco.CharucoBoard(
+            size=size,
+            squareLength=square_length,
+            markerLength=marker_length,
+            dictionary=self.dictionary
+        )
+        self.full_grid, self.cols, self.rows = self._build_full_grid()
+        self.interior_set = frozenset(
+            (col, row) for row in range(1, self.rows - 1)
+            for col in range(1, self.cols - 1))
+        self._free = []
+        self._lock = threading.Lock()
+        self._created = 0
+
+    def _build_full_grid(self):
+        """
+        Genera TODOS los puntos de la grilla en coordenadas 3D del tablero,
+        incluyendo los exteriores que getChessboardCorners() no retorna.
+
+        Para un tablero (SQUARES_X, SQUARES_Y), la grilla completa es
+        (SQUARES_X+1) × (SQUARES_Y+1) puntos.
+        """
+        size = self.board.getChessboardSize()
+        square_length = self.board.getSquareLength()
+        cols = size[0] + 1
+        rows = size[1] + 1
+        ij = np.indices((rows, cols), dtype=np.float32).reshape(2, -1)
+        points = np.zeros((cols * rows, 3), dtype=np.float32)
+        points[:, 0] = ij[1] * square_length
+        points[:, 1] = ij[0] * square_length
+        points.setflags(write=False)
+        return points, cols, rows
+
+    def _create(self):
+        """Construye un par de detectores para este tablero."""
+        charuco_detector = cv2.aruco.CharucoDetector(self.board)
+        aruco_detector = cv2.aruco.ArucoDetector(
+            self.dictionary, cv2.aruco.DetectorParameters())
+        with self._lock:
+            self._created += 1
+        return charuco_detector, aruco_detector
+
+    @contextmanager
+    def acquire(self):
+        """
+        Presta un par (CharucoDetector, ArucoDetector) de uso exclusivo.
+
+        Yields:
+            tuple: (charuco_detector, aruco_detector).
+        """
+        with self._lock:
+            detectors = self._free.pop() if self._free else None
+        if detectors is None:
+            detectors = self._create()
+        try:
+            yield detectors
+        finally:
+            with self._lock:
+                self._free.append(detectors)
+
+    def get_stats(self) -> dict:
+        """
+        Obtiene los contadores de la reserva.
+
+        Returns:
+            dict: created (detectores construidos) y free (disponibles).
+        """
+        with self._lock:
+            return {"created": self._created, "free": len(self._free)}
 
 
 class ChArUcoDetection(QRunnable):
@@ -10,32 +145,46 @@ class ChArUcoDetection(QRunnable):
     proporcionado, evitando reconstrucciones innecesarias en cada frame.
     Utiliza el identificador de cada esquina detectada para calcular una
     homografía precisa y extrapolar la malla completa, incluso con oclusiones.
+
+    Attributes:
+        SEARCH_PADDING (int): Margen en pixeles alrededor de la ROI anterior
+            para la búsqueda recortada de marcadores.
     """
 
-    def __init__(self, frame, frame_id, camera_matrix, dist_coeff, detection_callback, error_callback):
-        """Inicializa el detector de tableros ChArUco.
+    SEARCH_PADDING = 80
+
+    def __init__(self, frame, frame_id, camera_matrix, dist_coeff, detection_callback, error_callback,
+                 board_config=DEFAULT_BOARD, frame_release=None, search_roi=None,
+                 pose_cache=None):
+        """Inicializa la tarea de detección de tableros ChArUco.
+
+        Args:
+            frame (cv2.UMat | np.ndarray): Frame de la tarea (no se copia;
+                puede ser una vista de solo lectura de un `FramePool`).
+            board_config (tuple, optional): Configuración del tablero; el
+                tablero y los detectores provienen de `CharucoDetectorPool`.
+            frame_release (callable, optional): Se invoca en cuanto la tarea
+                deja de leer el frame, para devolver su ranura al pool.
+            search_roi (np.ndarray, optional): ROI del tablero en el frame
+                anterior; los marcadores se buscan primero en su rectángulo
+                y, si no bastan, en el frame completo.
+            pose_cache (BoardPoseCache, optional): Caché de la pose del
+                tablero; con la pose bloqueada y verificada se omite la
+                detección.
         """
         super().__init__()
-        self.frame = frame.get().copy()
+        self.frame = frame
+        self.frame_release = frame_release
+        self.search_roi = search_roi
+        self.pose_cache = pose_cache
         self.frame_id = frame_id
         self.camera_matrix = camera_matrix
         self.dist_coeff = dist_coeff
         self.detection_callback = detection_callback
         self.error_callback = error_callback
 
-        # Inicializa los detectores para el código ArUco y almacena los de ChArUco
-        dictionary_id = cv2.aruco.DICT_4X4_50
-        self.aruco_dict = cv2.aruco.getPredefinedDictionary(dictionary_id)
-        self.charuco_board = cv2.aruco.CharucoBoard(
-            size=(12, 5),
-            squareLength=30,
-            markerLength=22,
-            dictionary=self.aruco_dict
-        )
-        self.charuco_detector = cv2.aruco.CharucoDetector(self.charuco_board)
-        detector_params = cv2.aruco.DetectorParameters()
-        self.aruco_detector = cv2.aruco.ArucoDetector(
-            self.charuco_board.getDictionary(), detector_params)
+        self.pool = CharucoDetectorPool.get(board_config)
+        self.charuco_board = self.pool.board
 
     def run(self) -> None | dict:
         """Detecta las esquinas del tablero ChArUco en un frame.
@@ -53,19 +202,42 @@ class ChArUcoDetection(QRunnable):
             if self.frame is None:
                 self.detection_callback(self.frame_id, None)
                 return
-
-            marker_corners, marker_ids, _ = self.aruco_detector.detectMarkers(
-                self.frame)
-
-            if marker_ids is None or len(marker_ids) < 6:
-                self.detection_callback(self.frame_id,  None)
-                return
-
-            charuco_corners, charuco_ids, _, _ = self.charuco_detector.detectBoard(
-                self.frame, markerCorners=marker_corners, markerIds=marker_ids
-            )
+            patches = None
+            try:
+                frame = self.frame.get() if isinstance(self.frame, cv2.UMat) else self.frame
+
+                if self.pose_cache is not None:
+                    cached = self.pose_cache.verify(frame)
+                    if cached is not None:
+                        self.detection_callback(self.frame_id, cached)
+                        return
+
+                with self.pool.acquire() as (charuco_detector, aruco_detector):
+                    charuco_corners, charuco_ids = None, None
+                    for bounds in self._search_regions(frame.shape):
+                        marker_corners, marker_ids = self._detect_markers(
+                            aruco_detector, frame, bounds)
+
+                        if marker_ids is None or len(marker_ids) < 6:
+                            continue
+
+                        # Interpolación y refinamiento subpíxel sobre el frame
+                        # completo, solo alrededor de los marcadores dados
+                        charuco_corners, charuco_ids, _, _ = charuco_detector.detectBoard(
+                            frame, markerCorners=marker_corners, markerIds=marker_ids
+                        )
+                        if charuco_corners is not None and len(charuco_corners) >= 6:
+                            break
+
+                if (self.pose_cache is not None and charuco_corners is not None
+                        and len(charuco_corners) >= 6):
+                    patches = self.pose_cache.sample_patches(frame, charuco_corners)
+            finally:
+                # El resto del cálculo solo usa las esquinas detectadas
+                self._release_frame()
 
             if charuco_corners is None or len(charuco_corners) < 6:
+                self._observe(None, None)
                 self.detection_callback(self.frame_id, None)
                 return
 
@@ -86,13 +258,27 @@ class ChArUcoDetection(QRunnable):
 
             unified_results = self.build_unified_grid(extrapolated_results)
 
-            _, rvec, tvec = cv2.solvePnP(
-                all_obj_points,
-                all_img_points,
-                self.camera_matrix,
-                self.dist_coeff,
-                flags=cv2.SOLVEPNP_ITERATIVE
-            )
+            # Tras una deriva se refina desde la pose bloqueada
+            guess = self.pose_cache.guess() if self.pose_cache is not None else None
+            if guess is not None:
+                _, rvec, tvec = cv2.solvePnP(
+                    all_obj_points,
+                    all_img_points,
+                    self.camera_matrix,
+                    self.dist_coeff,
+                    rvec=guess[0],
+                    tvec=guess[1],
+                    useExtrinsicGuess=True,
+                    flags=cv2.SOLVEPNP_ITERATIVE
+                )
+            else:
+                _, rvec, tvec = cv2.solvePnP(
+                    all_obj_points,
+                    all_img_points,
+                    self.camera_matrix,
+                    self.dist_coeff,
+                    flags=cv2.SOLVEPNP_ITERATIVE
+                )
 
             if unified_results is None:
                 self.detection_callback(self.frame_id, None)
@@ -100,12 +286,62 @@ class ChArUcoDetection(QRunnable):
 
             unified_results.update({"rvec": rvec, "tvec": tvec})
 
-            self.detection_callback(
-                self.frame_id, self.to_physical_coordinates(unified_results))
+            result = self.to_physical_coordinates(unified_results)
+            self._observe(result, patches)
+            self.detection_callback(self.frame_id, result)
         except (cv2.error, ValueError, np.linalg.LinAlgError) as e:
             self.error_callback(
                 f"Error al detectar el tablero: {type(e).__name__}: {e} (ChArUcoDetector)")
 
+    def _search_regions(self, frame_shape) -> list:
+        """Regiones donde buscar marcadores, en orden de prioridad.
+
+        Args:
+            frame_shape (tuple): Forma del frame.
+
+        Returns:
+            list: Rectángulo (x0, y0, x1, y1) alrededor de la última ROI
+            conocida, si existe, seguido de None (frame completo).
+        """
+        regions = [None]
+        if self.search_roi is not None:
+            bounds = roi_bounds(self.search_roi, frame_shape, self.SEARCH_PADDING)
+            if bounds is not None:
+                regions.insert(0, bounds)
+        return regions
+
+    @staticmethod
+    def _detect_markers(aruco_detector, frame, bounds):
+        """Detecta marcadores ArUco en el frame o en un recorte del mismo.
+
+        Args:
+            aruco_detector (cv2.aruco.ArucoDetector): Detector prestado.
+            frame (np.ndarray): Frame completo.
+            bounds (tuple | None): Rectángulo (x0, y0, x1, y1) o None.
+
+        Returns:
+            tuple: (marker_corners, marker_ids) en coordenadas del frame.
+        """
+        if bounds is None:
+            marker_corners, marker_ids, _ = aruco_detector.detectMarkers(frame)
+            return marker_corners, marker_ids
+        x0, y0, x1, y1 = bounds
+        marker_corners, marker_ids, _ = aruco_detector.detectMarkers(frame[y0:y1, x0:x1])
+        offset = np.array([x0, y0], dtype=np.float32)
+        return tuple(corners + offset for corners in marker_corners), marker_ids
+
+    def _observe(self, result, patches):
+        """Informa a la caché de pose del resultado de una detección completa."""
+        if self.pose_cache is not None and (result is None or patches is not None):
+            self.pose_cache.observe(result, patches)
+
+    def _release_frame(self):
+        """Suelta la referencia al frame prestado, una sola vez."""
+        self.frame = None
+        if self.frame_release is not None:
+            release, self.frame_release = self.frame_release, None
+            release()
+
     def __extrapolate_corners(self, board, charuco_corners, charuco_ids, H) -> np.ndarray:
         """Extrapola las esquinas externas usando la homografía calculada.
 
@@ -119,9 +355,9 @@ class ChArUcoDetection(QRunnable):
         if H is None:
             return None
 
-        # ── Grilla completa (interiores + exteriores) ──────────────────────────
-        full_grid_3d, cols, rows = self._get_full_grid_corners(board)
-        interior_set = self._get_interior_ids_set(board)
+        # ── Grilla completa (interiores + exteriores), precalculada ───────────
+        full_grid_3d, cols, rows = self.pool.full_grid, self.pool.cols, self.pool.rows
+        interior_set = self.pool.interior_set
 
         # Proyectar TODA la grilla con la homografía
         grid_2d = full_grid_3d[:, :2].reshape(-1, 1, 2)
@@ -176,39 +412,6 @@ class ChArUcoDetection(QRunnable):
             "board":                    self.charuco_board,
         }
 
-    def _get_interior_ids_set(self, board):
-        """
-        Retorna un set con las coordenadas (col, row) de los corners interiores
-        para poder excluirlos al dibujar los estimados exteriores.
-        """
-        size = board.getChessboardSize()
-        inner = set()
-        for row in range(1, size[1]):
-            for col in range(1, size[0]):
-                inner.add((col, row))
-        return inner
-
-    def _get_full_grid_corners(self, board):
-        """
-        Genera TODOS los puntos de la grilla en coordenadas 3D del tablero,
-        incluyendo los exteriores que getChessboardCorners() no retorna.
-
-        Para un tablero (SQUARES_X, SQUARES_Y), la grilla completa es
-        (SQUARES_X+1) × (SQUARES_Y+1) puntos.
-        """
-        size = board.getChessboardSize()   # (SQUARES_X, SQUARES_Y)
-        square_length = board.getSquareLength()
-
-        cols = size[0] + 1
-        rows = size[1] + 1
-
-        points = []
-        for row in range(rows):
-            for col in range(cols):
-                points.append([col * square_length, row * square_length, 0.0])
-
-        return np.array(points, dtype=np.float32), cols, rows
-
     def build_unified_grid(self, results: dict):
         """
         Unifica todos los corners en una grilla ordenada de (cols × rows) puntos.
@@ -5,15 +5,107 @@ Proporciona CircleDetection, un QRunnable que procesa un frame y
 detecta las esferas más grandes de cada color configurado, devolviendo
 su centro, radio, área y circularidad.
 
+La segmentación no recorre los colores: `HsvClassifier` compila los
+rangos HSV en tablas de consulta una sola vez por configuración y produce
+en una pasada una imagen de etiquetas (0 = fondo, k = k-ésimo color). Los
+blobs de cada color presente se extraen después con
+`connectedComponentsWithStats`, y los contornos solo se buscan dentro del
+rectángulo del blob elegido.
+
 Conexiones:
     - Ejecutado por un QThreadPool.
     - Reporta resultados a traves de `detection_callback`.
     - Reporta errores a traves de `error_callback`.
 """
 
+import threading
 from PyQt6.QtCore import QRunnable
 import numpy as np
 import cv2
+from src.services.vision.geometry_utils import roi_bounds
+
+_KERNEL = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
+_MIN_AREA = 500
+
+
+class HsvClassifier:
+    """
+    Clasificador de píxeles HSV por tablas de consulta.
+
+    Cada rango HSV es una caja alineada con los ejes, así que la pertenencia
+    se separa por canal: una tabla de 256 entradas por canal guarda un bit
+    por color, y el AND de los tres canales da los colores del píxel. Una
+    última tabla convierte la máscara de bits en la etiqueta del primer
+    color (en el orden de la configuración) que la contiene. El resultado es
+    exacto, equivalente a `inRange` por color, con tablas de 768 bytes por
+    cada grupo de 8 colores.
+
+    Args:
+        hsv_colors (dict): {nombre: (hmin, smin, vmin, hmax, smax, vmax)}.
+    """
+
+    _cache = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, hsv_colors: dict):
+        """
+        Obtiene el clasificador compilado para una configuración de colores.
+
+        Args:
+            hsv_colors (dict): Rangos HSV por color.
+
+        Returns:
+            HsvClassifier: Instancia compartida; se recompila solo si
+            cambian los rangos.
+        """
+        key = tuple((name, tuple(int(v) for v in bounds))
+                    for name, bounds in hsv_colors.items())
+        with cls._lock:
+            classifier = cls._cache.get(key)
+            if classifier is None:
+                classifier = cls(dict(key))
+                cls._cache = {key: classifier}
+            return classifier
+
+    def __init__(self, hsv_colors: dict):
+        self.names = list(hsv_colors)
+        if len(self.names) > 255:
+            raise ValueError("HsvClassifier admite como máximo 255 colores")
+        values = np.arange(256)
+        self._groups = []
+        for start in range(0, len(self.names), 8):
+            channel_lut = np.zeros((1, 256, 3), dtype=np.uint8)
+            for bit, name in enumerate(self.names[start:start + 8]):
+                low, high = np.split(np.asarray(hsv_colors[name]), 2)
+                inside = (values[:, None] >= low) & (values[:, None] <= high)
+                channel_lut[0] |= (inside << bit).astype(np.uint8)
+            # Etiqueta del bit menos significativo (prioridad por orden)
+            label_lut = np.zeros(256, dtype=np.uint8)
+            for mask in range(1, 256):
+                lowest = (mask & -mask).bit_length() - 1
+                label_lut[mask] = start + lowest + 1
+            self._groups.append((channel_lut, label_lut))
+
+    def classify(self, hsv) -> np.ndarray:
+        """
+        Etiqueta cada píxel de una imagen HSV.
+
+        Args:
+            hsv (np.ndarray): Imagen HSV de 8 bits (alto, ancho, 3).
+
+        Returns:
+            np.ndarray: Etiquetas uint8; 0 es fondo y k corresponde a
+            `names[k - 1]`.
+        """
+        labels = None
+        for channel_lut, label_lut in self._groups:
+            h, s, v = cv2.split(cv2.LUT(hsv, channel_lut))
+            group = cv2.LUT(cv2.bitwise_and(cv2.bitwise_and(h, s), v), label_lut)
+            labels = group if labels is None else np.where(labels > 0, labels, group)
+        if labels is None:
+            labels = np.zeros(hsv.shape[:2], dtype=np.uint8)
+        return labels
 
 
 class CircleDetection(QRunnable):
@@ -26,8 +118,11 @@ class CircleDetection(QRunnable):
 
     Attributes:
         COLORES (dict): Rangos HSV por defecto para cada color.
+        ROI_PADDING (int): Margen en pixeles del recorte alrededor de la ROI.
     """
 
+    ROI_PADDING = 8
+
     COLORES = {
         "amarillo": (20, 100, 100, 30, 255, 255),
         "verde":    (40, 70, 70, 80, 255, 255),
@@ -36,19 +131,27 @@ class CircleDetection(QRunnable):
         "morado":   (130, 94, 117, 180, 255, 255),
     }
 
-    def __init__(self, frame_umat: cv2.UMat, frame_id: int, roi: np.ndarray | None, hsv_colors: dict | None, detection_callback, error_callback) -> None:
+    def __init__(self, frame, frame_id: int, roi: np.ndarray | None, hsv_colors: dict | None, detection_callback, error_callback,
+                 frame_release=None, search_windows=None) -> None:
         """
         Args:
-            frame_umat (cv2.UMat): Frame como UMat para procesamiento OpenCL.
+            frame (np.ndarray | cv2.UMat): Frame BGR (no se copia; puede ser
+                una vista de solo lectura de un `FramePool`).
             frame_id (int): Identificador único del frame.
             roi (np.ndarray): Polígono de región de interés (máscara).
             hsv_colors (dict): Rangos HSV personalizados o None para usar predeterminados.
             detection_callback (callable): Función para reportar resultados.
             error_callback (callable): Función para reportar errores.
+            frame_release (callable, optional): Se invoca en cuanto la tarea
+                deja de leer el frame, para devolver su ranura al pool.
+            search_windows (dict, optional): {color: (x0, y0, x1, y1)} del
+                `SphereTracker`; si se da, solo se busca en esas ventanas.
         """
         super().__init__()
         self.show_geometry = False
-        self.frame_umat = frame_umat
+        self.search_windows = search_windows
+        self.frame = frame
+        self.frame_release = frame_release
         self.frame_id = frame_id
         self.roi = roi
         self.hsv_colors = hsv_colors or self.COLORES
@@ -58,9 +161,16 @@ class CircleDetection(QRunnable):
     def run(self):
         """Detecta la esfera más grande de cada color en el frame.
 
-        Aplica máscara de ROI si está definida, convierte a HSV,
-        segmenta por rango de color, aplica morfología, encuentra
-        contornos y calcula propiedades geométricas.
+        Con ventanas de búsqueda (del `SphereTracker`) solo procesa el
+        recorte de cada ventana y busca en él el color de su track. Si no,
+        y hay ROI, recorta el frame a su rectángulo (con margen) y
+        enmascara el polígono dentro del recorte. En ambos casos la
+        conversión a HSV y el resto de la cadena trabajan sobre el recorte
+        y los contornos se devuelven en coordenadas del frame completo.
+        Después etiqueta todos los colores en una pasada, aplica
+        morfología a la imagen de etiquetas y, por cada color con
+        suficientes píxeles, toma su componente conexa más grande y
+        calcula sus propiedades geométricas.
 
         Callback:
             dict con forma:
@@ -71,71 +181,173 @@ class CircleDetection(QRunnable):
             Solo incluye colores encontrados.
         """
         try:
-            if self.roi is not None:
-                mask = cv2.cvtColor(cv2.multiply(
-                    self.frame_umat, 0), cv2.COLOR_BGR2GRAY)
-                roi_umat = cv2.UMat(self.roi.astype('int32'))
-                cv2.drawContours(mask, [roi_umat], 0,
-                                 (255, 255, 255, 1), thickness=-1)
-                masked_frame = cv2.bitwise_and(
-                    self.frame_umat, self.frame_umat, mask=mask)
-            else:
-                masked_frame = self.frame_umat
-            hsv = cv2.cvtColor(masked_frame, cv2.COLOR_BGR2HSV)
+            try:
+                frame = self.frame.get() if isinstance(self.frame, cv2.UMat) else self.frame
+                regions = self._regions(frame)
+            finally:
+                self._release_frame()
 
+            classifier = HsvClassifier.get(self.hsv_colors)
             resultados = {}
-
-            for nombre_color, (hmin, smin, vmin, hmax, smax, vmax) in self.hsv_colors.items():
-                lower = cv2.UMat(np.array([hmin, smin, vmin], dtype="uint8"))
-                upper = cv2.UMat(np.array([hmax, smax, vmax], dtype="uint8"))
-                mask = cv2.inRange(hsv, lower, upper, None)
-
-                kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
-                mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
-                mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
-
-                contours, _ = cv2.findContours(
-                    mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
-                )
-
-                if contours:
-                    largest_contour = max(contours, key=cv2.contourArea)
-                    area = cv2.contourArea(largest_contour)
-
-                    if area > 500:
-                        moments = cv2.moments(largest_contour)
-                        if abs(moments["m00"]) < 1e-9:
-                            continue
-
-                        center = (
-                            moments["m10"] / moments["m00"],
-                            moments["m01"] / moments["m00"],
-                        )
-                        enclosing_center, enclosing_radius = cv2.minEnclosingCircle(
-                            largest_contour)
-                        area_radius = float(np.sqrt(area / np.pi))
-                        perimeter = cv2.arcLength(largest_contour, True)
-                        circularity = 0.0
-                        if perimeter > 1e-9:
-                            circularity = float(
-                                4.0 * np.pi * area / (perimeter * perimeter))
-
-                        circle = None
-                        if len(largest_contour.get()) >= 5:
-                            circle = cv2.fitEllipse(largest_contour)
-
-                        resultados[nombre_color] = {
-                            "circle": circle,
-                            "center": center,
-                            # "circle_center": enclosing_center,
-                            "radius": float(enclosing_radius),
-                            # "area_radius": area_radius,
-                            # "circularity": circularity,
-                            # "area":   area,
-                            # "contour": largest_contour
-                        }
+            for hsv, origin, colors in regions:
+                resultados.update(self._detect(classifier, hsv, origin, colors))
             self.detection_callback(
                 self.frame_id, resultados if resultados else None)
         except (cv2.error, ValueError, AttributeError) as e:
             self.error_callback(
                 f"Error al detectar esfera: {type(e).__name__}: {e} (CircleDetection)")
+
+    def _regions(self, frame) -> list:
+        """Recortes HSV a procesar.
+
+        Args:
+            frame (np.ndarray): Frame BGR completo.
+
+        Returns:
+            list: Tuplas (hsv, origen (x, y) del recorte, colores buscados o
+            None para todos).
+        """
+        if self.search_windows is not None:
+            regions = []
+            for color, window in self.search_windows.items():
+                corners = np.reshape(window, (2, 2))
+                bounds = roi_bounds(corners, frame.shape)
+                if bounds is None:
+                    continue
+                x0, y0, x1, y1 = bounds
+                hsv = cv2.cvtColor(frame[y0:y1, x0:x1], cv2.COLOR_BGR2HSV)
+                regions.append((hsv, (x0, y0), {color}))
+            return regions
+
+        if self.roi is None:
+            return [(cv2.cvtColor(frame, cv2.COLOR_BGR2HSV), (0, 0), None)]
+        bounds = roi_bounds(self.roi, frame.shape, self.ROI_PADDING)
+        if bounds is None:
+            return []
+        x0, y0, x1, y1 = bounds
+        origin = (x0, y0)
+        frame = frame[y0:y1, x0:x1]
+        mask = np.zeros(frame.shape[:2], dtype=np.uint8)
+        polygon = self.roi.astype(np.int32).reshape(-1, 2) - origin
+        cv2.fillPoly(mask, [polygon], 255)
+        frame = cv2.bitwise_and(frame, frame, mask=mask)
+        return [(cv2.cvtColor(frame, cv2.COLOR_BGR2HSV), origin, None)]
+
+    def _detect(self, classifier, hsv, origin, colors) -> dict:
+        """Detecta las esferas de un recorte HSV.
+
+        Args:
+            classifier (HsvClassifier): Clasificador de la configuración.
+            hsv (np.ndarray): Recorte en HSV.
+            origin (tuple): Esquina (x, y) del recorte en el frame.
+            colors (set | None): Colores a reportar; None para todos.
+
+        Returns:
+            dict: Resultados por color encontrados en el recorte.
+        """
+        labels = classifier.classify(hsv)
+        # Sobre etiquetas la morfología en escala de grises equivale a la
+        # binaria por color mientras los blobs no se toquen entre sí
+        labels = cv2.morphologyEx(labels, cv2.MORPH_OPEN, _KERNEL)
+        labels = cv2.morphologyEx(labels, cv2.MORPH_CLOSE, _KERNEL)
+        blobs = self._largest_blobs(labels)
+
+        resultados = {}
+
+        for label, nombre_color in enumerate(classifier.names, start=1):
+            if label not in blobs or (colors is not None and nombre_color not in colors):
+                continue
+            largest_contour = self._blob_contour(*blobs[label], origin)
+            if largest_contour is None:
+                continue
+            area = cv2.contourArea(largest_contour)
+
+            if area > _MIN_AREA:
+                moments = cv2.moments(largest_contour)
+                if abs(moments["m00"]) < 1e-9:
+                    continue
+
+                center = (
+                    moments["m10"] / moments["m00"],
+                    moments["m01"] / moments["m00"],
+                )
+                enclosing_center, enclosing_radius = cv2.minEnclosingCircle(
+                    largest_contour)
+                area_radius = float(np.sqrt(area / np.pi))
+                perimeter = cv2.arcLength(largest_contour, True)
+                circularity = 0.0
+                if perimeter > 1e-9:
+                    circularity = float(
+                        4.0 * np.pi * area / (perimeter * perimeter))
+
+                circle = None
+                if len(largest_contour) >= 5:
+                    circle = cv2.fitEllipse(largest_contour)
+
+                resultados[nombre_color] = {
+                    "circle": circle,
+                    "center": center,
+                    # "circle_center": enclosing_center,
+                    "radius": float(enclosing_radius),
+                    # "area_radius": area_radius,
+                    # "circularity": circularity,
+                    # "area":   area,
+                    # "contour": largest_contour
+                }
+        return resultados
+
+    @staticmethod
+    def _largest_blobs(labels: np.ndarray) -> dict:
+        """Selecciona el blob más grande de cada color en una sola pasada.
+
+        Etiqueta las componentes conexas del primer plano (todos los colores
+        a la vez) y separa por color solo dentro del rectángulo de cada
+        componente grande, por lo que blobs de colores distintos que se
+        tocan se siguen distinguiendo.
+
+        Args:
+            labels (np.ndarray): Imagen de etiquetas de `HsvClassifier`.
+
+        Returns:
+            dict: {etiqueta: (píxeles, máscara recortada, x, y)}.
+        """
+        _, foreground = cv2.threshold(labels, 0, 255, cv2.THRESH_BINARY)
+        _, components, stats, _ = cv2.connectedComponentsWithStatsWithAlgorithm(
+            foreground, 8, cv2.CV_32S, cv2.CCL_GRANA)
+        blobs = {}
+        for component in np.flatnonzero(stats[1:, cv2.CC_STAT_AREA] > _MIN_AREA) + 1:
+            x, y, w, h = (int(v) for v in stats[component, :4])
+            crop = np.where(components[y:y + h, x:x + w] == component,
+                            labels[y:y + h, x:x + w], 0)
+            present, pixels = np.unique(crop, return_counts=True)
+            for label, count in zip(present.tolist(), pixels.tolist()):
+                if label and count > _MIN_AREA and count > blobs.get(label, (0,))[0]:
+                    blobs[label] = (count, crop == label, x, y)
+        return blobs
+
+    @staticmethod
+    def _blob_contour(_pixels: int, mask: np.ndarray, x: int, y: int, origin=(0, 0)):
+        """Contorno exterior más grande de una máscara recortada.
+
+        Args:
+            mask (np.ndarray): Máscara booleana del blob en su rectángulo.
+            x, y (int): Esquina del rectángulo en la imagen de etiquetas.
+            origin (tuple): Esquina de la imagen de etiquetas en el frame.
+
+        Returns:
+            np.ndarray | None: Contorno en coordenadas del frame.
+        """
+        # Margen de 1 px: findContours no sigue bordes sobre el marco de la imagen
+        padded = np.pad(mask.astype(np.uint8), 1)
+        contours, _ = cv2.findContours(
+            padded, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE, offset=(x + origin[0] - 1, y + origin[1] - 1))
+        if not contours:
+            return None
+        return max(contours, key=cv2.contourArea)
+
+    def _release_frame(self):
+        """Suelta la referencia al frame prestado, una sola vez."""
+        self.frame = None
+        if self.frame_release is not None:
+            release, self.frame_release = self.frame_release, None
+            release()
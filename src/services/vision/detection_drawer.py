@@ -30,11 +30,16 @@ class DetectionDrawer(QRunnable):
         custom_origin (tuple): Offset del origen personalizado en mm.
         frame_callback (callable): Función para devolver el frame final.
         error_callback (callable): Función para reportar errores.
+        frame_release (callable, optional): Devuelve la ranura del frame al
+            `FramePool` tras copiarlo; el callback siempre recibe una copia
+            propia, que la UI puede conservar.
     """
 
-    def __init__(self, frame: np.ndarray, results: dict, view: tuple, custom_origin: tuple, camera_width: int, frame_callback, error_callback) -> None:
+    def __init__(self, frame: np.ndarray, results: dict, view: tuple, custom_origin: tuple, camera_width: int, frame_callback, error_callback,
+                 frame_release=None) -> None:
         super().__init__()
         self.frame = frame
+        self.frame_release = frame_release
         self.results = results
         self.charuco_view, self.circle_view = view
         self.custom_origin = custom_origin
@@ -60,16 +65,25 @@ class DetectionDrawer(QRunnable):
         Dibuja la malla ChArUco y las esferas segun las flags de
         visibilidad, y entrega el frame final a traves del callback.
         """
+        # Copia propia de salida; una ranura prestada se devuelve de inmediato
+        try:
+            if self.results is None and self.frame_release is None:
+                frame_out = self.frame
+            else:
+                frame_out = self.frame.copy()
+        finally:
+            self.frame = None
+            if self.frame_release is not None:
+                self.frame_release()
+
         if self.results is None:
-            self.frame_callback(self.frame)
+            self.frame_callback(frame_out)
             return
 
         grid_results = self.results.get("charuco", None)
         sphere_results = self.results.get("circles", None)
         pose_results = self.results.get("poses", None) or {}
 
-        frame_out = self.frame.copy()
-
         if grid_results is not None and self.charuco_view:
             try:
                 frame_out = self._draw_grid(frame_out, grid_results)
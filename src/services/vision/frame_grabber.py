@@ -0,0 +1,142 @@
+"""
+Hilo de captura desacoplado con política "el frame más reciente gana".
+
+`FrameGrabber` lee la cámara continuamente en su propio hilo, de modo que
+un consumidor lento nunca detiene `read()` ni deja que se acumulen frames
+viejos en el buffer del driver. Solo se conserva el último frame: si llega
+otro antes de que el consumidor tome el anterior, el anterior se descarta
+(y su ranura vuelve al `FramePool`). Cada frame lleva el instante de
+captura (`time.monotonic()` al terminar `read`) y un número de secuencia.
+
+Conexiones:
+    - Lee de una `CameraConnection` ya abierta.
+    - Escribe en las ranuras de un `FramePool` si se le proporciona.
+    - `CameraWorker` consume los frames con `take`.
+"""
+
+import time
+import threading
+
+
+class FrameGrabber:
+    """
+    Captura continua en segundo plano que conserva solo el último frame.
+
+    Args:
+        camera (CameraConnection): Cámara abierta.
+        frame_pool (FramePool, optional): Pool de ranuras; sin él cada
+            frame se captura en un arreglo nuevo (p. ej. en calibración,
+            donde el frame se entrega tal cual a la UI).
+    """
+
+    def __init__(self, camera, frame_pool=None):
+        self._camera = camera
+        self._pool = frame_pool
+        self._cond = threading.Condition()
+        self._latest = None   # (frame, slot, timestamp, seq)
+        self._seq = 0
+        self._error = None
+        self._stop_event = threading.Event()
+        self._stats = {"captured": 0, "dropped": 0, "delivered": 0,
+                       "latency_ms": 0.0, "fps": 0.0}
+        self._thread = threading.Thread(
+            target=self._run, name="FrameGrabber", daemon=True)
+
+    def start(self):
+        """Arranca el hilo de captura."""
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        """
+        Detiene el hilo y descarta el frame pendiente.
+
+        Debe llamarse antes de cerrar la cámara.
+
+        Args:
+            timeout (float): Espera máxima del hilo en segundos.
+        """
+        self._stop_event.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+        with self._cond:
+            latest, self._latest = self._latest, None
+        if latest is not None and latest[1] is not None:
+            latest[1].release()
+
+    def take(self, timeout: float = 1.0):
+        """
+        Toma el frame más reciente, esperando uno nuevo si no lo hay.
+
+        La ranura (si existe) pasa al llamador, que debe liberarla.
+
+        Args:
+            timeout (float): Espera máxima en segundos.
+
+        Returns:
+            tuple | None: (frame, slot, timestamp, seq), o None si vence la
+            espera o el grabber se detuvo.
+
+        Raises:
+            IOError: Si la cámara dejó de entregar frames.
+        """
+        with self._cond:
+            if self._latest is None and self._error is None:
+                self._cond.wait_for(
+                    lambda: self._latest is not None or self._error is not None
+                    or self._stop_event.is_set(), timeout)
+            if self._latest is None:
+                if self._error is not None:
+                    raise self._error
+                return None
+            latest, self._latest = self._latest, None
+        self._stats["delivered"] += 1
+        latency = (time.monotonic() - latest[2]) * 1e3
+        self._stats["latency_ms"] += 0.1 * (latency - self._stats["latency_ms"])
+        return latest
+
+    def get_stats(self) -> dict:
+        """
+        Obtiene los contadores del grabber.
+
+        Returns:
+            dict: captured, dropped (reemplazados sin consumir), delivered,
+            latency_ms (media móvil de captura a consumo) y fps medidos.
+        """
+        return dict(self._stats)
+
+    def _run(self):
+        """Ciclo de captura: lee, publica y descarta el frame no consumido."""
+        last = None
+        while not self._stop_event.is_set():
+            slot = self._pool.acquire() if self._pool is not None else None
+            frame = self._camera.take_frame(None if slot is None else slot.array)
+            timestamp = time.monotonic()
+            if frame is None:
+                if slot is not None:
+                    slot.release()
+                with self._cond:
+                    self._error = IOError(
+                        "No fue posible obtener el frame de video, verifique la conexión de la cámara.")
+                    self._cond.notify_all()
+                return
+            if slot is not None and not slot.holds(frame):
+                # Cambió la resolución: el frame ya es propio
+                slot.release()
+                slot = None
+                self._pool.configure(frame.shape)
+
+            with self._cond:
+                self._seq += 1
+                stale, self._latest = self._latest, (frame, slot, timestamp, self._seq)
+                self._cond.notify_all()
+            if stale is not None:
+                self._stats["dropped"] += 1
+                if stale[1] is not None:
+                    stale[1].release()
+
+            self._stats["captured"] += 1
+            if last is not None and timestamp > last:
+                self._stats["fps"] += 0.1 * (1.0 / (timestamp - last) - self._stats["fps"])
+            last = timestamp
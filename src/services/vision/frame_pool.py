@@ -0,0 +1,164 @@
+"""
+Pool de frames preasignados con préstamo por conteo de referencias.
+
+La captura escribe cada frame directamente en una ranura libre del pool
+(`cv2.VideoCapture.read(image=...)` reutiliza el arreglo si coincide la
+forma), en lugar de asignar un arreglo nuevo y copiarlo por cada tarea.
+Las tareas de visión reciben una vista de solo lectura de la ranura y la
+liberan al terminar; la ranura vuelve al pool cuando la suelta su último
+consumidor.
+
+Ciclo de vida de una ranura:
+
+    slot = pool.acquire()          # refs = 1 (hilo de captura)
+    camera.take_frame(slot.array)  # escritura in-place
+    task(slot.view(), release=slot.retain().release)  # refs + 1 por tarea
+    slot.release()                 # el hilo de captura suelta la suya
+
+Si el pool se agota (consumidores lentos) `acquire` devuelve None y el
+llamador captura en un arreglo propio, de modo que la captura nunca se
+bloquea esperando a las tareas.
+
+Conexiones:
+    - `FrameGrabber` captura sobre sus ranuras y `CameraWorker` las
+      reparte entre `ChArUcoDetection`, `CircleDetection` y
+      `DetectionDrawer`.
+"""
+
+import threading
+import numpy as np
+
+
+class FrameSlot:
+    """
+    Ranura del pool: un arreglo preasignado y su conteo de referencias.
+
+    Args:
+        pool (FramePool): Pool propietario.
+        array (np.ndarray): Memoria del frame.
+        generation (int): Generación del pool al crear la ranura.
+    """
+
+    __slots__ = ("array", "_pool", "_view", "_refs", "_generation")
+
+    def __init__(self, pool, array: np.ndarray, generation: int):
+        self.array = array
+        self._pool = pool
+        self._view = array.view()
+        self._view.flags.writeable = False
+        self._refs = 0
+        self._generation = generation
+
+    def view(self) -> np.ndarray:
+        """
+        Obtiene la vista de solo lectura que se presta a los consumidores.
+
+        Returns:
+            np.ndarray: Vista sin copia de `array` con `writeable=False`.
+        """
+        return self._view
+
+    def holds(self, frame) -> bool:
+        """
+        Indica si `frame` se escribió sobre la memoria de esta ranura.
+
+        Args:
+            frame (np.ndarray): Frame devuelto por la captura.
+
+        Returns:
+            bool: False si la captura tuvo que asignar otro arreglo (p. ej.
+            por un cambio de resolución).
+        """
+        return frame is self.array
+
+    def retain(self):
+        """
+        Añade una referencia para un consumidor.
+
+        Returns:
+            FrameSlot: La propia ranura, para encadenar `retain().release`.
+        """
+        with self._pool._lock:
+            self._refs += 1
+        return self
+
+    def release(self):
+        """Suelta una referencia; con la última, la ranura vuelve al pool."""
+        self._pool._release(self)
+
+
+class FramePool:
+    """
+    Conjunto fijo de ranuras de frame preasignadas.
+
+    Args:
+        shape (tuple): Forma de los frames (alto, ancho, canales).
+        slots (int): Número de ranuras.
+        dtype (np.dtype): Tipo de dato de los frames.
+    """
+
+    def __init__(self, shape, slots: int = 8, dtype=np.uint8):
+        self._lock = threading.Lock()
+        self._slots = int(slots)
+        self._dtype = dtype
+        self._shape = None
+        self._generation = 0
+        self._free = []
+        self._misses = 0
+        self.configure(shape)
+
+    def configure(self, shape):
+        """
+        Reasigna las ranuras si cambia la forma de los frames.
+
+        Las ranuras prestadas de la forma anterior siguen siendo válidas
+        para sus consumidores, pero se descartan al liberarse.
+
+        Args:
+            shape (tuple): Nueva forma (alto, ancho, canales).
+        """
+        shape = tuple(int(s) for s in shape)
+        with self._lock:
+            if shape == self._shape:
+                return
+            self._shape = shape
+            self._generation += 1
+            self._free = [FrameSlot(self, np.empty(shape, dtype=self._dtype), self._generation)
+                          for _ in range(self._slots)]
+
+    def acquire(self):
+        """
+        Toma una ranura libre con una referencia (la del llamador).
+
+        Returns:
+            FrameSlot | None: None si todas las ranuras están prestadas.
+        """
+        with self._lock:
+            if not self._free:
+                self._misses += 1
+                return None
+            slot = self._free.pop()
+            slot._refs = 1
+            return slot
+
+    def _release(self, slot: FrameSlot):
+        """Decrementa las referencias de `slot` y lo devuelve si llegan a 0."""
+        with self._lock:
+            slot._refs -= 1
+            if slot._refs > 0:
+                return
+            if slot._refs < 0:
+                raise RuntimeError("FrameSlot liberado más veces de las retenidas")
+            if slot._generation == self._generation:
+                self._free.append(slot)
+
+    def get_stats(self) -> dict:
+        """
+        Obtiene el estado del pool.
+
+        Returns:
+            dict: shape, slots, free y misses (capturas sin ranura libre).
+        """
+        with self._lock:
+            return {"shape": self._shape, "slots": self._slots,
+                    "free": len(self._free), "misses": self._misses}
@@ -2,7 +2,13 @@
 Módulo de utilidades geométricas para visión artificial.
 
 Proporciona funciones para transformaciones espaciales, proyecciones de rayos
-y cálculos de intersección entre el espacio de imagen y el espacio 3D.
+y cálculos de intersección entre el espacio de imagen y el espacio 3D, y el
+rectángulo de recorte de una región de interés.
+
+Las versiones por lotes (`pixels_to_camera_rays`,
+`pixels_to_board_coordinates`) corrigen la distorsión de N pixeles con una
+sola llamada a `undistortPoints` e intersectan todos los rayos con el plano
+en una operación vectorizada.
 """
 
 import cv2
@@ -22,24 +28,30 @@ def pixel_to_camera_ray(pixel, camera_matrix, dist_coeffs, frame_size):
     Returns:
         np.ndarray: Vector unitario (rayo) 3x1 en coordenadas de cámara.
     """
-    # Asegurar que sean arreglos de numpy para evitar errores en cv2
-    K = np.asarray(camera_matrix, dtype=np.float64)
-    D = np.asarray(dist_coeffs, dtype=np.float64)
+    return pixels_to_camera_rays([pixel], camera_matrix, dist_coeffs).reshape(3, 1)
+
 
-    image_point = np.array([[pixel]], dtype=np.float64)
-    # UndistortPoints devuelve coordenadas normalizadas (x/z, y/z)
-    undistorted = cv2.undistortPoints(
-        image_point, K, D, P=K)
+def pixels_to_camera_rays(pixels, camera_matrix, dist_coeffs):
+    """
+    Convierte N pixeles en rayos unitarios en el espacio de la cámara.
 
-    # Para obtener el rayo en coordenadas de cámara, necesitamos proyectar
-    # de nuevo al espacio normalizado (sin la matriz de cámara K)
-    # o usar K_inv. cv2.undistortPoints con P=None devuelve (x/z, y/z).
-    undistorted_norm = cv2.undistortPoints(
-        image_point, K, D)
+    Args:
+        pixels (array-like): Coordenadas (N, 2) de los pixeles.
+        camera_matrix (np.ndarray): Matriz intrínseca de la cámara.
+        dist_coeffs (np.ndarray): Coeficientes de distorsion.
 
-    x_norm, y_norm = undistorted_norm[0, 0]
-    ray = np.array([[x_norm], [y_norm], [1.0]], dtype=np.float64)
-    return ray / np.linalg.norm(ray)
+    Returns:
+        np.ndarray: Rayos unitarios (N, 3) en coordenadas de cámara.
+    """
+    pixels = np.asarray(pixels, dtype=np.float64).reshape(-1, 1, 2)
+    # Una sola corrección de distorsión para todo el lote; sin P,
+    # undistortPoints devuelve coordenadas normalizadas (x/z, y/z)
+    normalized = cv2.undistortPoints(
+        pixels,
+        np.asarray(camera_matrix, dtype=np.float64),
+        np.asarray(dist_coeffs, dtype=np.float64)).reshape(-1, 2)
+    rays = np.column_stack([normalized, np.ones(len(normalized))])
+    return rays / np.linalg.norm(rays, axis=1, keepdims=True)
 
 
 def pixel_to_board_coordinates(pixel, rvec, tvec, camera_matrix, dist_coeffs, frame_size, plane_z=0):
@@ -58,25 +70,72 @@ def pixel_to_board_coordinates(pixel, rvec, tvec, camera_matrix, dist_coeffs, fr
     Returns:
         np.ndarray: Vector de posicion 3x1 en el espacio del tablero.
     """
-    # 1. Obtener rayo en espacio de camara
-    ray_cam = pixel_to_camera_ray(
-        pixel, camera_matrix, dist_coeffs, frame_size)
+    points = pixels_to_board_coordinates(
+        [pixel], rvec, tvec, camera_matrix, dist_coeffs, plane_z)
+    if np.isnan(points[0, 0]):
+        return None  # Rayo paralelo al plano
+    return points[0].reshape(3, 1)
+
+
+def pixels_to_board_coordinates(pixels, rvec, tvec, camera_matrix, dist_coeffs, plane_z=0):
+    """
+    Intersecta los rayos de N pixeles con un plano paralelo al tablero, en
+    una sola operación vectorizada.
+
+    Args:
+        pixels (array-like): Coordenadas (N, 2) de los pixeles.
+        rvec (np.ndarray): Vector de rotación del tablero.
+        tvec (np.ndarray): Vector de traslación del tablero.
+        camera_matrix (np.ndarray): Matriz de la cámara.
+        dist_coeffs (np.ndarray): Coeficientes de distorsion.
+        plane_z (float): Altura del plano de intersección respecto al tablero (mm).
+
+    Returns:
+        np.ndarray: Posiciones (N, 3) en el espacio del tablero; filas NaN
+        para rayos paralelos al plano.
+    """
+    # 1. Rayos en espacio de camara
+    rays_cam = pixels_to_camera_rays(pixels, camera_matrix, dist_coeffs)
 
     # 2. Matrices de transformación
-    rotation_matrix, _ = cv2.Rodrigues(rvec)
-    tvec = np.asarray(tvec, dtype=np.float64).reshape(3, 1)
+    rotation_matrix, _ = cv2.Rodrigues(np.asarray(rvec, dtype=np.float64))
+    tvec = np.asarray(tvec, dtype=np.float64).reshape(3)
 
-    # 3. Transformar centro de cámara y rayo al espacio del tablero
+    # 3. Transformar centro de cámara y rayos al espacio del tablero
     # La posición de la cámara en el espacio del tablero es -R.T @ t
     camera_center_board = -rotation_matrix.T @ tvec
-    ray_board = rotation_matrix.T @ ray_cam
+    rays_board = rays_cam @ rotation_matrix  # (R.T @ ray) por fila
+
+    # 4. Intersección rayo-plano (Z = plane_z):
+    # plane_z = camera_center_board[2] + ray_scale * ray_board[2]
+    dz = rays_board[:, 2]
+    parallel = np.abs(dz) < 1e-10
+    ray_scale = (plane_z - camera_center_board[2]) / np.where(parallel, 1.0, dz)
+    points = camera_center_board + ray_scale[:, None] * rays_board
+    points[parallel] = np.nan
+    return points
 
-    if abs(ray_board[2, 0]) < 1e-10:
-        return None  # Rayo paralelo al plano
 
-    # 4. Cálculo de la intersección rayo-plano (Z = plane_z)
-    # P_board = camera_center_board + ray_scale * ray_board
-    # P_board[2] = plane_z  => plane_z = camera_center_board[2] + ray_scale * ray_board[2]
-    ray_scale = (plane_z - camera_center_board[2, 0]) / ray_board[2, 0]
+def roi_bounds(roi, frame_shape, padding=0):
+    """
+    Calcula el rectángulo que contiene un polígono de ROI, con margen y
+    recortado a los límites del frame.
 
-    return camera_center_board + ray_scale * ray_board
+    Args:
+        roi (np.ndarray): Polígono (N, 1, 2) o (N, 2) en pixeles.
+        frame_shape (tuple): Forma del frame (alto, ancho, ...).
+        padding (int): Margen en pixeles alrededor del polígono.
+
+    Returns:
+        tuple | None: (x0, y0, x1, y1) para indexar `frame[y0:y1, x0:x1]`,
+        o None si el rectángulo queda vacío.
+    """
+    points = np.asarray(roi, dtype=np.float64).reshape(-1, 2)
+    height, width = frame_shape[:2]
+    x0, y0 = np.floor(points.min(axis=0)).astype(int) - padding
+    x1, y1 = np.ceil(points.max(axis=0)).astype(int) + padding + 1
+    x0, y0 = max(int(x0), 0), max(int(y0), 0)
+    x1, y1 = min(int(x1), width), min(int(y1), height)
+    if x1 <= x0 or y1 <= y0:
+        return None
+    return x0, y0, x1, y1
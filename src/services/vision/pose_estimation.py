@@ -14,7 +14,7 @@ Conexiones:
 import cv2
 import numpy as np
 from PyQt6.QtCore import QRunnable
-from src.services.vision.geometry_utils import pixel_to_board_coordinates
+from src.services.vision.geometry_utils import pixels_to_board_coordinates
 
 
 class PoseEstimation(QRunnable):
@@ -23,7 +23,8 @@ class PoseEstimation(QRunnable):
 
     Esta clase utiliza técnicas de ray-casting para intersectar el rayo visual
     proveniente del centro de una esfera con un plano paralelo al tablero
-    ChArUco, situado a una distancia igual al radio de la esfera.
+    ChArUco, situado a una distancia igual al radio de la esfera. Todas las
+    esferas se intersectan en una sola llamada vectorizada.
     """
 
     def __init__(self, results: dict, camera_matrix, dist_coeffs, frame_size,
@@ -82,27 +83,21 @@ class PoseEstimation(QRunnable):
                     self.pose_callback(self.frame_id, final_poses)
                 return
 
-            # R transforma coordenadas del tablero hacia coordenadas de cámara.
-            rotation_matrix, _ = cv2.Rodrigues(self.rvec)
-
-            for color_name, sphere_data in self.circle_results.items():
-                center = sphere_data.get("center")
-                if center is None:
-                    continue
-                
-                # Calculamos la posición del centro de la esfera (plane_z = radio)
-                p_world = pixel_to_board_coordinates(
-                    center, self.rvec, self.tvec, self.camera_matrix, 
-                    self.dist_coeffs, self.frame_size, self.sphere_radius
-                )
-                
-                if p_world is None:
-                    continue
-
-                p_final = self._apply_custom_origin(p_world)
-
-                final_poses[color_name] = p_final.flatten().tolist()
-                sphere_data["position"] = final_poses[color_name]
+            colors = [color for color, data in self.circle_results.items()
+                      if data.get("center") is not None]
+            if colors:
+                # Centro de cada esfera: plano paralelo al tablero a z = radio
+                centers = [self.circle_results[color]["center"] for color in colors]
+                p_world = pixels_to_board_coordinates(
+                    centers, self.rvec, self.tvec, self.camera_matrix,
+                    self.dist_coeffs, self.sphere_radius)
+                p_final = self._apply_custom_origin(p_world.T).T
+
+                for color_name, position in zip(colors, p_final):
+                    if np.isnan(position[0]):
+                        continue
+                    final_poses[color_name] = position.tolist()
+                    self.circle_results[color_name]["position"] = final_poses[color_name]
 
             if self.pose_callback is not None:
                 self.pose_callback(self.frame_id, final_poses)
@@ -116,10 +111,10 @@ class PoseEstimation(QRunnable):
         Aplica el desplazamiento del origen personalizado.
 
         Args:
-            p_world (np.ndarray): Coordenadas 3x1 en el espacio del tablero.
+            p_world (np.ndarray): Coordenadas 3xN en el espacio del tablero.
 
         Returns:
-            np.ndarray: Coordenadas 3x1 respecto al origen personalizado.
+            np.ndarray: Coordenadas 3xN respecto al origen personalizado.
         """
         # Restar el offset físico definido por el usuario para trasladar el origen
         p_final = p_world - self.custom_origin_offset
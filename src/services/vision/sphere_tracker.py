@@ -0,0 +1,202 @@
+"""
+Seguimiento de esferas con filtro de Kalman y búsqueda por ventanas.
+
+Entre frames procesados las esferas apenas se mueven, así que no hace falta
+segmentar el frame completo en cada uno. `SphereTracker` mantiene por color
+un filtro de Kalman de velocidad constante sobre el centro en imagen
+(estado [x, y, vx, vy]) y, para cada frame a procesar, decide:
+
+    - Búsqueda completa (ventanas None) si no hay tracks, si algún track se
+      perdió en la última búsqueda por ventanas o cada `refresh_frames`
+      frames, para descubrir esferas nuevas.
+    - En otro caso, una ventana por track centrada en la posición
+      predicha, de tamaño proporcional al radio y a la incertidumbre.
+
+Las detecciones corrigen los filtros y los centros entregados a
+`PoseEstimation` se sustituyen por los filtrados (el medido queda en
+`raw_center`).
+
+Conexiones:
+    - `CameraWorker` pide el plan con `plan` al despachar
+      `CircleDetection` y aplica `update` al recibir sus resultados.
+"""
+
+import threading
+import numpy as np
+
+
+class _Track:
+    """
+    Filtro de Kalman de velocidad constante para el centro de una esfera.
+
+    Args:
+        center (tuple): Primera medición (x, y) en pixeles.
+        radius (float): Radio medido en pixeles.
+        timestamp (float): Instante de la medición en segundos.
+        accel_std (float): Desviación de la aceleración (px/s²).
+        measurement_std (float): Desviación de la medición (px).
+    """
+
+    _H = np.array([[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]])
+
+    def __init__(self, center, radius: float, timestamp: float,
+                 accel_std: float, measurement_std: float):
+        self.x = np.array([center[0], center[1], 0.0, 0.0])
+        self.P = np.diag([measurement_std ** 2] * 2 + [200.0 ** 2] * 2)
+        self.radius = float(radius)
+        self.timestamp = timestamp
+        self._q = accel_std ** 2
+        self._R = np.eye(2) * measurement_std ** 2
+
+    def _transition(self, dt: float):
+        """Matrices F y Q del modelo de aceleración blanca para `dt`."""
+        F = np.eye(4)
+        F[0, 2] = F[1, 3] = dt
+        G = np.array([dt * dt / 2.0, dt])
+        block = np.outer(G, G) * self._q
+        Q = np.zeros((4, 4))
+        Q[np.ix_([0, 2], [0, 2])] = block
+        Q[np.ix_([1, 3], [1, 3])] = block
+        return F, Q
+
+    def predicted(self, timestamp: float):
+        """
+        Predice el estado en `timestamp` sin modificar el filtro.
+
+        Returns:
+            tuple: (estado (4,), covarianza (4, 4)).
+        """
+        F, Q = self._transition(max(timestamp - self.timestamp, 0.0))
+        return F @ self.x, F @ self.P @ F.T + Q
+
+    def correct(self, center, timestamp: float):
+        """
+        Avanza el filtro hasta `timestamp` y lo corrige con una medición.
+
+        Args:
+            center (tuple): Centro medido (x, y) en pixeles.
+            timestamp (float): Instante de la medición en segundos.
+        """
+        x, P = self.predicted(timestamp)
+        innovation = np.asarray(center, dtype=float) - self._H @ x
+        S = self._H @ P @ self._H.T + self._R
+        K = P @ self._H.T @ np.linalg.inv(S)
+        self.x = x + K @ innovation
+        self.P = (np.eye(4) - K @ self._H) @ P
+        self.timestamp = timestamp
+
+
+class SphereTracker:
+    """
+    Tracks de esferas por color y plan de búsqueda de cada frame.
+
+    Seguro entre hilos: `plan` se llama desde el hilo de captura y `update`
+    desde los callbacks del QThreadPool.
+
+    Args:
+        refresh_frames (int): Frames procesados entre búsquedas completas.
+        window_scale (float): Semiancho de la ventana en radios.
+        min_window (int): Semiancho mínimo de la ventana en pixeles.
+        accel_std (float): Desviación de la aceleración en imagen (px/s²).
+        measurement_std (float): Desviación del centro medido (px).
+    """
+
+    def __init__(self, refresh_frames: int = 10, window_scale: float = 2.5,
+                 min_window: int = 32, accel_std: float = 500.0,
+                 measurement_std: float = 1.5):
+        self.refresh_frames = int(refresh_frames)
+        self.window_scale = float(window_scale)
+        self.min_window = int(min_window)
+        self._accel_std = float(accel_std)
+        self._measurement_std = float(measurement_std)
+        self._lock = threading.Lock()
+        self._tracks = {}
+        self._plans = {}
+        self._lost = False
+        self._since_full = 0
+
+    def reset(self):
+        """Descarta todos los tracks; la siguiente búsqueda será completa."""
+        with self._lock:
+            self._tracks.clear()
+            self._plans.clear()
+            self._lost = False
+            self._since_full = 0
+
+    def plan(self, frame_id: int, timestamp: float):
+        """
+        Decide la búsqueda para un frame y la registra para `update`.
+
+        Args:
+            frame_id (int): Identificador del frame a procesar.
+            timestamp (float): Instante de captura en segundos.
+
+        Returns:
+            dict | None: {color: (x0, y0, x1, y1)} con las ventanas de
+            búsqueda (sin recortar al frame), o None para buscar en el
+            frame completo.
+        """
+        with self._lock:
+            windows = None
+            if self._tracks and not self._lost and self._since_full < self.refresh_frames:
+                self._since_full += 1
+                windows = {}
+                for color, track in self._tracks.items():
+                    state, covariance = track.predicted(timestamp)
+                    sigma = float(np.sqrt(max(covariance[0, 0], covariance[1, 1])))
+                    half = max(self.min_window, self.window_scale * track.radius) + 3.0 * sigma
+                    cx, cy = state[:2]
+                    windows[color] = (cx - half, cy - half, cx + half, cy + half)
+            else:
+                self._since_full = 0
+            self._plans[frame_id] = (timestamp, windows)
+            # Solo se conservan los planes de frames recientes
+            for stale in [fid for fid in self._plans if fid < frame_id - 8]:
+                del self._plans[stale]
+            return windows
+
+    def update(self, frame_id: int, data):
+        """
+        Corrige los tracks con las esferas detectadas en un frame.
+
+        En una búsqueda completa, los colores no detectados se descartan;
+        en una por ventanas, un track no encontrado fuerza una búsqueda
+        completa en el siguiente frame.
+
+        Args:
+            frame_id (int): Frame al que pertenecen las detecciones.
+            data (dict | None): Resultado de `CircleDetection`; se modifica
+                en el sitio con los centros filtrados.
+
+        Returns:
+            dict | None: El mismo `data`.
+        """
+        with self._lock:
+            plan = self._plans.pop(frame_id, None)
+            if plan is None:
+                return data
+            timestamp, windows = plan
+            detections = data or {}
+
+            for color, sphere in detections.items():
+                center = sphere.get("center")
+                if center is None:
+                    continue
+                track = self._tracks.get(color)
+                if track is None:
+                    track = self._tracks[color] = _Track(
+                        center, sphere.get("radius", 0.0), timestamp,
+                        self._accel_std, self._measurement_std)
+                elif timestamp > track.timestamp:
+                    track.correct(center, timestamp)
+                    track.radius = float(sphere.get("radius", track.radius))
+                sphere["raw_center"] = center
+                sphere["center"] = (float(track.x[0]), float(track.x[1]))
+
+            if windows is None:
+                for color in [c for c in self._tracks if c not in detections]:
+                    del self._tracks[color]
+                self._lost = False
+            elif any(color not in detections for color in windows):
+                self._lost = True
+            return data